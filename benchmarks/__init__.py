@@ -0,0 +1 @@
+"""性能基准脚本，在仓库根目录下通过 ``python -m benchmarks.<名称>`` 运行"""
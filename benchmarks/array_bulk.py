@@ -0,0 +1,103 @@
+"""数组批量操作基准：逐元素循环搬移 vs 切片搬移 vs 批量接口
+
+对 10^3 ~ 10^7 规模的列表执行 k 次插入 / 删除以及一次扩容，比较：
+  - loop：原先逐个元素搬移的实现
+  - slice：单次 insert / remove（切片 / memmove 搬移）调用 k 次
+  - batch：insert_many / remove_many 一次完成
+
+    python -m benchmarks.array_bulk --max-exp 7 --edits 8
+"""
+
+import argparse
+import random
+
+from benchmarks.harness import best_of
+from codes import array_ops
+from codes.array_util import SILENT, set_mode
+
+
+def loop_insert(nums: list[int], num: int, index: int) -> None:
+    """原实现：逐个元素向后搬移"""
+    for i in range(len(nums) - 1, index, -1):
+        nums[i] = nums[i - 1]
+    nums[index] = num
+
+
+def loop_remove(nums: list[int], index: int) -> None:
+    """原实现：逐个元素向前搬移"""
+    for i in range(index, len(nums) - 1):
+        nums[i] = nums[i + 1]
+    del nums[-1]
+
+
+def loop_extend(nums: list[int], enlarge: int) -> list[int]:
+    """原实现：逐个元素复制"""
+    res = [0] * (len(nums) + enlarge)
+    for i in range(len(nums)):
+        res[i] = nums[i]
+    return res
+
+
+def bench_size(n: int, edits: int, repeat: int) -> dict[str, float]:
+    base = list(range(n))
+    indices = [random.randrange(n // 2) for _ in range(edits)]
+    values = [-1] * edits
+    res = {}
+
+    def timed(func, *args) -> float:
+        """重复执行，返回最短耗时（毫秒）
+
+        插入 / 删除原地修改的是同一个副本：插入不改变长度，删除每次只少 edits 个元素，
+        重复执行的工作量相同，复制数组不计入耗时
+        """
+        return best_of(lambda: func(*args), repeat)[0] * 1e3
+
+    def insert_loop(nums):
+        for i in indices:
+            loop_insert(nums, -1, i)
+
+    def insert_slice(nums):
+        for i in indices:
+            array_ops.insert(nums, -1, i)
+
+    def remove_loop(nums):
+        for i in sorted(set(indices), reverse=True):
+            loop_remove(nums, i)
+
+    def remove_slice(nums):
+        for i in sorted(set(indices), reverse=True):
+            array_ops.remove(nums, i)
+
+    res["insert_loop"] = timed(insert_loop, base[:])
+    res["insert_slice"] = timed(insert_slice, base[:])
+    res["insert_batch"] = timed(array_ops.insert_many, base[:], values, indices)
+    res["remove_loop"] = timed(remove_loop, base[:])
+    res["remove_slice"] = timed(remove_slice, base[:])
+    res["remove_batch"] = timed(array_ops.remove_many, base[:], indices)
+    res["extend_loop"] = timed(loop_extend, base, n // 10)
+    res["extend_slice"] = timed(array_ops.extend, base, n // 10)
+    return res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-exp", type=int, default=7, help="最大规模 10^max_exp")
+    parser.add_argument("--edits", type=int, default=8, help="每轮插入 / 删除的次数")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最小值")
+    args = parser.parse_args()
+
+    # 静默模式下 log_operation 不会打印百万级别的结果
+    set_mode(SILENT)
+    print(f"{'n':>10} {'操作':>8} {'loop(ms)':>12} {'slice(ms)':>12} {'batch(ms)':>12} {'加速比':>8}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        r = bench_size(n, args.edits, args.repeat)
+        for op in ("insert", "remove"):
+            loop, sliced, batch = r[f"{op}_loop"], r[f"{op}_slice"], r[f"{op}_batch"]
+            print(f"{n:>10} {op:>8} {loop:>12.3f} {sliced:>12.3f} {batch:>12.3f} {loop / batch:>8.1f}x")
+        loop, sliced = r["extend_loop"], r["extend_slice"]
+        print(f"{n:>10} {'extend':>8} {loop:>12.3f} {sliced:>12.3f} {'-':>12} {loop / sliced:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
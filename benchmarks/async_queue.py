@@ -0,0 +1,71 @@
+"""异步队列基准：10k 个并发生产者下的吞吐量与延迟
+
+producers 个协程各入队 items 个元素（元素即入队时刻），consumers 个协程出队，
+分别使用 AsyncQueue.get、AsyncQueue.get_batch 与 asyncio.Queue.get。
+延迟为从调用 put 到消费者拿到元素的时间，包含队列满时的背压等待。
+
+    python -m benchmarks.async_queue --producers 10000 --items 10 --capacity 1024
+"""
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from codes.async_queue import AsyncQueue
+
+
+async def run(make, producers: int, items: int, consumers: int, batch: int | None) -> tuple[float, list[float]]:
+    """返回（每秒出队元素数，各元素延迟）"""
+    queue = make()
+    total = producers * items
+    latencies: list[float] = []
+
+    async def producer():
+        for _ in range(items):
+            await queue.put(perf_counter())
+
+    async def consumer():
+        while len(latencies) < total:
+            if batch is None:
+                received = [await queue.get()]
+            else:
+                received = await queue.get_batch(batch, timeout=0.001)
+            now = perf_counter()
+            latencies.extend(now - t for t in received)
+
+    workers = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    start = perf_counter()
+    await asyncio.gather(*(producer() for _ in range(producers)))
+    while len(latencies) < total:
+        await asyncio.sleep(0.001)
+    elapsed = perf_counter() - start
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return total / elapsed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--producers", type=int, default=10_000, help="并发生产者个数")
+    parser.add_argument("--items", type=int, default=10, help="每个生产者入队的元素个数")
+    parser.add_argument("--consumers", type=int, default=4, help="消费者个数")
+    parser.add_argument("--capacity", type=int, default=1024, help="队列容量")
+    parser.add_argument("--batch", type=int, default=256, help="get_batch 的 max_items")
+    args = parser.parse_args()
+
+    candidates = [
+        ("AsyncQueue.get", lambda: AsyncQueue(args.capacity), None),
+        (f"AsyncQueue.get_batch({args.batch})", lambda: AsyncQueue(args.capacity), args.batch),
+        ("asyncio.Queue.get", lambda: asyncio.Queue(args.capacity), None),
+    ]
+    print(f"{'实现':<28} {'kops/s':>10} {'p50(ms)':>10} {'p99(ms)':>10}")
+    for name, make, batch in candidates:
+        throughput, latencies = asyncio.run(run(make, args.producers, args.items, args.consumers, batch))
+        cuts = quantiles(latencies, n=100)
+        print(f"{name:<28} {throughput / 1e3:>10.1f} {cuts[49] * 1e3:>10.2f} {cuts[98] * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
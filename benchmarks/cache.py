@@ -0,0 +1,57 @@
+"""缓存基准：LRUCache / LFUCache vs functools.lru_cache
+
+按 Zipf 分布生成键的访问序列（少数热点键占大部分访问），未命中时调用一个空函数。
+报告命中率与每秒 get+put 次数。
+
+    python -m benchmarks.cache --ops 1000000 --keys 100000 --maxsize 10000
+"""
+
+import argparse
+import functools
+import random
+from time import perf_counter
+
+from codes.cache import LFUCache, LRUCache, memoize
+
+
+def zipf_keys(ops: int, keys: int, s: float, seed: int = 0) -> list[int]:
+    """按 Zipf(s) 分布采样 ops 个键"""
+    rng = random.Random(seed)
+    weights = [1 / (rank**s) for rank in range(1, keys + 1)]
+    return rng.choices(range(keys), weights=weights, k=ops)
+
+
+def run(lookup, trace: list[int]) -> float:
+    start = perf_counter()
+    for key in trace:
+        lookup(key)
+    return len(trace) / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=1_000_000, help="访问次数")
+    parser.add_argument("--keys", type=int, default=100_000, help="不同键的个数")
+    parser.add_argument("--maxsize", type=int, default=10_000, help="缓存容量")
+    parser.add_argument("--skew", type=float, default=1.0, help="Zipf 分布参数")
+    args = parser.parse_args()
+
+    trace = zipf_keys(args.ops, args.keys, args.skew)
+    print(f"{'实现':<24} {'命中率':>8} {'kops/s':>10}")
+
+    def load(key):
+        return key
+
+    stdlib = functools.lru_cache(maxsize=args.maxsize)(load)
+    throughput = run(stdlib, trace)
+    info = stdlib.cache_info()
+    print(f"{'functools.lru_cache':<24} {info.hits / args.ops:>8.1%} {throughput / 1e3:>10.1f}")
+
+    for name, cache in (("LRUCache", LRUCache(args.maxsize)), ("LFUCache", LFUCache(args.maxsize))):
+        memoized = memoize(cache)(load)
+        throughput = run(memoized, trace)
+        print(f"{name:<24} {cache.hits / args.ops:>8.1%} {throughput / 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""双向队列与滑动窗口基准：ArrayDeque（固定容量 / 可扩容）vs collections.deque，SlidingWindow vs 逐次重算
+
+两部分：
+- 双向队列：交替在队首、队尾突发入队 n 个元素，再从两端交替全部出队；可扩容模式从容量 16 起步，
+  经历多次扩容与缩容，固定容量的 ArrayDeque 需预先按峰值分配；
+- 滑动窗口：对 n 个随机值维护大小为 window 的窗口，每次入队后读取和、最小值与最大值。
+  对照组用 collections.deque(maxlen=window)，每次对整个窗口调用 sum / min / max，耗时与窗口大小成正比。
+  SlidingWindow 每次入队的开销固定，窗口约 8～16 以内时逐次重算更快，更大的窗口 SlidingWindow 领先。
+
+    python -m benchmarks.deque_window --n 1000000 --window 16 256 4096
+"""
+
+import argparse
+import random
+from collections import deque
+from time import perf_counter
+
+from codes.array_deque import ArrayDeque
+from codes.sliding_window import SlidingWindow
+
+
+def burst(push_first, push_last, pop_first, pop_last, n: int) -> float:
+    """返回每秒入队 + 出队次数"""
+    start = perf_counter()
+    for i in range(n // 2):
+        push_first(i)
+        push_last(i)
+    for _ in range(n // 2):
+        pop_first()
+        pop_last()
+    return 2 * n / (perf_counter() - start)
+
+
+def rolling_window(values: list[float], size: int) -> float:
+    """返回每秒处理的值个数"""
+    window = SlidingWindow(size)
+    push, total, low, high = window.push, window.sum, window.min, window.max
+    start = perf_counter()
+    for x in values:
+        push(x)
+        total(), low(), high()
+    return len(values) / (perf_counter() - start)
+
+
+def rolling_naive(values: list[float], size: int) -> float:
+    window: deque = deque(maxlen=size)
+    push = window.append
+    start = perf_counter()
+    for x in values:
+        push(x)
+        sum(window), min(window), max(window)
+    return len(values) / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="入队元素个数")
+    parser.add_argument("--window", type=int, nargs="+", default=[16, 256, 4096], help="滑动窗口大小")
+    args = parser.parse_args()
+
+    candidates = [
+        ("ArrayDeque(固定容量)", lambda: ArrayDeque(args.n)),
+        ("ArrayDeque(可扩容)", lambda: ArrayDeque(16, growable=True)),
+    ]
+    print(f"{'实现':<22} {'突发 Mops/s':>12}")
+    for name, make in candidates:
+        d = make()
+        rate = burst(d.push_first, d.push_last, d.pop_first, d.pop_last, args.n)
+        print(f"{name:<22} {rate / 1e6:>12.2f}")
+    d = deque()
+    rate = burst(d.appendleft, d.append, d.popleft, d.pop, args.n)
+    print(f"{'collections.deque':<22} {rate / 1e6:>12.2f}")
+
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(args.n)]
+    print()
+    print(f"{'窗口大小':>8} {'SlidingWindow Mops/s':>22} {'逐次重算 Mops/s':>16}")
+    for size in args.window:
+        fast = rolling_window(values, size)
+        # 逐次重算在大窗口下很慢，只取前一部分值
+        naive = rolling_naive(values[: max(args.n * 16 // size, size * 4)], size)
+        print(f"{size:>8} {fast / 1e6:>22.2f} {naive / 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
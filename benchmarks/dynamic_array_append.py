@@ -0,0 +1,66 @@
+"""动态数组尾部添加基准：倍数扩容 vs 每次 extend 复制
+
+逐个添加 n 个元素，统计每次添加的平均耗时与扩容次数。
+倍数扩容的单次耗时不随 n 增长（均摊 O(1)），而每次调用 extend(nums, 1)
+都要复制整个数组，总耗时为 O(n^2)，因此只在较小规模上运行。
+
+    python -m benchmarks.dynamic_array_append --max-exp 6
+"""
+
+import argparse
+from time import perf_counter
+
+from codes import array_ops
+from codes.array_util import SILENT, set_mode
+from codes.dynamic_array import DynamicArray
+
+
+def bench_dynamic(n: int, extend_ratio: float) -> tuple[float, int]:
+    """返回 (每次添加的平均耗时 ns, 扩容次数)"""
+    nums = DynamicArray(capacity=1, extend_ratio=extend_ratio)
+    append = nums.append
+    start = perf_counter()
+    for i in range(n):
+        append(i)
+    elapsed = perf_counter() - start
+    # 扩容次数由容量序列推算，不放在计时循环里
+    resizes, cap = 0, 1
+    while cap < nums.capacity():
+        cap = max(cap + 1, int(cap * extend_ratio))
+        resizes += 1
+    return elapsed / n * 1e9, resizes
+
+
+def bench_extend_copy(n: int) -> float:
+    """每次添加都调用 extend(nums, 1) 复制整个数组，返回每次添加的平均耗时 ns"""
+    extend = array_ops.extend
+    nums: list[int] = []
+    start = perf_counter()
+    for i in range(n):
+        nums = extend(nums, 1)
+        nums[-1] = i
+    return (perf_counter() - start) / n * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-exp", type=int, default=6, help="最大规模 10^max_exp")
+    parser.add_argument("--max-copy-exp", type=int, default=4, help="extend 复制方式的最大规模")
+    parser.add_argument("--ratios", type=float, nargs="+", default=[1.5, 2.0], help="扩容倍数")
+    args = parser.parse_args()
+
+    set_mode(SILENT)
+    header = f"{'n':>10}" + "".join(f" {f'x{r}(ns/op)':>14} {'扩容次数':>8}" for r in args.ratios)
+    print(header + f" {'extend复制(ns/op)':>18}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        row = f"{n:>10}"
+        for ratio in args.ratios:
+            per_op, resizes = bench_dynamic(n, ratio)
+            row += f" {per_op:>14.1f} {resizes:>8}"
+        copy_cost = f"{bench_extend_copy(n):>18.1f}" if exp <= args.max_copy_exp else f"{'-':>18}"
+        print(row + " " + copy_cost)
+
+
+if __name__ == "__main__":
+    main()
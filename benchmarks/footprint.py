@@ -0,0 +1,197 @@
+"""节点型数据结构的内存占用分析
+
+对每种结构在给定规模下报告每个元素占用的字节数，两种口径：
+  - tracemalloc：构建过程中实际新增的内存（真实值）
+  - getsizeof：从结构对象出发，沿引用递归累加 sys.getsizeof（估算值；Python 3.11 起
+    普通实例的属性内联存储，getsizeof 不计入这部分，因此 dict 版本会被低估）
+并把节点类（Node / ListNode / TreeNode / Pair）临时替换为等价的 __slots__ 版本，
+与原版并排比较。元素值在计时外预先生成，不计入结果，数组型结构作为对照。
+
+    python -m benchmarks.footprint --size 100000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from types import FunctionType, ModuleType
+
+from codes import (
+    array_deque,
+    array_stack,
+    avl_tree,
+    binary_tree,
+    hash_map_chaining,
+    hash_map_open_addressing,
+    linked_deque,
+    linked_list,
+    linked_queue,
+    linked_stack,
+)
+
+
+def slotted(cls: type, fields: tuple[str, ...]) -> type:
+    """生成与 cls 行为相同、但使用 __slots__ 存储字段的类（cls 已是 slots 类时原样返回）"""
+    if "__slots__" in vars(cls):
+        return cls
+    namespace = {k: v for k, v in vars(cls).items() if k not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = fields
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+@contextmanager
+def substituted(module: ModuleType, name: str, replacement):
+    """临时替换模块中的全局名称（结构在运行时按名称查找节点类）"""
+    original = getattr(module, name)
+    setattr(module, name, replacement)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+def deep_sizeof(root, exclude: set[int]) -> int:
+    """沿 gc 引用递归累加 sys.getsizeof，跳过类型、模块、函数以及 exclude 中的对象"""
+    seen = set(exclude)
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+def build_linked_list(keys):
+    lst = linked_list.LinkedList()
+    lst.extend(keys)
+    return lst
+
+
+def build_linked_stack(keys):
+    stack = linked_stack.Stack()
+    for key in keys:
+        stack.push(key)
+    return stack
+
+
+def build_array_stack(keys):
+    stack = array_stack.Stack()
+    for key in keys:
+        stack.push(key)
+    return stack
+
+
+def build_linked_queue(keys):
+    queue = linked_queue.Queue()
+    for key in keys:
+        queue.enqueue(key)
+    return queue
+
+
+def build_linked_deque(keys):
+    deque = linked_deque.LinkedListDeque()
+    for key in keys:
+        deque.push_last(key)
+    return deque
+
+
+def build_array_deque(keys):
+    deque = array_deque.ArrayDeque(len(keys))
+    for key in keys:
+        deque.push_last(key)
+    return deque
+
+
+def build_tree(tree_cls):
+    def build(keys):
+        tree = tree_cls()
+        for key in keys:
+            tree.insert(key)
+        return tree
+
+    return build
+
+
+def build_hash_map(map_cls):
+    def build(keys):
+        hashmap = map_cls()
+        for key in keys:
+            hashmap.put(key, "v")
+        return hashmap
+
+    return build
+
+
+# (名称, 构建函数, 节点所在模块, 节点类名, 节点字段)；数组型结构没有节点类
+STRUCTURES = [
+    ("LinkedList", build_linked_list, linked_list, "Node", ("data", "next")),
+    ("Stack(链表)", build_linked_stack, linked_stack, "Node", ("data", "next")),
+    ("Stack(数组)", build_array_stack, None, None, ()),
+    ("Queue(链表)", build_linked_queue, linked_queue, "Node", ("data", "next")),
+    ("LinkedListDeque", build_linked_deque, linked_deque, "ListNode", ("val", "next", "prev")),
+    ("ArrayDeque", build_array_deque, None, None, ()),
+    ("BinaryTree", build_tree(binary_tree.BinaryTree), binary_tree, "TreeNode", ("val", "left", "right")),
+    ("AVLTree", build_tree(avl_tree.AVLTree), avl_tree, "TreeNode", ("val", "left", "right", "height")),
+    (
+        "HashMapOpenAddressing",
+        build_hash_map(hash_map_open_addressing.HashMapOpenAddressing),
+        hash_map_open_addressing,
+        "Pair",
+        ("key", "val"),
+    ),
+    ("HashMapChaining", build_hash_map(hash_map_chaining.HashMapChaining), hash_map_chaining, "Pair", ("key", "val")),
+]
+
+
+def measure(build, keys) -> tuple[float, float]:
+    """返回 (tracemalloc 每元素字节数, getsizeof 递归每元素字节数)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(keys)
+        traced = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    walked = deep_sizeof(structure, {id(key) for key in keys} | {id("v")})
+    return traced / len(keys), walked / len(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="元素个数")
+    args = parser.parse_args()
+
+    keys = list(range(args.size))
+    random.Random(0).shuffle(keys)
+    # 树的递归插入深度与树高相同，打乱后的键使树高保持在 O(log n)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    print(f"规模 {args.size}，单位：字节/元素")
+    print(
+        f"{'结构':<24} {'节点类':<10} {'dict(trace)':>12} {'dict(walk)':>11} "
+        f"{'slots(trace)':>13} {'slots(walk)':>12} {'节省':>7}"
+    )
+    for name, build, module, node_name, fields in STRUCTURES:
+        traced, walked = measure(build, keys)
+        if module is None:
+            print(f"{name:<24} {'-':<10} {traced:>12.1f} {walked:>11.1f} {'-':>13} {'-':>12} {'-':>7}")
+            continue
+        node_cls = getattr(module, node_name)
+        with substituted(module, node_name, slotted(node_cls, fields)):
+            s_traced, s_walked = measure(build, keys)
+        saving = 1 - s_traced / traced if traced else 0.0
+        print(
+            f"{name:<24} {node_name:<10} {traced:>12.1f} {walked:>11.1f} "
+            f"{s_traced:>13.1f} {s_walked:>12.1f} {saving:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
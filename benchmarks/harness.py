@@ -0,0 +1,149 @@
+"""基准测试工具：计时、峰值内存统计、JSON 结果保存与回归比较"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from timeit import default_timer
+from typing import Any, Callable
+
+
+@dataclass
+class Workload:
+    """一个基准负载
+
+    setup(size) 构造初始状态（不计时），run(state) 执行 ops(size) 次操作（计时），
+    ops 缺省时即为 size
+    """
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    ops: Callable[[int], int] | None = None
+
+
+@dataclass
+class Result:
+    """单个负载在某一规模下的结果"""
+
+    name: str
+    size: int
+    ops: int
+    best_s: float  # 多次重复中的最短耗时（秒）
+    ops_per_sec: float
+    peak_bytes: int  # setup + run 过程中 tracemalloc 记录的峰值内存
+    samples_s: list[float] = field(default_factory=list)
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> tuple[float, Any]:
+    """重复执行 func()，返回（最短耗时（秒），最后一次的返回值）；计时期间关闭 GC 以减少抖动"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = default_timer()
+            result = func()
+            best = min(best, default_timer() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return best, result
+
+
+def peak_bytes(func: Callable[[], Any]) -> int:
+    """执行一次 func()，返回期间 tracemalloc 记录的峰值内存（字节，不含执行前已分配的内存）"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def measure(workload: Workload, size: int, repeat: int = 5) -> Result:
+    """测量一个负载：每次重复都重新 setup，计时期间关闭 GC 以减少抖动"""
+    ops = workload.ops(size) if workload.ops else size
+    samples = []
+    for _ in range(repeat):
+        state = workload.setup(size)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = default_timer()
+            workload.run(state)
+            samples.append(default_timer() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        del state
+
+    # 峰值内存单独测一次，避免 tracemalloc 的开销混入计时
+    peak = peak_bytes(lambda: workload.run(workload.setup(size)))
+
+    best = min(samples)
+    return Result(
+        name=workload.name,
+        size=size,
+        ops=ops,
+        best_s=best,
+        ops_per_sec=ops / best if best > 0 else float("inf"),
+        peak_bytes=peak,
+        samples_s=samples,
+    )
+
+
+def environment() -> dict:
+    """记录运行环境，便于比较不同机器上的结果"""
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(results: list[Result], path: str) -> None:
+    """把结果与运行环境写入 JSON 文件"""
+    data = {"environment": environment(), "results": [asdict(r) for r in results]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load(path: str) -> list[Result]:
+    """读取 save 写出的 JSON 结果"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [Result(**r) for r in data["results"]]
+
+
+def compare(baseline: list[Result], current: list[Result], threshold: float) -> list[str]:
+    """比较两次运行，返回吞吐量下降或峰值内存上升超过 threshold（相对比例）的条目描述"""
+    base = {(r.name, r.size): r for r in baseline}
+    regressions = []
+    for r in current:
+        old = base.get((r.name, r.size))
+        if old is None:
+            continue
+        speed = r.ops_per_sec / old.ops_per_sec - 1
+        memory = r.peak_bytes / old.peak_bytes - 1 if old.peak_bytes else 0.0
+        if speed < -threshold:
+            regressions.append(f"{r.name}[{r.size}] 吞吐量 {speed:+.1%}")
+        if memory > threshold:
+            regressions.append(f"{r.name}[{r.size}] 峰值内存 {memory:+.1%}")
+    return regressions
+
+
+def format_table(results: list[Result]) -> str:
+    """把结果格式化为文本表格"""
+    lines = [f"{'负载':<36} {'规模':>9} {'ops/s':>14} {'峰值内存(KiB)':>14}"]
+    for r in results:
+        lines.append(f"{r.name:<36} {r.size:>9} {r.ops_per_sec:>14,.0f} {r.peak_bytes / 1024:>14,.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,64 @@
+"""冷启动导入耗时基准
+
+在全新的解释器进程中导入 ``codes`` 包下的全部数据结构模块，
+取多次运行的最小值与预算比较；超出预算或导入时产生了输出则以非零状态退出。
+
+    python -m benchmarks.import_time --budget-ms 100
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 子进程中执行的脚本：统计导入 codes 包及全部数据结构模块的耗时
+PROBE = """
+import sys
+from time import perf_counter_ns
+start = perf_counter_ns()
+import codes
+for name in codes.__all__:
+    __import__("codes." + name)
+elapsed = perf_counter_ns() - start
+sys.stderr.write(str(elapsed))
+"""
+
+
+def measure_once() -> tuple[int, str]:
+    """启动一个新进程导入全部模块，返回 (耗时纳秒, 标准输出)"""
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(proc.stderr.strip().splitlines()[-1]), proc.stdout
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="导入耗时预算（毫秒）")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数，取最小值")
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        elapsed, stdout = measure_once()
+        if stdout:
+            print(f"导入时产生了输出：\n{stdout}")
+            return 1
+        timings.append(elapsed)
+
+    best_ms = min(timings) / 1e6
+    print(f"导入全部模块耗时：{best_ms:.2f} ms（预算 {args.budget_ms:.2f} ms，{args.repeat} 次取最小）")
+    if best_ms > args.budget_ms:
+        print("超出导入耗时预算")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""哈希索引链表基准：LinkedList vs IndexedLinkedList 的内存开销与按值删除吞吐量
+
+内存开销通过 tracemalloc 统计构建 n 个元素时的峰值分配，折算为每个元素的字节数；
+按值删除以随机顺序删除全部元素。LinkedList.delete 为 O(n) 扫描（总耗时 O(n^2)），
+只在较小规模上运行。
+
+    python -m benchmarks.indexed_linked_list --max-exp 6
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from benchmarks.harness import peak_bytes
+from codes.indexed_linked_list import IndexedLinkedList
+from codes.linked_list import LinkedList
+
+
+def bytes_per_item(list_cls, keys: list) -> float:
+    """构建链表期间的峰值分配（不含 keys 本身）除以元素个数"""
+    return peak_bytes(lambda: list_cls().extend(keys)) / len(keys)
+
+
+def delete_ops(list_cls, keys: list) -> float:
+    """按随机顺序逐个删除全部元素，返回每秒删除次数"""
+    lst = list_cls()
+    lst.extend(keys)
+    order = keys[:]
+    random.shuffle(order)
+    delete = lst.delete
+    start = perf_counter()
+    for key in order:
+        delete(key)
+    return len(keys) / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-exp", type=int, default=6, help="最大规模 10^max_exp")
+    parser.add_argument("--max-scan-exp", type=int, default=4, help="LinkedList 删除的最大规模")
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'链表(B/项)':>11} {'索引链表(B/项)':>15} {'链表删除(kops/s)':>17} {'索引链表删除(kops/s)':>21}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        keys = [f"key-{i}" for i in range(n)]
+        plain = bytes_per_item(LinkedList, keys)
+        indexed = bytes_per_item(IndexedLinkedList, keys)
+        scan = f"{delete_ops(LinkedList, keys) / 1e3:>17.1f}" if exp <= args.max_scan_exp else f"{'-':>17}"
+        print(f"{n:>10} {plain:>11.1f} {indexed:>15.1f} {scan} {delete_ops(IndexedLinkedList, keys) / 1e3:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""链表构建基准：尾指针 O(1) 插入 vs 每次从头遍历到尾部
+
+逐个插入 n 个元素，报告每次插入的平均耗时。带尾指针的 insert / extend 单次耗时
+不随 n 增长（总耗时线性），原先从头遍历的实现总耗时为 O(n^2)，只在较小规模上运行。
+
+    python -m benchmarks.linked_list_build --max-exp 6
+"""
+
+import argparse
+from time import perf_counter
+
+from codes.linked_list import LinkedList, Node
+
+
+def walk_insert(lst: LinkedList, data) -> None:
+    """原实现：从头节点遍历到尾部再插入"""
+    if not lst.head:
+        lst.head = Node(data)
+    else:
+        cur = lst.head
+        while cur.next:
+            cur = cur.next
+        cur.next = Node(data)
+
+
+def per_op_ns(build, n: int) -> float:
+    start = perf_counter()
+    build(n)
+    return (perf_counter() - start) / n * 1e9
+
+
+def build_insert(n: int) -> None:
+    lst = LinkedList()
+    insert = lst.insert
+    for i in range(n):
+        insert(i)
+
+
+def build_extend(n: int) -> None:
+    LinkedList().extend(range(n))
+
+
+def build_walk(n: int) -> None:
+    lst = LinkedList()
+    for i in range(n):
+        walk_insert(lst, i)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-exp", type=int, default=6, help="最大规模 10^max_exp")
+    parser.add_argument("--max-walk-exp", type=int, default=4, help="遍历插入方式的最大规模")
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'insert(ns/op)':>14} {'extend(ns/op)':>14} {'遍历插入(ns/op)':>16}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        walk = f"{per_op_ns(build_walk, n):>16.1f}" if exp <= args.max_walk_exp else f"{'-':>16}"
+        print(f"{n:>10} {per_op_ns(build_insert, n):>14.1f} {per_op_ns(build_extend, n):>14.1f} {walk}")
+
+
+if __name__ == "__main__":
+    main()
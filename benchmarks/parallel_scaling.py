@@ -0,0 +1,57 @@
+"""并行归约扩展性基准：1 ~ N 个工作进程下的 traverse 与 find
+
+数组在计时前已放入共享内存（ParallelArray 构造），只统计归约本身的耗时；
+find 分别查找位于数组前 1/8 处的目标（可提前取消后续分块）和不存在的目标（需扫描全部）。
+
+    python -m benchmarks.parallel_scaling --size 20000000 --max-workers 32
+"""
+
+import argparse
+import os
+from array import array
+
+from benchmarks.harness import best_of
+from codes.parallel_array import ParallelArray
+
+
+def best_ms(func, repeat: int) -> float:
+    """重复执行取最小耗时（毫秒）"""
+    return best_of(func, repeat)[0] * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000_000, help="数组长度")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="最大工作进程数")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最小值")
+    args = parser.parse_args()
+
+    nums = array("q", range(args.size))
+    early = args.size // 8
+
+    serial_sum = best_ms(lambda: sum(nums), args.repeat)
+    serial_find = best_ms(lambda: nums.index(args.size - 1), args.repeat)
+    print(f"单进程基线：sum {serial_sum:.1f} ms，index {serial_find:.1f} ms")
+
+    workers_list, w = [], 1
+    while w < args.max_workers:
+        workers_list.append(w)
+        w *= 2
+    workers_list.append(args.max_workers)
+
+    print(f"{'进程数':>6} {'traverse(ms)':>14} {'加速比':>8} {'find前部(ms)':>14} {'find缺失(ms)':>14} {'加速比':>8}")
+    for workers in workers_list:
+        with ParallelArray(nums, workers=workers) as arr:
+            # 预热：拉起全部工作进程并挂载共享内存
+            arr.traverse()
+            t_sum = best_ms(arr.traverse, args.repeat)
+            t_early = best_ms(lambda: arr.find(early), args.repeat)
+            t_miss = best_ms(lambda: arr.find(-1), args.repeat)
+        print(
+            f"{workers:>6} {t_sum:>14.1f} {serial_sum / t_sum:>8.2f} "
+            f"{t_early:>14.1f} {t_miss:>14.1f} {serial_find / t_miss:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""优先队列与延迟队列基准：d 叉堆 PriorityQueue vs heapq
+
+三种负载（默认 n = 10^6）：
+- 入队 / 出队：随机优先级入队 n 个元素再全部出队；
+- 降低优先级：入队 n 个元素，随机降低 n 次优先级后全部出队。heapq 不支持 decrease-key，
+  采用常见的“重复入队 + 出队时跳过过期记录”做法；
+- 延迟队列：以模拟时钟安排 n 个随机延迟的定时器，时钟分 1000 步推进并取出到期元素。
+
+    python -m benchmarks.priority_queue --n 1000000 --arity 2 4 8
+"""
+
+import argparse
+import heapq
+import random
+
+from benchmarks.harness import best_of
+from codes.delay_queue import DelayQueue
+from codes.priority_queue import PriorityQueue
+
+
+def push_pop_pq(d: int, priorities: list[float]) -> None:
+    pq = PriorityQueue(d)
+    push, pop = pq.push, pq.pop
+    for i, p in enumerate(priorities):
+        push(i, p)
+    for _ in priorities:
+        pop()
+
+
+def push_pop_heapq(priorities: list[float]) -> None:
+    heap: list = []
+    for i, p in enumerate(priorities):
+        heapq.heappush(heap, (p, i))
+    for _ in priorities:
+        heapq.heappop(heap)
+
+
+def decrease_pq(d: int, priorities: list[float], updates: list[tuple[int, float]]) -> None:
+    pq = PriorityQueue(d)
+    for i, p in enumerate(priorities):
+        pq.push(i, p)
+    current = priorities[:]
+    decrease_key = pq.decrease_key
+    for i, delta in updates:
+        current[i] -= delta
+        decrease_key(i, current[i])
+    while not pq.is_empty():
+        pq.pop()
+
+
+def decrease_heapq(priorities: list[float], updates: list[tuple[int, float]]) -> None:
+    heap = [(p, i) for i, p in enumerate(priorities)]
+    heapq.heapify(heap)
+    current = priorities[:]
+    for i, delta in updates:
+        current[i] -= delta
+        heapq.heappush(heap, (current[i], i))
+    done = set()
+    while heap:
+        p, i = heapq.heappop(heap)
+        # 跳过已被更小优先级取代的过期记录
+        if i in done or p != current[i]:
+            continue
+        done.add(i)
+
+
+def delay_queue(d: int, delays: list[float], steps: int = 1000) -> None:
+    now = [0.0]
+    dq = DelayQueue(d, clock=lambda: now[0])
+    for i, delay in enumerate(delays):
+        dq.push(i, delay)
+    horizon = max(delays)
+    for step in range(1, steps + 1):
+        now[0] = horizon * step / steps
+        dq.pop_due()
+
+
+def delay_heapq(delays: list[float], steps: int = 1000) -> None:
+    heap: list = []
+    for i, delay in enumerate(delays):
+        heapq.heappush(heap, (delay, i))
+    horizon = max(delays)
+    for step in range(1, steps + 1):
+        now = horizon * step / steps
+        while heap and heap[0][0] <= now:
+            heapq.heappop(heap)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="元素个数")
+    parser.add_argument("--arity", type=int, nargs="+", default=[2, 4, 8], help="堆的叉数 d")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最小值")
+    args = parser.parse_args()
+
+    def timed(func) -> float:
+        return best_of(func, args.repeat)[0]
+
+    rng = random.Random(0)
+    priorities = [rng.random() for _ in range(args.n)]
+    updates = [(rng.randrange(args.n), rng.random() * 0.1) for _ in range(args.n)]
+    delays = [rng.uniform(0, 60) for _ in range(args.n)]
+
+    print(f"{'实现':<22} {'入队/出队(s)':>13} {'降低优先级(s)':>14} {'延迟队列(s)':>12}")
+    for d in args.arity:
+        row = (
+            timed(lambda: push_pop_pq(d, priorities)),
+            timed(lambda: decrease_pq(d, priorities, updates)),
+            timed(lambda: delay_queue(d, delays)),
+        )
+        print(f"{f'PriorityQueue(d={d})':<22} {row[0]:>13.2f} {row[1]:>14.2f} {row[2]:>12.2f}")
+    row = (
+        timed(lambda: push_pop_heapq(priorities)),
+        timed(lambda: decrease_heapq(priorities, updates)),
+        timed(lambda: delay_heapq(delays)),
+    )
+    print(f"{'heapq':<22} {row[0]:>13.2f} {row[1]:>14.2f} {row[2]:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""环形队列批量操作基准：逐个 push / pop vs push_many / pop_many
+
+每轮入队一批 batch 个元素再全部出队，队首位置随轮次移动，批次经常跨过数组尾部。
+报告每批的平均耗时。
+
+    python -m benchmarks.queue_batch --batch 10000 --rounds 200
+"""
+
+import argparse
+from time import perf_counter
+
+from codes.array_deque import ArrayDeque
+from codes.array_queue import ArrayQueue
+
+
+def per_batch_us(push_batch, pop_batch, batch: int, rounds: int) -> float:
+    items = list(range(batch))
+    start = perf_counter()
+    for _ in range(rounds):
+        push_batch(items)
+        pop_batch(batch)
+    return (perf_counter() - start) / rounds * 1e6
+
+
+def loop_push(push):
+    def push_batch(items):
+        for item in items:
+            push(item)
+
+    return push_batch
+
+
+def loop_pop(pop):
+    def pop_batch(k):
+        return [pop() for _ in range(k)]
+
+    return pop_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=10_000, help="每批元素个数")
+    parser.add_argument("--rounds", type=int, default=200, help="轮数")
+    args = parser.parse_args()
+
+    # 容量不是批大小的整数倍，使批次位置不断错开
+    capacity = args.batch * 3 // 2 + 1
+    queue, deque = ArrayQueue(capacity), ArrayDeque(capacity)
+    candidates = [
+        ("ArrayQueue 逐个", loop_push(queue.push), loop_pop(queue.pop)),
+        ("ArrayQueue 批量", queue.push_many, queue.pop_many),
+        ("ArrayDeque 逐个", loop_push(deque.push_last), loop_pop(deque.pop_first)),
+        ("ArrayDeque 批量", deque.push_many, deque.pop_many),
+    ]
+    print(f"{'实现':<18} {'每批(us)':>10}")
+    for name, push_batch, pop_batch in candidates:
+        print(f"{name:<18} {per_batch_us(push_batch, pop_batch, args.batch, args.rounds):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""环形队列存储类型基准：列表 vs array.array("d") vs NumPy float64
+
+把 n 个 float64 样本写满队列，报告每个位置占用的字节数（tracemalloc，包含装箱的 float 对象）、
+逐个入队 / 出队与批量入队 / 出队的吞吐量。未安装 NumPy 时跳过对应的行；
+NumPy 在测量开始前导入，其导入开销不计入字节数。
+
+    python -m benchmarks.queue_dtype --n 1000000
+"""
+
+import argparse
+import importlib.util
+import random
+from time import perf_counter
+
+from benchmarks.harness import peak_bytes
+from codes.array_deque import ArrayDeque
+from codes.array_queue import ArrayQueue
+
+
+def bytes_per_slot(make, samples: list[float]) -> float:
+    """构建并写满队列期间的峰值分配除以元素个数（样本在写入时才装箱）"""
+
+    def fill():
+        queue = make(len(samples))
+        push = queue.push if isinstance(queue, ArrayQueue) else queue.push_last
+        for x in samples:
+            push(x * 1.0)
+
+    return peak_bytes(fill) / len(samples)
+
+
+def single_mops(make, samples: list[float]) -> float:
+    queue = make(len(samples))
+    push, pop = (queue.push, queue.pop) if isinstance(queue, ArrayQueue) else (queue.push_last, queue.pop_first)
+    start = perf_counter()
+    for x in samples:
+        push(x)
+    for _ in samples:
+        pop()
+    return 2 * len(samples) / (perf_counter() - start) / 1e6
+
+
+def batch_mops(make, samples: list[float], batch: int = 10_000) -> float:
+    queue = make(len(samples))
+    start = perf_counter()
+    for i in range(0, len(samples), batch):
+        queue.push_many(samples[i : i + batch])
+    for _ in range(0, len(samples), batch):
+        queue.pop_many(min(batch, queue.size()))
+    return 2 * len(samples) / (perf_counter() - start) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="样本个数")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    samples = [rng.random() for _ in range(args.n)]
+    candidates = [
+        ("ArrayQueue(列表)", lambda n: ArrayQueue(n)),
+        ('ArrayQueue("d")', lambda n: ArrayQueue(n, typecode="d")),
+        ("ArrayDeque(列表)", lambda n: ArrayDeque(n)),
+        ('ArrayDeque("d")', lambda n: ArrayDeque(n, typecode="d")),
+    ]
+    if importlib.util.find_spec("numpy") is not None:
+        # 队列在构造时才导入 NumPy，导入本身会分配数 MB 内存；先在测量之外导入，字节数只反映存储
+        importlib.import_module("numpy")
+        candidates += [
+            ("ArrayQueue(NumPy)", lambda n: ArrayQueue(n, typecode="d", use_numpy=True)),
+            ("ArrayDeque(NumPy)", lambda n: ArrayDeque(n, typecode="d", use_numpy=True)),
+        ]
+    else:
+        print("未安装 NumPy，跳过 NumPy 存储")
+
+    print(f"{'实现':<20} {'B/位置':>8} {'逐个 Mops/s':>12} {'批量 Mops/s':>12}")
+    for name, make in candidates:
+        memory = bytes_per_slot(make, samples)
+        print(f"{name:<20} {memory:>8.1f} {single_mops(make, samples):>12.2f} {batch_mops(make, samples):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
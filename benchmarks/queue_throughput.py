@@ -0,0 +1,69 @@
+"""队列吞吐量基准：ArrayQueue（固定容量 / 可扩容）vs collections.deque
+
+两种负载：
+- 稳态：队列保持约 depth 个元素，交替入队、出队；
+- 突发：一次入队 n 个元素再全部出队，可扩容模式会经历多次扩容与缩容。
+固定容量的 ArrayQueue 需预先按峰值分配。
+
+    python -m benchmarks.queue_throughput --ops 2000000 --depth 1024
+"""
+
+import argparse
+from collections import deque
+from time import perf_counter
+
+from codes.array_queue import ArrayQueue
+
+
+def steady(push, pop, ops: int, depth: int) -> float:
+    """返回每秒入队 + 出队次数"""
+    for i in range(depth):
+        push(i)
+    start = perf_counter()
+    for i in range(ops // 2):
+        push(i)
+        pop()
+    return ops / (perf_counter() - start)
+
+
+def burst(push, pop, ops: int) -> float:
+    """返回每秒入队 + 出队次数"""
+    n = ops // 2
+    start = perf_counter()
+    for i in range(n):
+        push(i)
+    for _ in range(n):
+        pop()
+    return ops / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2_000_000, help="入队与出队的总次数")
+    parser.add_argument("--depth", type=int, default=1024, help="稳态负载下队列中的元素个数")
+    args = parser.parse_args()
+
+    peak = max(args.ops // 2, args.depth + 1)
+    candidates = [
+        ("ArrayQueue(固定容量)", lambda: ArrayQueue(peak)),
+        ("ArrayQueue(可扩容)", lambda: ArrayQueue(16, growable=True)),
+        ("collections.deque", deque),
+    ]
+    print(f"{'实现':<22} {'稳态 Mops/s':>12} {'突发 Mops/s':>12}")
+    for name, make in candidates:
+        results = []
+        for workload in ("steady", "burst"):
+            queue = make()
+            if isinstance(queue, deque):
+                push, pop = queue.append, queue.popleft
+            else:
+                push, pop = queue.push, queue.pop
+            if workload == "steady":
+                results.append(steady(push, pop, args.ops, args.depth))
+            else:
+                results.append(burst(push, pop, args.ops))
+        print(f"{name:<22} {results[0] / 1e6:>12.2f} {results[1] / 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
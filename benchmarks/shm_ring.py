@@ -0,0 +1,106 @@
+"""跨进程队列基准：SharedRingQueue vs multiprocessing.Queue
+
+子进程作为生产者写入 n 条 record_size 字节的记录，主进程作为消费者读出，报告端到端吞吐量。
+SharedRingQueue 分别测试 pop（复制为 bytes）与 read（memoryview 零拷贝）两种读取方式。
+每次读取都带超时，生产者异常退出或超时未结束时终止子进程并报错，不会无限等待。
+
+    python -m benchmarks.shm_ring --n 200000 --record-size 64
+"""
+
+import argparse
+import multiprocessing as mp
+from queue import Empty
+from time import perf_counter
+
+from codes.shared_ring_queue import SharedRingQueue
+
+
+def produce_ring(ring: SharedRingQueue, n: int, record_size: int) -> None:
+    record = bytes(record_size)
+    push = ring.push
+    for _ in range(n):
+        push(record)
+
+
+def produce_mp(queue, n: int, record_size: int) -> None:
+    record = bytes(record_size)
+    put = queue.put
+    for _ in range(n):
+        put(record)
+
+
+def finish(producer: mp.Process, timeout: float) -> None:
+    """等待生产者结束，超时或退出码非 0 时终止子进程并报错"""
+    producer.join(timeout)
+    if producer.exitcode is None:
+        producer.kill()
+        producer.join()
+        raise RuntimeError(f"生产者 {timeout} 秒内未结束")
+    if producer.exitcode != 0:
+        raise RuntimeError(f"生产者异常退出，退出码 {producer.exitcode}")
+
+
+def consume(producer: mp.Process, get, n: int, timeout: float) -> None:
+    """读出 n 条记录；超时时检查生产者状态后报错"""
+    try:
+        for _ in range(n):
+            get(timeout=timeout)
+    except Empty:
+        producer.kill()
+        producer.join()
+        raise RuntimeError(f"{timeout} 秒内未读到数据，生产者退出码 {producer.exitcode}") from None
+
+
+def bench_ring(n: int, record_size: int, capacity: int, zero_copy: bool, timeout: float) -> float:
+    """返回每秒传递的记录数"""
+    with SharedRingQueue(capacity, record_size + 4) as ring:
+        producer = mp.Process(target=produce_ring, args=(ring, n, record_size), daemon=True)
+        if zero_copy:
+            read = ring.read
+
+            def get(timeout):
+                with read(timeout=timeout) as view:
+                    view[0]
+
+        else:
+            get = ring.pop
+        start = perf_counter()
+        producer.start()
+        consume(producer, get, n, timeout)
+        elapsed = perf_counter() - start
+        finish(producer, timeout)
+    return n / elapsed
+
+
+def bench_mp(n: int, record_size: int, capacity: int, timeout: float) -> float:
+    """返回每秒传递的记录数"""
+    queue = mp.Queue(capacity)
+    producer = mp.Process(target=produce_mp, args=(queue, n, record_size), daemon=True)
+    start = perf_counter()
+    producer.start()
+    consume(producer, queue.get, n, timeout)
+    elapsed = perf_counter() - start
+    finish(producer, timeout)
+    return n / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=200_000, help="记录条数")
+    parser.add_argument("--record-size", type=int, default=64, help="每条记录的字节数")
+    parser.add_argument("--capacity", type=int, default=4096, help="队列容量")
+    parser.add_argument("--timeout", type=float, default=30.0, help="单次读取与等待生产者结束的超时秒数")
+    args = parser.parse_args()
+
+    print(f"{'实现':<28} {'kops/s':>10} {'MB/s':>8}")
+    results = [
+        ("SharedRingQueue.pop", bench_ring(args.n, args.record_size, args.capacity, False, args.timeout)),
+        ("SharedRingQueue.read(零拷贝)", bench_ring(args.n, args.record_size, args.capacity, True, args.timeout)),
+        ("multiprocessing.Queue", bench_mp(args.n, args.record_size, args.capacity, args.timeout)),
+    ]
+    for name, ops in results:
+        print(f"{name:<28} {ops / 1e3:>10.1f} {ops * args.record_size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
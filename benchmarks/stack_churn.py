@@ -0,0 +1,76 @@
+"""栈的入栈 / 出栈高频交替基准：数组栈 vs 链表栈（有无空闲节点池）
+
+模拟反复压入一批元素再全部弹出的负载，报告吞吐量以及期间发生的 GC 次数与总停顿时间
+（通过 gc.callbacks 统计）。
+
+    python -m benchmarks.stack_churn --ops 2000000 --batch 1000
+"""
+
+import argparse
+import gc
+from time import perf_counter
+
+from codes import array_stack, linked_stack
+
+
+class GCMonitor:
+    """通过 gc.callbacks 统计各代回收次数与停顿时间"""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = perf_counter()
+        else:
+            self.pause += perf_counter() - self._start
+            self.collections[info["generation"]] += 1
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def churn(stack, ops: int, batch: int) -> None:
+    """交替压入 batch 个元素再弹出 batch 个元素，共 ops 次操作"""
+    push, pop = stack.push, stack.pop
+    for _ in range(ops // (2 * batch)):
+        for i in range(batch):
+            push(i)
+        for _ in range(batch):
+            pop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2_000_000, help="入栈与出栈的总次数")
+    parser.add_argument("--batch", type=int, default=1000, help="每轮压入 / 弹出的元素个数")
+    args = parser.parse_args()
+
+    candidates = [
+        ("Stack(数组)", array_stack.Stack),
+        ("Stack(链表)", lambda: linked_stack.Stack()),
+        (f"Stack(链表, 池 {args.batch})", lambda: linked_stack.Stack(pool_size=args.batch)),
+    ]
+    print(f"{'实现':<24} {'Mops/s':>8} {'gen0':>6} {'gen1':>6} {'gen2':>6} {'GC停顿(ms)':>11}")
+    for name, make in candidates:
+        stack = make()
+        gc.collect()
+        with GCMonitor() as monitor:
+            start = perf_counter()
+            churn(stack, args.ops, args.batch)
+            elapsed = perf_counter() - start
+        gen0, gen1, gen2 = monitor.collections
+        print(
+            f"{name:<24} {args.ops / elapsed / 1e6:>8.2f} {gen0:>6} {gen1:>6} {gen2:>6} "
+            f"{monitor.pause * 1e3:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""并发栈争用基准：1 / 4 / 16 个生产者与消费者
+
+ConcurrentStack 使用线程，AsyncStack 使用同一事件循环中的协程；
+每组中生产者与消费者数量相同，栈容量有限以产生背压，报告总吞吐量。
+
+    python -m benchmarks.stack_contention --items 200000 --capacity 1024
+"""
+
+import argparse
+import asyncio
+import threading
+from time import perf_counter
+
+from codes.concurrent_stack import AsyncStack, ConcurrentStack
+
+
+def bench_threads(workers: int, items: int, capacity: int) -> float:
+    """返回每秒完成的入栈 + 出栈次数"""
+    stack = ConcurrentStack(capacity)
+    per_worker = items // workers
+
+    def producer():
+        push = stack.push
+        for i in range(per_worker):
+            push(i)
+
+    def consumer():
+        pop = stack.pop
+        for _ in range(per_worker):
+            pop()
+
+    threads = [threading.Thread(target=producer) for _ in range(workers)]
+    threads += [threading.Thread(target=consumer) for _ in range(workers)]
+    start = perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return 2 * per_worker * workers / (perf_counter() - start)
+
+
+def bench_async(workers: int, items: int, capacity: int) -> float:
+    """返回每秒完成的入栈 + 出栈次数"""
+    per_worker = items // workers
+
+    async def main() -> float:
+        stack = AsyncStack(capacity)
+
+        async def producer():
+            for i in range(per_worker):
+                await stack.push(i)
+
+        async def consumer():
+            for _ in range(per_worker):
+                await stack.pop()
+
+        start = perf_counter()
+        await asyncio.gather(*(producer() for _ in range(workers)), *(consumer() for _ in range(workers)))
+        return 2 * per_worker * workers / (perf_counter() - start)
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200_000, help="每组生产者合计入栈的元素个数")
+    parser.add_argument("--capacity", type=int, default=1024, help="栈容量")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16], help="生产者 / 消费者数量")
+    args = parser.parse_args()
+
+    print(f"{'生产者=消费者':>12} {'线程 kops/s':>12} {'协程 kops/s':>12}")
+    for workers in args.workers:
+        threads = bench_threads(workers, args.items, args.capacity)
+        coroutines = bench_async(workers, args.items, args.capacity)
+        print(f"{workers:>12} {threads / 1e3:>12.1f} {coroutines / 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
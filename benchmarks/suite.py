@@ -0,0 +1,193 @@
+"""全部数据结构的基准套件
+
+覆盖数组操作、两种栈、ArrayQueue / Queue、ArrayDeque / LinkedListDeque、三种哈希表、
+BinaryTree、AVLTree 与 ArrayBinaryTree，在多个规模下报告 ops/s 与峰值内存，
+并可保存为 JSON 与此前的结果比较。
+
+    python -m benchmarks.suite --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.suite --compare bench.json --threshold 0.1
+"""
+
+import argparse
+import random
+import sys
+
+from benchmarks.harness import Workload, compare, format_table, load, measure, save
+from codes import (
+    array_binary_tree,
+    array_deque,
+    array_hash_map,
+    array_ops,
+    array_queue,
+    array_stack,
+    avl_tree,
+    binary_tree,
+    hash_map_chaining,
+    hash_map_open_addressing,
+    linked_deque,
+    linked_queue,
+    linked_stack,
+)
+from codes.array_util import SILENT, set_mode
+
+
+def shuffled(size: int) -> list[int]:
+    """固定随机种子的打乱序列，保证每次运行的负载一致"""
+    keys = list(range(size))
+    random.Random(size).shuffle(keys)
+    return keys
+
+
+def run_stack(stack_cls):
+    def run(size):
+        stack = stack_cls()
+        push, pop = stack.push, stack.pop
+        for i in range(size):
+            push(i)
+        for _ in range(size):
+            pop()
+
+    return run
+
+
+def run_array_queue(size):
+    queue = array_queue.ArrayQueue(size)
+    for i in range(size):
+        queue.push(i)
+    for _ in range(size):
+        queue.pop()
+
+
+def run_linked_queue(size):
+    queue = linked_queue.Queue()
+    for i in range(size):
+        queue.enqueue(i)
+    for _ in range(size):
+        queue.dequeue()
+
+
+def run_deque(make):
+    def run(size):
+        deque = make(size)
+        for i in range(size // 2):
+            deque.push_last(i)
+            deque.push_first(i)
+        for _ in range(size // 2):
+            deque.pop_first()
+            deque.pop_last()
+
+    return run
+
+
+def run_hash_map(map_cls):
+    def run(keys):
+        hashmap = map_cls()
+        for key in keys:
+            hashmap.put(key, "v")
+        for key in keys:
+            hashmap.get(key)
+
+    return run
+
+
+def run_binary_tree(keys):
+    tree = binary_tree.BinaryTree()
+    for key in keys:
+        tree.insert(key)
+    for key in keys:
+        tree.search(key)
+
+
+def run_avl_tree(keys):
+    tree = avl_tree.AVLTree()
+    for key in keys:
+        tree.insert(key)
+    for key in keys:
+        tree.remove(key)
+
+
+def run_array_binary_tree(size):
+    tree = array_binary_tree.ArrayBinaryTree(list(range(size)))
+    tree.level_order()
+    tree.pre_order()
+
+
+def run_array_find(nums):
+    # 查找数组中间与末尾的元素各 10 次
+    for target in (len(nums) // 2, len(nums) - 1) * 10:
+        array_ops.find(nums, target)
+
+
+def run_array_edit(nums):
+    # 在前半部分插入、删除各 10 次
+    for i in range(10):
+        array_ops.insert(nums, -1, i)
+        array_ops.remove(nums, i)
+
+
+def twice(size: int) -> int:
+    """先放入 size 个元素再全部取出（或查询），共 2 * size 次操作"""
+    return 2 * size
+
+
+WORKLOADS = [
+    Workload("array.traverse", lambda n: list(range(n)), array_ops.traverse),
+    Workload("array.find", lambda n: list(range(n)), run_array_find, ops=lambda n: 20),
+    Workload("array.insert_remove", lambda n: list(range(n)), run_array_edit, ops=lambda n: 20),
+    Workload("array_stack.push_pop", int, run_stack(array_stack.Stack), ops=twice),
+    Workload("linked_stack.push_pop", int, run_stack(linked_stack.Stack), ops=twice),
+    Workload("array_queue.push_pop", int, run_array_queue, ops=twice),
+    Workload("linked_queue.enqueue_dequeue", int, run_linked_queue, ops=twice),
+    Workload("array_deque.push_pop", int, run_deque(array_deque.ArrayDeque), ops=twice),
+    Workload("linked_deque.push_pop", int, run_deque(lambda n: linked_deque.LinkedListDeque()), ops=twice),
+    Workload("array_hash_map.put_get", shuffled, run_hash_map(array_hash_map.ArrayHashMap), ops=twice),
+    Workload(
+        "open_addressing.put_get",
+        shuffled,
+        run_hash_map(hash_map_open_addressing.HashMapOpenAddressing),
+        ops=twice,
+    ),
+    Workload("chaining.put_get", shuffled, run_hash_map(hash_map_chaining.HashMapChaining), ops=twice),
+    Workload("binary_tree.insert_search", shuffled, run_binary_tree, ops=twice),
+    Workload("avl_tree.insert_remove", shuffled, run_avl_tree, ops=twice),
+    Workload("array_binary_tree.traverse", int, run_array_binary_tree, ops=twice),
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="输入规模")
+    parser.add_argument("--repeat", type=int, default=5, help="每个负载的重复次数，取最小值")
+    parser.add_argument("--filter", default="", help="只运行名称包含该子串的负载")
+    parser.add_argument("--output", help="保存结果的 JSON 文件")
+    parser.add_argument("--compare", help="与该 JSON 文件中的结果比较")
+    parser.add_argument("--threshold", type=float, default=0.1, help="判定回归的相对变化阈值")
+    args = parser.parse_args()
+
+    # 数组操作带有 log_operation 装饰器，静默模式下不打印结果
+    set_mode(SILENT)
+    results = []
+    for workload in WORKLOADS:
+        if args.filter not in workload.name:
+            continue
+        for size in args.sizes:
+            results.append(measure(workload, size, args.repeat))
+            print(format_table(results[-1:]).splitlines()[-1], flush=True)
+
+    print()
+    print(format_table(results))
+    if args.output:
+        save(results, args.output)
+        print(f"结果已保存到 {args.output}")
+    if args.compare:
+        regressions = compare(load(args.compare), results, args.threshold)
+        for line in regressions:
+            print(f"回归：{line}")
+        if regressions:
+            return 1
+        print("未发现回归")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""展开链表基准：LinkedList vs UnrolledLinkedList 的内存与遍历速度
+
+以 n 个整数构建链表，报告 tracemalloc 统计的每元素字节数（不含元素对象本身）、
+完整遍历一次（sum）的耗时，以及查找末尾元素（find，最坏情况）的耗时。
+
+    python -m benchmarks.unrolled_linked_list --n 1000000 --capacities 16 64 256
+"""
+
+import argparse
+
+from benchmarks.harness import best_of, peak_bytes
+from codes.linked_list import LinkedList
+from codes.unrolled_linked_list import UnrolledLinkedList
+
+
+def bytes_per_item(make, keys: list) -> float:
+    """构建链表期间的峰值分配除以元素个数"""
+    return peak_bytes(lambda: make().extend(keys)) / len(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="元素个数")
+    parser.add_argument("--capacities", type=int, nargs="+", default=[16, 64, 256], help="展开链表的节点容量")
+    parser.add_argument("--repeat", type=int, default=3, help="计时重复次数，取最小值")
+    args = parser.parse_args()
+
+    keys = list(range(args.n))
+    candidates = [("LinkedList", LinkedList)]
+    candidates += [(f"UnrolledLinkedList({c})", lambda c=c: UnrolledLinkedList(c)) for c in args.capacities]
+
+    print(f"{'实现':<24} {'B/项':>8} {'遍历(ms)':>10} {'查找末尾(ms)':>13}")
+    for name, make in candidates:
+        memory = bytes_per_item(make, keys)
+        lst = make()
+        lst.extend(keys)
+        traverse, _ = best_of(lambda: sum(lst), args.repeat)
+        find, _ = best_of(lambda: lst.find(args.n - 1), args.repeat)
+        print(f"{name:<24} {memory:>8.1f} {traverse * 1e3:>10.1f} {find * 1e3:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
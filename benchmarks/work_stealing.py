@@ -0,0 +1,115 @@
+"""工作窃取基准：随机二叉搜索树的并行求和（线程 fork / join vs 进程池）
+
+先插入 size 个随机键构造 BinaryTree，再用三种方式求全部节点值之和：
+- 串行递归；
+- WorkStealingPool：深度小于 cutoff 的节点 fork 左子树、当前线程递归右子树，再 join 左子树；
+- 进程池（fork 启动方式）：子进程继承整棵树，按路径字符串（如 "LR"）定位深度为 cutoff 的子树求和，
+  不需要序列化树节点；深度小于 cutoff 的节点在主进程累加。
+纯 Python 的求和受 GIL 限制，线程数增加并不会加速，线程池一行主要反映调度开销与窃取次数。
+
+    python -m benchmarks.work_stealing --size 200000 --cutoff 6 --max-workers 8
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.harness import best_of
+from codes.binary_tree import BinaryTree, TreeNode
+from codes.work_stealing import WorkStealingPool
+
+_TREE: BinaryTree | None = None  # 供 fork 出的子进程继承
+
+
+def tree_sum(node: TreeNode | None) -> int:
+    """串行递归求和"""
+    if node is None:
+        return 0
+    return node.val + tree_sum(node.left) + tree_sum(node.right)
+
+
+def forked_sum(pool: WorkStealingPool, node: TreeNode | None, depth: int, cutoff: int) -> int:
+    """fork / join 求和，深度达到 cutoff 后串行"""
+    if node is None:
+        return 0
+    if depth >= cutoff:
+        return tree_sum(node)
+    left = pool.fork(forked_sum, pool, node.left, depth + 1, cutoff)
+    right = forked_sum(pool, node.right, depth + 1, cutoff)
+    return node.val + right + pool.join(left)
+
+
+def subtree_sum(path: str) -> int:
+    """在子进程中按路径定位子树并求和"""
+    node = _TREE.root
+    for step in path:
+        node = node.left if step == "L" else node.right
+    return tree_sum(node)
+
+
+def split(node: TreeNode | None, path: str, cutoff: int, paths: list[str]) -> int:
+    """收集深度为 cutoff 的子树路径，返回其上方节点值之和"""
+    if node is None:
+        return 0
+    if len(path) >= cutoff:
+        paths.append(path)
+        return 0
+    return node.val + split(node.left, path + "L", cutoff, paths) + split(node.right, path + "R", cutoff, paths)
+
+
+def process_sum(executor: ProcessPoolExecutor, cutoff: int) -> int:
+    paths: list[str] = []
+    upper = split(_TREE.root, "", cutoff, paths)
+    return upper + sum(executor.map(subtree_sum, paths))
+
+
+def main() -> None:
+    global _TREE
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000, help="树的节点数")
+    parser.add_argument("--cutoff", type=int, default=6, help="并行拆分的最大深度")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="最大线程数 / 进程数")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最小值")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    _TREE = BinaryTree()
+    for key in rng.sample(range(args.size * 10), args.size):
+        _TREE.insert(key)
+    expected = sum(_TREE.inorder())
+
+    serial, total = best_of(lambda: tree_sum(_TREE.root), args.repeat)
+    assert total == expected
+    print(f"串行基线：{serial * 1e3:.1f} ms")
+
+    workers_list, w = [], 1
+    while w < args.max_workers:
+        workers_list.append(w)
+        w *= 2
+    workers_list.append(args.max_workers)
+
+    print(f"{'实现':<10} {'并发数':>6} {'耗时(ms)':>10} {'加速比':>8} {'窃取次数':>8}")
+    for workers in workers_list:
+        with WorkStealingPool(workers) as pool:
+            elapsed, total = best_of(lambda: pool.run(forked_sum, pool, _TREE.root, 0, args.cutoff), args.repeat)
+            assert total == expected
+            steals = pool.steals
+        print(f"{'线程':<10} {workers:>6} {elapsed * 1e3:>10.1f} {serial / elapsed:>8.2f} {steals:>8}")
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        print("当前平台不支持 fork 启动方式，跳过进程池")
+        return
+    context = multiprocessing.get_context("fork")
+    for workers in workers_list:
+        with ProcessPoolExecutor(workers, mp_context=context) as executor:
+            # 预热：拉起全部子进程
+            list(executor.map(abs, range(workers)))
+            elapsed, total = best_of(lambda: process_sum(executor, args.cutoff), args.repeat)
+            assert total == expected
+        print(f"{'进程':<10} {workers:>6} {elapsed * 1e3:>10.1f} {serial / elapsed:>8.2f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""数据结构实现的可导入包
+
+源文件使用中文文件名（部分还带有 ``1.`` 这样的前缀），无法直接 import。
+这里为每个模块登记一个 ASCII 别名，例如::
+
+    from codes.array_deque import ArrayDeque
+    from codes.avl_tree import AVLTree
+
+别名模块在首次访问时才加载，导入本包不会执行任何示例代码。
+示例代码可通过 ``python -m codes.<别名>`` 运行。
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+_TREE_CODE = os.path.join(os.pardir, "docs", "sections", "树", "code")
+
+# ASCII 别名 -> 相对于 codes/ 的源文件路径
+_ALIASES: dict[str, str] = {
+    "array_util": os.path.join("数组", "util.py"),
+    "array_ops": os.path.join("数组", "1.数组基本操作.py"),
+    "dynamic_array": os.path.join("数组", "2.动态数组.py"),
+    "mmap_array": os.path.join("数组", "3.内存映射数组.py"),
+    "parallel_array": os.path.join("数组", "4.并行归约.py"),
+    "array_stack": os.path.join("栈", "基于数组的实现.py"),
+    "linked_stack": os.path.join("栈", "基于链表实现.py"),
+    "concurrent_stack": os.path.join("栈", "并发栈.py"),
+    "linked_list": os.path.join("链表", "1.简单链表实现.py"),
+    "indexed_linked_list": os.path.join("链表", "2.哈希索引链表.py"),
+    "unrolled_linked_list": os.path.join("链表", "3.展开链表.py"),
+    "array_queue": os.path.join("队列", "单向队列基于数组实现.py"),
+    "linked_queue": os.path.join("队列", "单向队列基于链表实现.py"),
+    "async_waiters": os.path.join("队列", "异步等待队列.py"),
+    "async_queue": os.path.join("队列", "异步队列.py"),
+    "priority_queue": os.path.join("队列", "优先队列.py"),
+    "delay_queue": os.path.join("队列", "延迟队列.py"),
+    "work_stealing": os.path.join("队列", "工作窃取.py"),
+    "array_deque": os.path.join("队列", "双向队列基于数组实现.py"),
+    "linked_deque": os.path.join("队列", "双向队列基于链表实现.py"),
+    "shared_ring_queue": os.path.join("队列", "共享内存环形队列.py"),
+    "sliding_window": os.path.join("队列", "滑动窗口.py"),
+    "array_hash_map": os.path.join("哈希", "哈希表简单实现.py"),
+    "hash_map_open_addressing": os.path.join("哈希", "线性探测哈希表.py"),
+    "hash_map_chaining": os.path.join("哈希", "链式地址哈希表.py"),
+    "cache": os.path.join("哈希", "缓存.py"),
+    "binary_tree": os.path.join(_TREE_CODE, "二叉树.py"),
+    "avl_tree": os.path.join(_TREE_CODE, "avl树.py"),
+    "array_binary_tree": os.path.join(_TREE_CODE, "二叉树数组表示.py"),
+}
+
+__all__ = sorted(_ALIASES)
+
+
+class _AliasFinder:
+    """把 ``codes.<别名>`` 解析到对应的中文文件名模块
+
+    只实现 meta path finder 协议中的 find_spec，不继承 importlib.abc，
+    避免导入 importlib.abc 带来的数十毫秒开销。
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        package, _, name = fullname.rpartition(".")
+        if package != __name__ or name not in _ALIASES:
+            return None
+        location = os.path.normpath(os.path.join(_ROOT, _ALIASES[name]))
+        return importlib.util.spec_from_file_location(fullname, location)
+
+
+# 重复导入（如 importlib.reload）时不重复注册
+if not any(type(finder).__name__ == "_AliasFinder" for finder in sys.meta_path):
+    sys.meta_path.append(_AliasFinder())
+
+
+def __getattr__(name: str):
+    """支持 ``import codes; codes.array_deque`` 形式的惰性访问"""
+    if name in _ALIASES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,297 @@
+import functools
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from codes.linked_deque import LinkedListDeque, ListNode
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "size", "weight"])
+
+_MISSING = object()
+
+
+class _Entry:
+    """缓存条目：键值、权重，以及它在链表中的节点"""
+
+    __slots__ = ("key", "value", "weight", "node", "bucket")
+
+    def __init__(self, key, value, weight: int) -> None:
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.node: ListNode | None = None  # 条目所在的链表节点
+        self.bucket: ListNode | None = None  # LFU 中条目所在的频次桶节点
+
+
+class _Cache(ABC):
+    """LRU / LFU 缓存的公共部分：哈希表、容量与权重上限、命中统计
+
+    哈希表负责 O(1) 查找条目，子类用双向链表维护淘汰顺序：
+    _link 登记新条目，_touch 记录一次访问，_unlink 摘除条目，_victim 给出下一个淘汰对象。
+    _map（键 -> 条目）供子类直接查找条目
+    """
+
+    def __init__(self, maxsize: int | None = 128, max_weight: int | None = None, weigher=None) -> None:
+        """构造方法，maxsize / max_weight 为 None 表示不限；weigher(key, value) 计算条目权重，默认为 1"""
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize 必须为正数")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("max_weight 必须为正数")
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.__weigher = weigher
+        self._map: dict = {}
+        self.__weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def weight(self) -> int:
+        """当前全部条目的权重之和"""
+        return self.__weight
+
+    def get(self, key, default=None):
+        """查找 key，命中时记录一次访问，未命中返回 default"""
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key, value) -> None:
+        """写入 key，超出容量或权重上限时按淘汰顺序逐个淘汰其他条目
+
+        单个条目的权重超过 max_weight 时不缓存（同时移除该键的旧值）
+        """
+        weight = 1 if self.__weigher is None else self.__weigher(key, value)
+        if self.max_weight is not None and weight > self.max_weight:
+            self.delete(key)
+            return
+        entry = self._map.get(key)
+        if entry is None:
+            entry = _Entry(key, value, weight)
+            self._map[key] = entry
+            self._link(entry)
+        else:
+            self.__weight -= entry.weight
+            entry.value, entry.weight = value, weight
+            self._touch(entry)
+        self.__weight += weight
+        while self.__over_limit():
+            self.__evict(self._victim(entry))
+
+    def delete(self, key) -> bool:
+        """移除 key，返回其是否存在"""
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return False
+        self._unlink(entry)
+        self.__weight -= entry.weight
+        return True
+
+    def clear(self) -> None:
+        """清空缓存，保留命中统计"""
+        for entry in list(self._map.values()):
+            self._unlink(entry)
+        self._map.clear()
+        self.__weight = 0
+
+    def cache_info(self) -> CacheInfo:
+        """返回命中、未命中、淘汰次数以及当前条目数与总权重"""
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._map), self.__weight)
+
+    def __over_limit(self) -> bool:
+        if self.maxsize is not None and len(self._map) > self.maxsize:
+            return True
+        return self.max_weight is not None and self.__weight > self.max_weight
+
+    def __evict(self, entry: _Entry) -> None:
+        self._unlink(entry)
+        del self._map[entry.key]
+        self.__weight -= entry.weight
+        self.evictions += 1
+
+    @abstractmethod
+    def _link(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _touch(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _unlink(self, entry: _Entry) -> None:
+        ...
+
+    @abstractmethod
+    def _victim(self, keep: _Entry) -> _Entry:
+        """下一个被淘汰的条目，跳过刚写入的 keep"""
+
+
+class LRUCache(_Cache):
+    """最近最少使用（LRU）缓存
+
+    条目按访问时间排在双向队列中：队首为最近访问，淘汰时从队尾取出
+    """
+
+    def __init__(self, maxsize: int | None = 128, max_weight: int | None = None, weigher=None) -> None:
+        """构造方法"""
+        super().__init__(maxsize, max_weight, weigher)
+        self.__order = LinkedListDeque()
+
+    def _link(self, entry: _Entry) -> None:
+        entry.node = self.__order.push_first(entry)
+
+    def _touch(self, entry: _Entry) -> None:
+        self.__order.move_to_front(entry.node)
+
+    def _unlink(self, entry: _Entry) -> None:
+        self.__order.remove(entry.node)
+        entry.node = None
+
+    def _victim(self, keep: _Entry) -> _Entry:
+        node = self.__order.rear
+        if node.val is keep:
+            node = node.prev
+        return node.val
+
+    def keys(self) -> list:
+        """按从最近到最久访问的顺序返回全部键"""
+        return [entry.key for entry in self.__order.to_array()]
+
+
+class _Bucket(LinkedListDeque):
+    """LFU 的频次桶：访问次数相同的条目，队首为最近访问"""
+
+    def __init__(self, freq: int) -> None:
+        super().__init__()
+        self.freq = freq
+
+
+class LFUCache(_Cache):
+    """最不经常使用（LFU）缓存，访问次数相同时淘汰最久未访问的条目
+
+    频次桶按访问次数从小到大排成双向队列，每个桶内又是一条双向队列。
+    访问条目时把它移到下一个频次桶（不存在则就地插入），get / put / 淘汰均为 O(1)
+    """
+
+    def __init__(self, maxsize: int | None = 128, max_weight: int | None = None, weigher=None) -> None:
+        """构造方法"""
+        super().__init__(maxsize, max_weight, weigher)
+        self.__buckets = LinkedListDeque()
+
+    def frequency(self, key) -> int:
+        """key 的访问次数（写入计为一次），不存在时返回 0，不计入命中统计"""
+        entry = self._map.get(key)
+        return 0 if entry is None else entry.bucket.val.freq
+
+    def _link(self, entry: _Entry) -> None:
+        first = self.__buckets.front
+        if first is None or first.val.freq != 1:
+            first = self.__buckets.push_first(_Bucket(1))
+        entry.bucket = first
+        entry.node = first.val.push_first(entry)
+
+    def _touch(self, entry: _Entry) -> None:
+        current = entry.bucket
+        bucket: _Bucket = current.val
+        target = current.next
+        if target is None or target.val.freq != bucket.freq + 1:
+            target = self.__buckets.insert_after(current, _Bucket(bucket.freq + 1))
+        bucket.remove(entry.node)
+        if bucket.is_empty():
+            self.__buckets.remove(current)
+        entry.bucket = target
+        entry.node = target.val.push_first(entry)
+
+    def _unlink(self, entry: _Entry) -> None:
+        bucket: _Bucket = entry.bucket.val
+        bucket.remove(entry.node)
+        if bucket.is_empty():
+            self.__buckets.remove(entry.bucket)
+        entry.node = entry.bucket = None
+
+    def _victim(self, keep: _Entry) -> _Entry:
+        current = self.__buckets.front
+        node = current.val.rear
+        if node.val is keep:
+            node = node.prev
+            if node is None:
+                node = current.next.val.rear
+        return node.val
+
+
+def _make_key(args: tuple, kwargs: dict):
+    """由调用参数构造可哈希的缓存键"""
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (int, str) else args
+    return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(cache=None):
+    """缓存函数结果的装饰器，参数须可哈希
+
+    可直接使用 ``@memoize``（默认 LRUCache()），或传入缓存实例 ``@memoize(LFUCache(maxsize=1024))``；
+    被装饰的函数通过 ``.cache`` 访问所用的缓存
+    """
+    if callable(cache) and not isinstance(cache, _Cache):
+        return memoize()(cache)
+
+    def decorator(func):
+        store = LRUCache() if cache is None else cache
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = store.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                store.put(key, result)
+            return result
+
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    # LRU 缓存：容量为 2，写入第三个键时淘汰最久未访问的键
+    lru = LRUCache(maxsize=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)
+    print(lru.keys())  # 输出: ['c', 'a']
+    print(lru.cache_info())  # 输出: CacheInfo(hits=1, misses=0, evictions=1, size=2, weight=2)
+
+    # LFU 缓存：淘汰访问次数最少的键
+    lfu = LFUCache(maxsize=2)
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    lfu.get("a")
+    lfu.get("a")
+    lfu.put("c", 3)
+    print("a" in lfu, "b" in lfu, lfu.frequency("a"))  # 输出: True False 3
+
+    # 按权重限制：总权重（字符串长度）不超过 10
+    sized = LRUCache(maxsize=None, max_weight=10, weigher=lambda key, value: len(value))
+    sized.put(1, "hello")
+    sized.put(2, "world")
+    sized.put(3, "!!")
+    print(len(sized), sized.weight())  # 输出: 2 7
+
+    # memoize 装饰器
+    @memoize
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(80))  # 输出: 23416728348467685
+    print(fib.cache.cache_info())  # 输出: CacheInfo(hits=78, misses=81, evictions=0, size=81, weight=81)
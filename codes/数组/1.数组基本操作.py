@@ -1,15 +1,41 @@
-from util import log_operation
+try:
+    from codes.array_util import log_operation
+except ModuleNotFoundError:
+    # 直接运行本文件（python 1.数组基本操作.py）时 codes 包不在导入路径上，改用同目录的 util
+    from util import log_operation
+from array import array
 import random
+import sys
 
+# remove_many 中删除点不超过该数量时逐个 del，否则整段压缩（10^6 规模下实测的分界点）
+_REMOVE_BY_DEL_LIMIT = 48
+
+# find_many 最多缓存的查找索引个数
+_INDEX_CACHE_SIZE = 8
+# id(nums) -> (nums, 建索引时的长度, 索引)；持有 nums 的引用，保证缓存期间 id 不会被复用
+_index_cache: dict[int, tuple] = {}
 
-@log_operation
-def create_array(value, size):
-    """创建一个指定大小的数组（列表）"""
-    return [value] * size
 
+def _is_ndarray(nums) -> bool:
+    """判断是否为 NumPy 数组（调用方持有 ndarray 时 numpy 必然已导入，无需在此导入）"""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(nums, np.ndarray)
 
-# 创建一个包含 5 个元素的数组
-arr = create_array(None, 5)
+
+@log_operation
+def create_array(value, size, typecode: str | None = None, use_numpy: bool = False):
+    """创建一个指定大小的数组（列表）
+
+    指定 typecode（如 "q" 为 int64、"d" 为 float64）时返回紧凑存储的 array.array，
+    每个元素只占 typecode 对应的字节数；use_numpy 为 True 时返回 NumPy 数组
+    """
+    if use_numpy:
+        import numpy as np  # 可选依赖，仅在需要时导入
+
+        return np.full(size, value, dtype=typecode or "q")
+    if typecode is not None:
+        return array(typecode, [value]) * size
+    return [value] * size
 
 
 @log_operation
@@ -22,49 +48,122 @@ def random_access(nums: list[int]) -> int:
     return random_num
 
 
-# 调用 random_access 函数
-random_element = random_access([10, 20, 30, 40, 50])
-
-
 @log_operation
 def insert(nums: list[int], num: int, index: int):
     """在数组的索引 index 处插入元素 num"""
-    # 把索引 index 以及之后的所有元素向后移动一位
-    for i in range(len(nums) - 1, index, -1):
-        nums[i] = nums[i - 1]
+    # 确保索引 index 在数组的有效范围内
+    if index < 0 or index >= len(nums):
+        raise IndexError("索引超出数组范围")
+    # 把索引 index 以及之后的所有元素向后移动一位，末尾元素被挤出
+    # 切片赋值在 C 层整体搬移元素，不再逐个元素执行 Python 字节码
+    nums[index + 1 :] = nums[index:-1]
     # 将 num 赋给 index 处的元素
     nums[index] = num
+    invalidate_index(nums)
     return nums
 
 
-# 调用 insert 函数
-insert([1, 2, 3, 5, 6], 4, 3)
+@log_operation
+def insert_many(nums: list[int], values: list[int], indices: list[int]):
+    """在数组的多个索引处批量插入元素
+
+    indices 均按插入前的数组计算，values[j] 插入到原索引 indices[j] 的元素之前，
+    相当于把所有元素插入后再截断回原长度：数组长度不变，末尾元素被挤出（NumPy 数组同样原地修改）
+    """
+    if len(values) != len(indices):
+        raise ValueError("values 与 indices 长度不一致")
+    n = len(nums)
+    if any(i < 0 or i >= n for i in indices):
+        raise IndexError("索引超出数组范围")
+    if not indices:
+        return nums
+    if _is_ndarray(nums):
+        # np.insert 按索引稳定排序后插入，同一索引保持给定顺序；只改写第一个插入点之后的部分
+        start = min(indices)
+        tail = sys.modules["numpy"].insert(nums[start:], [i - start for i in indices], values)
+        nums[start:] = tail[: n - start]
+        invalidate_index(nums)
+        return nums
+    # 按索引升序（稳定排序，同一索引保持给定顺序）拼接各段切片
+    order = sorted(range(len(indices)), key=indices.__getitem__)
+    start = prev = indices[order[0]]
+    res = nums[:0]  # 与 nums 同类型的空序列，array.array 也可直接使用
+    for j in order:
+        i = indices[j]
+        res += nums[prev:i]
+        res.append(values[j])
+        prev = i
+        if len(res) >= n - start:
+            break
+    else:
+        res += nums[prev : prev + n - start - len(res)]
+    # 只改写第一个插入点之后的部分，超出原长度的元素被丢弃
+    nums[start:] = res[: n - start]
+    invalidate_index(nums)
+    return nums
 
 
 @log_operation
 def remove(nums: list[int], index: int):
-    """删除索引 index 处的元素"""
+    """删除索引 index 处的元素
+
+    NumPy 数组长度固定，无法原地删除，返回删除后的新数组（原数组不变），调用方需使用返回值
+    """
     # 确保索引 index 在数组的有效范围内
     if index < 0 or index >= len(nums):
         raise IndexError("索引超出数组范围")
+    if _is_ndarray(nums):
+        return sys.modules["numpy"].delete(nums, index)
 
-    # 把索引 index 之后的所有元素向前移动一位
-    for i in range(index, len(nums) - 1):
-        nums[i] = nums[i + 1]
-
-    # 移除数组中的最后一个元素
-    del nums[-1]
+    # 把索引 index 之后的所有元素向前移动一位，并移除数组中的最后一个元素
+    # del 在 C 层通过 memmove 一次性完成搬移
+    del nums[index]
 
+    invalidate_index(nums)
     return nums
 
 
-# 调用 remove 函数
-remove([1, 2, 3, 4, 5, 6], 2)
+@log_operation
+def remove_many(nums: list[int], indices: list[int]):
+    """批量删除多个索引处的元素（索引均按删除前的数组计算，重复索引只删除一次）
+
+    NumPy 数组与 remove 相同，返回删除后的新数组
+    """
+    n = len(nums)
+    if any(i < 0 or i >= n for i in indices):
+        raise IndexError("索引超出数组范围")
+    targets = sorted(set(indices))
+    if not targets:
+        return nums
+    if _is_ndarray(nums):
+        return sys.modules["numpy"].delete(nums, targets)
+    # 删除点较少时，从后往前逐个 del（每次一趟 memmove）更快
+    if len(targets) <= _REMOVE_BY_DEL_LIMIT:
+        for i in reversed(targets):
+            del nums[i]
+        invalidate_index(nums)
+        return nums
+    # 删除点较多时，把相邻两个删除点之间的整段元素一次性前移，最后截断尾部
+    write = targets[0]
+    for k, i in enumerate(targets):
+        end = targets[k + 1] if k + 1 < len(targets) else n
+        seg = end - i - 1
+        nums[write : write + seg] = nums[i + 1 : end]
+        write += seg
+    del nums[write:]
+    invalidate_index(nums)
+    return nums
 
 
 @log_operation
 def traverse(nums: list[int]) -> int:
     """遍历数组并计算元素总和"""
+    # 类型化数组：求和在 C 层完成（NumPy 为向量化求和）
+    if isinstance(nums, array):
+        return sum(nums)
+    if _is_ndarray(nums):
+        return nums.sum().item()
+
     count = 0  # 初始化计数器为0
 
     # 通过索引遍历数组
@@ -83,44 +182,150 @@ def traverse(nums: list[int]) -> int:
     return count  # 返回总和
 
 
-# 调用 traverse 函数
-total = traverse([1, 2, 3, 4, 5])
-
-
 @log_operation
 def find(nums: list[int], target: int) -> int:
     """在数组中查找指定元素"""
+    # 类型化数组：在 C 层查找（NumPy 为向量化比较）
+    if isinstance(nums, array):
+        try:
+            return nums.index(target)
+        except ValueError:
+            return -1
+    if _is_ndarray(nums):
+        hits = (nums == target).nonzero()[0]
+        return int(hits[0]) if len(hits) else -1
     for i in range(len(nums)):
         if nums[i] == target:
             return i
     return -1
 
 
-# 演示数据
-nums = [5, 3, 7, 1, 9, 8]
-target = 7
+def invalidate_index(nums) -> None:
+    """丢弃 nums 的查找索引；绕过本模块直接修改数组后需手动调用"""
+    _index_cache.pop(id(nums), None)
 
-# 调用 find 函数
-index = find(nums, target)
 
-# 输出结果
-if index != -1:
-    print(f"找到目标元素 {target} 在索引 {index}")
-else:
-    print(f"未找到目标元素 {target}")
+def _build_index(nums):
+    """构建查找索引：NumPy 数组为 (排序后的值, 原始位置)，其余为 值 -> 首次出现位置 的字典"""
+    if _is_ndarray(nums):
+        # 稳定排序保证相同值中位置最小者排在最前
+        order = nums.argsort(kind="stable")
+        return nums[order], order
+    # 逆序构建，使重复值最终保留最小的索引
+    return dict(zip(reversed(nums), range(len(nums) - 1, -1, -1)))
+
+
+def _get_index(nums):
+    """获取（必要时构建并缓存）nums 的查找索引"""
+    key = id(nums)
+    entry = _index_cache.pop(key, None)
+    # 长度变化说明数组被绕过本模块修改过，索引作废
+    if entry is None or entry[0] is not nums or entry[1] != len(nums):
+        entry = (nums, len(nums), _build_index(nums))
+        if len(_index_cache) >= _INDEX_CACHE_SIZE:
+            # 淘汰最久未使用的索引
+            del _index_cache[next(iter(_index_cache))]
+    # 重新插入到末尾，保持按最近使用排序
+    _index_cache[key] = entry
+    return entry[2]
+
+
+@log_operation
+def find_many(nums: list[int], targets: list[int]) -> list[int]:
+    """在数组中批量查找多个元素，返回各自首次出现的索引（不存在为 -1）
+
+    首次调用时为 nums 构建索引并缓存，之后的查询每个元素 O(1)（NumPy 数组为 O(log n)）。
+    通过本模块的 insert / remove 等函数修改数组会使索引失效
+    """
+    index = _get_index(nums)
+    if _is_ndarray(nums):
+        np = sys.modules["numpy"]
+        sorted_vals, order = index
+        targets = np.asarray(targets)
+        if not len(sorted_vals):
+            return np.full(len(targets), -1)
+        # 向量化二分查找，越界的位置先截断再比较
+        pos = np.searchsorted(sorted_vals, targets).clip(max=len(sorted_vals) - 1)
+        return np.where(sorted_vals[pos] == targets, order[pos], -1)
+    get = index.get
+    return [get(target, -1) for target in targets]
 
 
 @log_operation
 def extend(nums: list[int], enlarge: int) -> list[int]:
     """扩展数组长度"""
+    # 类型化数组：复制原数据后直接追加 enlarge 个 0，保持元素类型不变
+    if isinstance(nums, array):
+        res = array(nums.typecode, nums)
+        res.frombytes(bytes(enlarge * nums.itemsize))
+        return res
+    if _is_ndarray(nums):
+        res = sys.modules["numpy"].zeros(len(nums) + enlarge, dtype=nums.dtype)
+        res[: len(nums)] = nums
+        return res
+
     # 初始化一个扩展长度后的数组
     res = [0] * (len(nums) + enlarge)
-    # 将原数组中的所有元素复制到新数组
-    for i in range(len(nums)):
-        res[i] = nums[i]
+    # 将原数组中的所有元素复制到新数组（切片赋值，C 层整体复制）
+    res[: len(nums)] = nums
     # 返回扩展后的新数组
     return res
 
 
-# 调用 extend 函数
-extended_nums = extend([1, 2, 3], 3)
+@log_operation
+def copy(nums: list[int]) -> list[int]:
+    """复制数组"""
+    # NumPy 的切片是视图而非副本，需显式复制
+    if _is_ndarray(nums):
+        return nums.copy()
+    # 切片复制在 C 层一次性完成
+    return nums[:]
+
+
+if __name__ == "__main__":
+    # 创建一个包含 5 个元素的数组
+    arr = create_array(None, 5)
+
+    # 调用 random_access 函数
+    random_element = random_access([10, 20, 30, 40, 50])
+
+    # 调用 insert 函数
+    insert([1, 2, 3, 5, 6], 4, 3)
+
+    # 调用 insert_many 函数，在索引 1 和 3 处各插入一个元素
+    insert_many([1, 3, 4, 6, 7, 8], [2, 5], [1, 3])
+
+    # 调用 remove 函数
+    remove([1, 2, 3, 4, 5, 6], 2)
+
+    # 调用 remove_many 函数，删除索引 0、2、4 处的元素
+    remove_many([1, 2, 3, 4, 5, 6], [0, 2, 4])
+
+    # 调用 traverse 函数
+    total = traverse([1, 2, 3, 4, 5])
+
+    # 演示数据
+    nums = [5, 3, 7, 1, 9, 8]
+    target = 7
+
+    # 调用 find 函数
+    index = find(nums, target)
+
+    # 输出结果
+    if index != -1:
+        print(f"找到目标元素 {target} 在索引 {index}")
+    else:
+        print(f"未找到目标元素 {target}")
+
+    # 调用 find_many 函数，批量查找多个元素
+    indices = find_many(nums, [7, 9, 4])
+
+    # 调用 extend 函数
+    extended_nums = extend([1, 2, 3], 3)
+
+    # 类型化数组：每个元素占 8 字节的 int64 数组
+    typed_nums = create_array(1, 5, typecode="q")
+    print(traverse(typed_nums), find(typed_nums, 1), extend(typed_nums, 2))
+
+    # 调用 copy 函数
+    copied_nums = copy([1, 2, 3])
@@ -0,0 +1,125 @@
+from array import array
+from itertools import islice
+
+
+class DynamicArray:
+    """容量与长度分离、按倍数扩容的动态数组"""
+
+    def __init__(self, capacity: int = 10, extend_ratio: float = 2, typecode: str | None = None):
+        """构造方法
+
+        extend_ratio 为每次扩容的倍数（须大于 1）；
+        指定 typecode 时使用 array.array 紧凑存储（如 "q" 为 int64）
+        """
+        if capacity < 0:
+            raise ValueError("容量不能为负数")
+        if extend_ratio <= 1:
+            raise ValueError("扩容倍数必须大于 1")
+        self.__typecode: str | None = typecode
+        self.__nums = self.__alloc(capacity)  # 底层数组，长度即容量
+        self.__size: int = 0  # 当前元素数量
+        self.__extend_ratio: float = extend_ratio  # 每次扩容的倍数
+
+    def __alloc(self, n: int):
+        """分配 n 个元素的零值存储"""
+        if self.__typecode is None:
+            return [0] * n
+        return array(self.__typecode, bytes(n * array(self.__typecode).itemsize))
+
+    def size(self) -> int:
+        """获取数组长度（即当前元素数量）"""
+        return self.__size
+
+    def capacity(self) -> int:
+        """获取数组容量"""
+        return len(self.__nums)
+
+    def get(self, index: int) -> int:
+        """访问元素"""
+        if index < 0 or index >= self.__size:
+            raise IndexError("索引越界")
+        return self.__nums[index]
+
+    def set(self, num: int, index: int) -> None:
+        """更新元素"""
+        if index < 0 or index >= self.__size:
+            raise IndexError("索引越界")
+        self.__nums[index] = num
+
+    def append(self, num: int) -> None:
+        """尾部添加元素，均摊 O(1)"""
+        if self.__size == len(self.__nums):
+            self.extend_capacity()
+        self.__nums[self.__size] = num
+        self.__size += 1
+
+    def insert(self, num: int, index: int) -> None:
+        """在索引 index 处插入元素（index 等于长度时即为尾部添加）"""
+        if index < 0 or index > self.__size:
+            raise IndexError("索引越界")
+        if self.__size == len(self.__nums):
+            self.extend_capacity()
+        # 索引 index 以及之后的元素整体向后移动一位（切片搬移）
+        self.__nums[index + 1 : self.__size + 1] = self.__nums[index : self.__size]
+        self.__nums[index] = num
+        self.__size += 1
+
+    def remove(self, index: int) -> int:
+        """删除索引 index 处的元素并返回"""
+        if index < 0 or index >= self.__size:
+            raise IndexError("索引越界")
+        num = self.__nums[index]
+        # 索引 index 之后的元素整体向前移动一位（切片搬移）
+        self.__nums[index : self.__size - 1] = self.__nums[index + 1 : self.__size]
+        self.__size -= 1
+        # 清空空出的槽位，释放对元素的引用
+        self.__nums[self.__size] = 0
+        return num
+
+    def find(self, target: int) -> int:
+        """查找指定元素，返回首次出现的索引，不存在时返回 -1"""
+        try:
+            return self.__nums.index(target, 0, self.__size)
+        except ValueError:
+            return -1
+
+    def traverse(self) -> int:
+        """遍历数组并计算元素总和"""
+        return sum(islice(self.__nums, self.__size))
+
+    def extend_capacity(self) -> None:
+        """按扩容倍数扩大容量，在原存储上原地追加，不逐个复制元素"""
+        old = len(self.__nums)
+        new = max(old + 1, int(old * self.__extend_ratio))
+        self.__nums += self.__alloc(new - old)
+
+    def shrink_to_fit(self) -> None:
+        """把容量收缩到当前长度，释放多余的存储"""
+        del self.__nums[self.__size :]
+
+    def to_array(self) -> list[int]:
+        """返回有效长度的列表"""
+        return list(islice(self.__nums, self.__size))
+
+
+if __name__ == "__main__":
+    # 创建一个初始容量为 2、扩容倍数为 1.5 的动态数组
+    nums = DynamicArray(capacity=2, extend_ratio=1.5)
+
+    # 尾部添加元素，超出容量时自动扩容
+    for num in [1, 3, 5, 7, 9]:
+        nums.append(num)
+    print(nums.to_array(), nums.size(), nums.capacity())  # 输出: [1, 3, 5, 7, 9] 5 6
+
+    # 插入与删除元素
+    nums.insert(4, 2)
+    print(nums.to_array())  # 输出: [1, 3, 4, 5, 7, 9]
+    print(nums.remove(0))  # 输出: 1
+
+    # 查找与遍历
+    print(nums.find(7))  # 输出: 3
+    print(nums.traverse())  # 输出: 28
+
+    # 收缩容量到当前长度
+    nums.shrink_to_fit()
+    print(nums.size(), nums.capacity())  # 输出: 5 5
@@ -0,0 +1,124 @@
+import mmap
+import os
+import random
+from array import array
+
+
+class MmapArray:
+    """基于内存映射文件的只读数组
+
+    直接在二进制转储文件（如 int64 序列）上进行随机访问、查找与遍历，无需整体读入内存。
+    遍历与查找按固定大小的窗口分块映射文件，处理完一块即解除映射，
+    因此峰值常驻内存只与 chunk_size 有关，与文件大小无关
+    """
+
+    def __init__(self, path: str, typecode: str = "q", chunk_size: int = 1 << 20):
+        """构造方法，chunk_size 为每块的元素个数"""
+        if chunk_size <= 0:
+            raise ValueError("分块大小必须为正数")
+        self.__path: str = path
+        self.__typecode: str = typecode
+        self.__itemsize: int = array(typecode).itemsize
+        # 忽略文件末尾不足一个元素的字节
+        self.__size: int = os.path.getsize(path) // self.__itemsize
+        # 每块的字节数向上取整到映射粒度，保证每个窗口的偏移量满足对齐要求
+        gran = mmap.ALLOCATIONGRANULARITY
+        self.__window: int = -(-chunk_size * self.__itemsize // gran) * gran
+        self.__file = None  # 随机访问使用的文件与整体映射，首次访问时才打开
+        self.__mm: mmap.mmap | None = None
+
+    @staticmethod
+    def write(path: str, nums, typecode: str = "q") -> None:
+        """把一组数值以二进制形式写入文件，生成可被映射的转储"""
+        with open(path, "wb") as f:
+            array(typecode, nums).tofile(f)
+
+    def size(self) -> int:
+        """获取数组长度"""
+        return self.__size
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def get(self, index: int) -> int:
+        """访问索引 index 处的元素"""
+        if index < 0 or index >= self.__size:
+            raise IndexError("索引越界")
+        if self.__mm is None:
+            # 整体映射只占用虚拟地址空间，随机访问只会把用到的页调入内存
+            self.__file = open(self.__path, "rb")
+            self.__mm = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = index * self.__itemsize
+        return array(self.__typecode, self.__mm[start : start + self.__itemsize])[0]
+
+    def random_access(self) -> int:
+        """随机访问数组中的一个元素"""
+        return self.get(random.randint(0, self.__size - 1))
+
+    def chunks(self):
+        """按窗口依次产出只读的元素视图，视图在产出下一块前失效，不可留存"""
+        nbytes = self.__size * self.__itemsize
+        if nbytes == 0:
+            return
+        with open(self.__path, "rb") as f:
+            for offset in range(0, nbytes, self.__window):
+                length = min(self.__window, nbytes - offset)
+                with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as mm:
+                    # 顺序读取，提示内核提前预读
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as raw, raw.cast(self.__typecode) as view:
+                        yield view
+
+    def traverse(self) -> int:
+        """分块遍历数组并计算元素总和"""
+        count = 0
+        for view in self.chunks():
+            count += sum(view)
+        return count
+
+    def find(self, target: int) -> int:
+        """分块查找指定元素，返回首次出现的索引，不存在时返回 -1"""
+        base = 0
+        block = array(self.__typecode)
+        for view in self.chunks():
+            # 把当前块复制到一个可复用的 array 中，在 C 层查找
+            del block[:]
+            with view.cast("B") as raw:
+                block.frombytes(raw)
+            try:
+                return base + block.index(target)
+            except ValueError:
+                base += len(view)
+        return -1
+
+    def close(self) -> None:
+        """关闭随机访问使用的映射与文件"""
+        if self.__mm is not None:
+            self.__mm.close()
+            self.__file.close()
+            self.__mm = self.__file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # 生成一个包含 10 万个 int64 的二进制转储文件
+    path = os.path.join(tempfile.mkdtemp(), "nums.bin")
+    MmapArray.write(path, range(100_000))
+
+    # 以每块 4096 个元素映射文件
+    with MmapArray(path, chunk_size=4096) as nums:
+        print(nums.size())  # 输出: 100000
+        print(nums.get(12345))  # 输出: 12345
+        print(nums.random_access())  # 输出: 0 ~ 99999 之间的随机数
+        print(nums.traverse())  # 输出: 4999950000
+        print(nums.find(99999))  # 输出: 99999
+        print(nums.find(-1))  # 输出: -1
+    os.remove(path)
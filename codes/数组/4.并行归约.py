@@ -0,0 +1,157 @@
+import os
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+# 共享内存头部：8 字节的 int64，记录已找到目标的最小分块编号，用于提前取消其余分块。
+# 通过 cast("q") 的 memoryview 读写：struct.pack_into 会先把目标清零再写入，
+# 其他进程可能恰好读到 0，误以为编号更小的分块已找到目标而提前退出
+_HEADER = 8
+# 查找时每扫描这么多个元素检查一次取消标记
+_FIND_STEP = 1 << 16
+
+# 工作进程中已挂载的共享内存，按名称缓存，避免每个分块都重新映射
+_attached: dict[str, SharedMemory] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    """在工作进程中挂载共享内存"""
+    shm = _attached.get(name)
+    if shm is None:
+        shm = _attached[name] = SharedMemory(name=name)
+    return shm
+
+
+def _partial_sum(name: str, typecode: str, start: int, stop: int) -> int:
+    """工作进程：计算 [start, stop) 范围内元素的和"""
+    buf = _attach(name).buf
+    itemsize = array(typecode).itemsize
+    with buf[_HEADER + start * itemsize : _HEADER + stop * itemsize] as raw, raw.cast(typecode) as view:
+        return sum(view)
+
+
+def _partial_find(name: str, typecode: str, chunk: int, start: int, stop: int, target) -> int:
+    """工作进程：在 [start, stop) 范围内查找 target，返回索引；未找到或被取消时返回 -1"""
+    buf = _attach(name).buf
+    itemsize = array(typecode).itemsize
+    block = array(typecode)
+    with buf[:_HEADER] as header, header.cast("q") as found:
+        for lo in range(start, stop, _FIND_STEP):
+            # 已有更靠前的分块找到目标，本分块的结果不再需要
+            if found[0] < chunk:
+                return -1
+            hi = min(lo + _FIND_STEP, stop)
+            del block[:]
+            block.frombytes(buf[_HEADER + lo * itemsize : _HEADER + hi * itemsize])
+            try:
+                index = lo + block.index(target)
+            except ValueError:
+                continue
+            # 通知编号更大的分块提前结束（只会写入确实找到目标的分块编号，竞争写入不影响正确性）
+            if found[0] > chunk:
+                found[0] = chunk
+            return index
+    return -1
+
+
+class ParallelArray:
+    """放入共享内存的数组，使用进程池分块并行求和与查找
+
+    数据只在构造时复制一次到共享内存，工作进程直接挂载读取，任务参数中不传递数组本身
+    """
+
+    def __init__(self, nums, typecode: str = "q", workers: int | None = None, chunks_per_worker: int = 4):
+        """构造方法，workers 默认为 CPU 核数"""
+        self.__typecode: str = typecode
+        self.__itemsize: int = array(typecode).itemsize
+        self.__workers: int = workers or os.cpu_count() or 1
+        self.__chunks_per_worker: int = chunks_per_worker
+        data = nums if isinstance(nums, array) and nums.typecode == typecode else array(typecode, nums)
+        self.__size: int = len(data)
+        self.__shm = SharedMemory(create=True, size=_HEADER + self.__size * self.__itemsize)
+        self.__shm.buf[_HEADER : _HEADER + self.__size * self.__itemsize] = data.tobytes()
+        # concurrent.futures 的导入耗时较长，用到时才导入
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.__pool = ProcessPoolExecutor(max_workers=self.__workers)
+
+    def size(self) -> int:
+        """获取数组长度"""
+        return self.__size
+
+    def __ranges(self) -> list[tuple[int, int]]:
+        """把数组划分为若干连续分块，分块数为工作进程数的若干倍以均衡负载"""
+        n = self.__size
+        count = max(1, min(n, self.__workers * self.__chunks_per_worker))
+        bounds = [n * i // count for i in range(count + 1)]
+        return [(bounds[i], bounds[i + 1]) for i in range(count)]
+
+    def traverse(self) -> int:
+        """并行计算元素总和"""
+        name, tc = self.__shm.name, self.__typecode
+        futures = [self.__pool.submit(_partial_sum, name, tc, lo, hi) for lo, hi in self.__ranges()]
+        return sum(f.result() for f in futures)
+
+    def find(self, target) -> int:
+        """并行查找指定元素，返回最小的匹配索引，不存在时返回 -1
+
+        某个分块找到目标后，编号更大且尚未开始的分块直接取消，正在执行的分块在下次检查时退出
+        """
+        from concurrent.futures import as_completed
+
+        ranges = self.__ranges()
+        with self.__shm.buf[:_HEADER] as header, header.cast("q") as found:
+            found[0] = len(ranges)
+        name, tc = self.__shm.name, self.__typecode
+        futures = {
+            self.__pool.submit(_partial_find, name, tc, chunk, lo, hi, target): chunk
+            for chunk, (lo, hi) in enumerate(ranges)
+        }
+        best_chunk, best = len(ranges), -1
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            index = future.result()
+            chunk = futures[future]
+            if index != -1 and chunk < best_chunk:
+                best_chunk, best = chunk, index
+                for other, c in futures.items():
+                    if c > chunk:
+                        other.cancel()
+        return best
+
+    def close(self) -> None:
+        """关闭进程池并释放共享内存"""
+        self.__pool.shutdown(wait=True, cancel_futures=True)
+        self.__shm.close()
+        self.__shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def parallel_traverse(nums, workers: int | None = None, typecode: str = "q") -> int:
+    """一次性并行求和（会创建并关闭进程池，重复计算请直接使用 ParallelArray）"""
+    with ParallelArray(nums, typecode, workers) as arr:
+        return arr.traverse()
+
+
+def parallel_find(nums, target, workers: int | None = None, typecode: str = "q") -> int:
+    """一次性并行查找（会创建并关闭进程池，重复查找请直接使用 ParallelArray）"""
+    with ParallelArray(nums, typecode, workers) as arr:
+        return arr.find(target)
+
+
+if __name__ == "__main__":
+    nums = list(range(1_000_000))
+
+    # 创建一个 4 进程的并行数组
+    with ParallelArray(nums, workers=4) as arr:
+        print(arr.traverse())  # 输出: 499999500000
+        print(arr.find(765432))  # 输出: 765432
+        print(arr.find(-1))  # 输出: -1
+
+    # 一次性调用
+    print(parallel_find([5, 3, 7, 1, 9, 8, 7], 7, workers=2))  # 输出: 2
@@ -1,22 +1,201 @@
 # !/usr/bin/env python
 # -*- coding:utf-8 -*-
-import time
-import pprint
+import atexit
+import os
+import sys
+from array import array
+from bisect import bisect_right
 from functools import wraps
+from time import perf_counter_ns
+
+VERBOSE = "verbose"  # 打印横幅与返回结果（默认）
+SILENT = "silent"  # 只计时并记录到直方图，不格式化返回结果
+
+# 可通过环境变量 LOG_OPERATION_MODE 设置初始模式
+_mode: str = os.environ.get("LOG_OPERATION_MODE", VERBOSE)
+
+# 直方图分桶：小于 16 ns 的耗时每纳秒一个桶，之后每个 2 的幂区间等分为 8 个子桶（相对误差不超过 12.5%）
+_SUB_BITS = 3
+_EXACT = 1 << (_SUB_BITS + 1)  # 16
+_BUCKETS = ((64 - _SUB_BITS - 1) << _SUB_BITS) + _EXACT  # 覆盖 64 位耗时所需的桶数
+_FLUSH_AT = 1024  # 每个函数最多缓存的未分桶样本数
+
+
+def _bucket_index(ns: int) -> int:
+    """耗时所在桶的编号"""
+    n = ns.bit_length()
+    return ns if n <= _SUB_BITS + 1 else ((n - _SUB_BITS - 1) << _SUB_BITS) + (ns >> (n - _SUB_BITS - 1))
+
+
+def _bucket_upper(index: int) -> int:
+    """桶内可能的最大耗时"""
+    if index < _EXACT:
+        return index
+    shift = (index >> _SUB_BITS) - 1
+    top = (index & ((1 << _SUB_BITS) - 1)) | (1 << _SUB_BITS)
+    return ((top + 1) << shift) - 1
+
+
+class _Histogram:
+    """单个函数的耗时直方图：固定数量的对数分桶加上累计的总耗时、最小值与最大值
+
+    新样本先追加到容量有限的缓冲区，攒满 _FLUSH_AT 个后排序并批量计入分桶，
+    因此每次调用只多一次追加和长度判断，占用内存也不随调用次数增长
+    """
+
+    __slots__ = ("buckets", "pending", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets = array("q", [0]) * _BUCKETS
+        self.pending = array("q")  # 尚未计入分桶的样本
+        self.reset()
+
+    def reset(self) -> None:
+        # 原地清空，log_operation 的闭包持有 pending 的引用
+        self.buckets = array("q", [0]) * _BUCKETS
+        del self.pending[:]
+        self.total: int = 0
+        self.min: int = sys.maxsize
+        self.max: int = 0
+
+    def record(self, ns: int) -> None:
+        self.pending.append(ns)
+        if len(self.pending) >= _FLUSH_AT:
+            self.flush()
+
+    def flush(self) -> None:
+        """把缓冲区中的样本计入分桶：排序后每个非空桶只需一次二分查找"""
+        if not self.pending:
+            return
+        ordered = sorted(self.pending)
+        del self.pending[:]
+        self.total += sum(ordered)
+        self.min = min(self.min, ordered[0])
+        self.max = max(self.max, ordered[-1])
+        i, n = 0, len(ordered)
+        while i < n:
+            index = _bucket_index(ordered[i])
+            j = bisect_right(ordered, _bucket_upper(index), i)
+            self.buckets[index] += j - i
+            i = j
+
+    def count(self) -> int:
+        return sum(self.buckets)
+
+    def percentile(self, p: float) -> int:
+        """最近秩法计算百分位数，返回所在桶的上界（不超过实际最大值）"""
+        rank = max(1, -(-self.count() * p // 100))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return max(self.min, min(_bucket_upper(index), self.max))
+        return self.max
+
+
+# 每个函数一个耗时直方图（纳秒），按 "模块.函数名" 索引
+_histograms: dict[str, _Histogram] = {}
+
+
+def set_mode(mode: str) -> None:
+    """切换 log_operation 的运行模式"""
+    global _mode
+    if mode not in (VERBOSE, SILENT):
+        raise ValueError(f"未知模式：{mode}")
+    _mode = mode
+
+
+def get_mode() -> str:
+    """获取 log_operation 的运行模式"""
+    return _mode
 
 
 def log_operation(func):
+    key = f"{func.__module__}.{func.__qualname__}"
+    hist = _histograms.setdefault(key, _Histogram())
+    pending = hist.pending
+    record = pending.append
+
     @wraps(func)
     def wrapper(*args, **kwargs):
+        if _mode == SILENT:
+            # 静默模式：只计时，不打印，不格式化结果
+            start = perf_counter_ns()
+            result = func(*args, **kwargs)
+            record(perf_counter_ns() - start)
+            if len(pending) >= _FLUSH_AT:
+                hist.flush()
+            return result
+        import pprint  # 仅在打印模式下才需要，避免拖慢导入
+
         print(f"================ {func.__name__} 函数 开始执行 ================")
-        start_time = time.time()  # 记录开始时间
+        start = perf_counter_ns()  # 记录开始时间
         result = func(*args, **kwargs)
-        end_time = time.time()  # 记录结束时间
-        runtime = end_time - start_time  # 计算运行时间
+        elapsed = perf_counter_ns() - start  # 计算运行时间
+        hist.record(elapsed)
         print(f"================ {func.__name__} 函数 结束执行================")
         pprint.pprint(result)
-        print(f"{func.__name__} 函数运行时间：{runtime:.4f}秒")
+        print(f"{func.__name__} 函数运行时间：{elapsed / 1e9:.4f}秒")
         print(f"================ {func.__name__} 函数 返回结果================")
         return result
 
     return wrapper
+
+
+def get_stats() -> dict[str, dict[str, int]]:
+    """汇总每个函数的耗时直方图（单位：纳秒），p50 / p99 为所在桶的上界，相对误差不超过 12.5%"""
+    stats = {}
+    for key, hist in _histograms.items():
+        hist.flush()
+        count = hist.count()
+        if not count:
+            continue
+        stats[key] = {
+            "count": count,
+            "min": hist.min,
+            "p50": hist.percentile(50),
+            "p99": hist.percentile(99),
+            "max": hist.max,
+            "total": hist.total,
+        }
+    return stats
+
+
+def reset_stats() -> None:
+    """清空已记录的耗时统计"""
+    for hist in _histograms.values():
+        hist.reset()
+
+
+def format_summary() -> str:
+    """将耗时统计格式化为文本表格"""
+    header = f"{'函数':<40} {'次数':>10} {'min(ns)':>12} {'p50(ns)':>12} {'p99(ns)':>12} {'总计(ms)':>12}"
+    lines = [header]
+    for key, s in sorted(get_stats().items()):
+        lines.append(
+            f"{key:<40} {s['count']:>10} {s['min']:>12} {s['p50']:>12} "
+            f"{s['p99']:>12} {s['total'] / 1e6:>12.3f}"
+        )
+    return "\n".join(lines)
+
+
+def dump_stats(path: str | None = None, fmt: str = "summary") -> None:
+    """输出耗时统计，fmt 为 "summary"（文本表格）或 "json"，path 为空时写到标准错误"""
+    if fmt == "json":
+        import json
+
+        text = json.dumps(get_stats(), ensure_ascii=False, indent=2)
+    elif fmt == "summary":
+        text = format_summary()
+    else:
+        raise ValueError(f"未知格式：{fmt}")
+    if path is None:
+        print(text, file=sys.stderr)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+def dump_stats_at_exit(path: str | None = None, fmt: str = "summary") -> None:
+    """注册退出钩子，在解释器退出时输出耗时统计"""
+    atexit.register(dump_stats, path, fmt)
@@ -4,18 +4,52 @@ class Stack:
 
     def is_empty(self):
         """检查栈是否为空"""
-        return len(self.stack) == 0
+        return not self.stack
+
+    def __len__(self):
+        return len(self.stack)
+
+    def __bool__(self):
+        return bool(self.stack)
+
+    def __iter__(self):
+        """从栈顶到栈底遍历元素（不出栈）"""
+        return reversed(self.stack)
 
     def push(self, data):
         """向栈中添加元素"""
         self.stack.append(data)
 
+    def push_many(self, iterable):
+        """依次将多个元素入栈，最后一个元素位于栈顶"""
+        self.stack.extend(iterable)
+
     def pop(self):
         """从栈中移除元素"""
         if self.is_empty():
             raise Exception("Stack is empty")
         return self.stack.pop()
 
+    def pop_many(self, k):
+        """弹出 k 个元素，按出栈顺序（栈顶在前）返回列表"""
+        if k < 0:
+            raise ValueError("k 不能为负数")
+        if k > len(self.stack):
+            raise Exception("Stack is empty")
+        if k == 0:
+            return []
+        # 切片一次取出栈顶的 k 个元素，再整体删除
+        items = self.stack[-k:]
+        del self.stack[-k:]
+        items.reverse()
+        return items
+
+    def drain(self):
+        """逐个弹出并产出全部元素，直到栈为空"""
+        pop = self.stack.pop
+        while self.stack:
+            yield pop()
+
     def peek(self):
         """获取栈顶元素"""
         if self.is_empty():
@@ -23,18 +57,26 @@ class Stack:
         return self.stack[-1]
 
 
-# 创建一个栈
-stack = Stack()
+if __name__ == "__main__":
+    # 创建一个栈
+    stack = Stack()
+
+    # 向栈中添加元素
+    stack.push(1)
+    stack.push(2)
+    stack.push(3)
 
-# 向栈中添加元素
-stack.push(1)
-stack.push(2)
-stack.push(3)
+    # 获取栈顶元素
+    print(stack.peek())  # 输出: 3
 
-# 获取栈顶元素
-print(stack.peek())  # 输出: 3
+    # 从栈中移除元素
+    print(stack.pop())  # 输出: 3
+    print(stack.pop())  # 输出: 2
+    print(stack.pop())  # 输出: 1
 
-# 从栈中移除元素
-print(stack.pop())  # 输出: 3
-print(stack.pop())  # 输出: 2
-print(stack.pop())  # 输出: 1
+    # 批量入栈与出栈
+    stack.push_many([4, 5, 6, 7])
+    print(len(stack), list(stack))  # 输出: 4 [7, 6, 5, 4]
+    print(stack.pop_many(2))  # 输出: [7, 6]
+    print(list(stack.drain()))  # 输出: [5, 4]
+    print(bool(stack))  # 输出: False
@@ -1,31 +1,88 @@
 class Node:
+    # 使用 __slots__，每个节点不再携带 __dict__
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class Stack:
-    def __init__(self):
+    def __init__(self, pool_size: int = 0):
+        """构造方法，pool_size 为空闲节点池的容量上限（0 表示不复用节点）"""
         self.top = None
+        self.__size: int = 0  # 栈的长度
+        # 出栈的节点通过 next 串成空闲链表，入栈时优先复用，减少分配与 GC 压力
+        self.__free: Node | None = None
+        self.__free_size: int = 0
+        self.__pool_size: int = pool_size
 
     def is_empty(self):
         """检查栈是否为空"""
         return self.top is None
 
+    def __len__(self):
+        return self.__size
+
+    def __bool__(self):
+        return self.top is not None
+
+    def __iter__(self):
+        """从栈顶到栈底遍历元素（不出栈）"""
+        node = self.top
+        while node is not None:
+            yield node.data
+            node = node.next
+
     def push(self, data):
         """向栈中添加元素"""
-        new_node = Node(data)
+        new_node = self.__free
+        if new_node is not None:
+            # 从空闲链表取出一个节点复用
+            self.__free = new_node.next
+            self.__free_size -= 1
+            new_node.data = data
+        else:
+            new_node = Node(data)
         new_node.next = self.top
         self.top = new_node
+        self.__size += 1
+
+    def push_many(self, iterable):
+        """依次将多个元素入栈，最后一个元素位于栈顶"""
+        for data in iterable:
+            self.push(data)
 
     def pop(self):
         """从栈中移除元素"""
         if self.is_empty():
             raise Exception("Stack is empty")
-        data = self.top.data
-        self.top = self.top.next
+        node = self.top
+        data = node.data
+        self.top = node.next
+        self.__size -= 1
+        if self.__free_size < self.__pool_size:
+            # 放回空闲链表，并清除对元素的引用
+            node.data = None
+            node.next = self.__free
+            self.__free = node
+            self.__free_size += 1
         return data
 
+    def pop_many(self, k):
+        """弹出 k 个元素，按出栈顺序（栈顶在前）返回列表"""
+        if k < 0:
+            raise ValueError("k 不能为负数")
+        if k > self.__size:
+            raise Exception("Stack is empty")
+        pop = self.pop
+        return [pop() for _ in range(k)]
+
+    def drain(self):
+        """逐个弹出并产出全部元素，直到栈为空"""
+        while self.top is not None:
+            yield self.pop()
+
     def peek(self):
         """获取栈顶元素"""
         if self.is_empty():
@@ -33,18 +90,34 @@ class Stack:
         return self.top.data
 
 
-# 创建一个栈
-stack = Stack()
+if __name__ == "__main__":
+    # 创建一个栈
+    stack = Stack()
+
+    # 向栈中添加元素
+    stack.push(1)
+    stack.push(2)
+    stack.push(3)
+
+    # 获取栈顶元素
+    print(stack.peek())  # 输出: 3
 
-# 向栈中添加元素
-stack.push(1)
-stack.push(2)
-stack.push(3)
+    # 从栈中移除元素
+    print(stack.pop())  # 输出: 3
+    print(stack.pop())  # 输出: 2
+    print(stack.pop())  # 输出: 1
 
-# 获取栈顶元素
-print(stack.peek())  # 输出: 3
+    # 创建一个最多缓存 2 个空闲节点的栈，出栈的节点会在下次入栈时复用
+    pooled = Stack(pool_size=2)
+    pooled.push(1)
+    pooled.push(2)
+    pooled.pop()
+    pooled.push(3)  # 复用刚出栈的节点
+    print(pooled.peek())  # 输出: 3
 
-# 从栈中移除元素
-print(stack.pop())  # 输出: 3
-print(stack.pop())  # 输出: 2
-print(stack.pop())  # 输出: 1
+    # 批量入栈与出栈
+    pooled.push_many([4, 5, 6])
+    print(len(pooled), list(pooled))  # 输出: 5 [6, 5, 4, 3, 1]
+    print(pooled.pop_many(2))  # 输出: [6, 5]
+    print(list(pooled.drain()))  # 输出: [4, 3, 1]
+    print(bool(pooled))  # 输出: False
@@ -0,0 +1,235 @@
+import threading
+from queue import Empty, Full
+from time import monotonic
+
+from codes.array_stack import Stack
+from codes.async_waiters import AsyncWaiters
+
+
+class ConcurrentStack(Stack):
+    """线程安全的有界栈，基于数组实现的栈
+
+    push / pop 支持阻塞与超时：block=False 时立即返回，否则最多等待 timeout 秒，
+    超时后分别抛出 queue.Full / queue.Empty
+    """
+
+    def __init__(self, capacity: int | None = None):
+        """构造方法，capacity 为 None 表示不限容量"""
+        super().__init__()
+        if capacity is not None and capacity <= 0:
+            raise ValueError("容量必须为正数")
+        self.capacity = capacity
+        self.__lock = threading.Lock()
+        # 两个条件变量共享同一把锁，分别等待“非空”与“未满”
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+        # 正在等待的 push_many / pop_many 个数；它们需要多个空位 / 元素，被单独唤醒时可能无法继续
+        self.__batch_waiters: int = 0
+
+    def is_empty(self):
+        """检查栈是否为空"""
+        with self.__lock:
+            return not self.stack
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.stack)
+
+    def __bool__(self):
+        with self.__lock:
+            return bool(self.stack)
+
+    def __iter__(self):
+        """在锁内拍下快照，从栈顶到栈底遍历"""
+        with self.__lock:
+            return iter(self.stack[::-1])
+
+    def __wait(self, cond: threading.Condition, ready, block: bool, timeout: float | None) -> bool:
+        """在已持有锁的前提下等待 ready() 成立，返回是否等到"""
+        if ready():
+            return True
+        if not block:
+            return False
+        if timeout is None:
+            while not ready():
+                cond.wait()
+            return True
+        deadline = monotonic() + timeout
+        while not ready():
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return False
+            cond.wait(remaining)
+        return True
+
+    def __wait_batch(self, cond: threading.Condition, ready, block: bool, timeout: float | None) -> bool:
+        """整批操作的等待，等待期间计入 __batch_waiters"""
+        self.__batch_waiters += 1
+        try:
+            return self.__wait(cond, ready, block, timeout)
+        finally:
+            self.__batch_waiters -= 1
+
+    def __notify(self, cond: threading.Condition, n: int = 1) -> None:
+        """唤醒等待者
+
+        有整批操作在等待时唤醒全部：notify 可能恰好唤醒条件仍不满足的整批等待者，
+        它重新睡眠后这次通知就丢失了，排在后面本可以继续的单个等待者会一直阻塞
+        """
+        if self.__batch_waiters:
+            cond.notify_all()
+        else:
+            cond.notify(n)
+
+    def __has_room(self, n: int = 1) -> bool:
+        return self.capacity is None or len(self.stack) + n <= self.capacity
+
+    def push(self, data, block: bool = True, timeout: float | None = None):
+        """向栈中添加元素，栈满时按 block / timeout 等待"""
+        with self.__not_full:
+            if not self.__wait(self.__not_full, self.__has_room, block, timeout):
+                raise Full("Stack is full")
+            self.stack.append(data)
+            self.__notify(self.__not_empty)
+
+    def pop(self, block: bool = True, timeout: float | None = None):
+        """从栈中移除元素，栈空时按 block / timeout 等待"""
+        with self.__not_empty:
+            if not self.__wait(self.__not_empty, self.__has_items, block, timeout):
+                raise Empty("Stack is empty")
+            data = self.stack.pop()
+            self.__notify(self.__not_full)
+            return data
+
+    def __has_items(self) -> bool:
+        return bool(self.stack)
+
+    def peek(self):
+        """获取栈顶元素"""
+        with self.__lock:
+            # 不调用 super().peek()：其中的 is_empty 会再次获取（不可重入的）锁
+            if not self.stack:
+                raise Exception("Stack is empty")
+            return self.stack[-1]
+
+    def push_many(self, iterable, block: bool = True, timeout: float | None = None):
+        """整批入栈：等到有足够空间后一次性放入，批量大于容量时抛出 ValueError"""
+        items = list(iterable)
+        if self.capacity is not None and len(items) > self.capacity:
+            raise ValueError("批量大小超过栈的容量")
+        with self.__not_full:
+            if not self.__wait_batch(self.__not_full, lambda: self.__has_room(len(items)), block, timeout):
+                raise Full("Stack is full")
+            self.stack.extend(items)
+            self.__notify(self.__not_empty, len(items))
+
+    def pop_many(self, k, block: bool = True, timeout: float | None = None):
+        """整批出栈：等到至少有 k 个元素后一次性弹出，按出栈顺序返回"""
+        if self.capacity is not None and k > self.capacity:
+            raise ValueError("批量大小超过栈的容量")
+        with self.__not_empty:
+            if not self.__wait_batch(self.__not_empty, lambda: len(self.stack) >= k, block, timeout):
+                raise Empty("Stack is empty")
+            items = super().pop_many(k)
+            self.__notify(self.__not_full, k)
+            return items
+
+    def drain(self):
+        """逐个弹出并产出当前全部元素，栈空时结束（不等待新元素）"""
+        while True:
+            try:
+                yield self.pop(block=False)
+            except Empty:
+                return
+
+
+class AsyncStack:
+    """用于 asyncio 的有界栈，push / pop 可 await，栈满时 push 挂起形成背压
+
+    只能在同一个事件循环中使用（不是线程安全的），超时可配合 asyncio.wait_for。
+    asyncio 的导入耗时较长，在第一次需要挂起时才导入，导入本模块不会连带导入 asyncio
+    """
+
+    def __init__(self, capacity: int | None = None):
+        """构造方法，capacity 为 None 表示不限容量"""
+        if capacity is not None and capacity <= 0:
+            raise ValueError("容量必须为正数")
+        self.capacity = capacity
+        self.__stack = Stack()
+        # 等待出栈 / 入栈的协程
+        self.__getters = AsyncWaiters()
+        self.__putters = AsyncWaiters()
+
+    def __len__(self):
+        return len(self.__stack)
+
+    def is_empty(self):
+        """检查栈是否为空"""
+        return self.__stack.is_empty()
+
+    def full(self) -> bool:
+        """检查栈是否已满"""
+        return self.capacity is not None and len(self.__stack) >= self.capacity
+
+    async def push(self, data):
+        """向栈中添加元素，栈满时等待"""
+        await self.__putters.wait(self.full)
+        self.push_nowait(data)
+
+    async def pop(self):
+        """从栈中移除元素，栈空时等待"""
+        await self.__getters.wait(self.is_empty)
+        return self.pop_nowait()
+
+    def push_nowait(self, data):
+        """立即入栈，栈满时抛出 queue.Full"""
+        if self.full():
+            raise Full("Stack is full")
+        self.__stack.push(data)
+        self.__getters.wakeup_next()
+
+    def pop_nowait(self):
+        """立即出栈，栈空时抛出 queue.Empty"""
+        if self.__stack.is_empty():
+            raise Empty("Stack is empty")
+        data = self.__stack.pop()
+        self.__putters.wakeup_next()
+        return data
+
+    def peek(self):
+        """获取栈顶元素"""
+        return self.__stack.peek()
+
+
+if __name__ == "__main__":
+    # 线程安全的有界栈
+    stack = ConcurrentStack(capacity=2)
+    stack.push(1)
+    stack.push(2)
+    try:
+        stack.push(3, timeout=0.1)  # 栈已满，等待 0.1 秒后抛出 queue.Full
+    except Full as e:
+        print(e)  # 输出: Stack is full
+
+    # 另一个线程出栈后，阻塞中的 push 得以继续
+    threading.Timer(0.1, stack.pop).start()
+    stack.push(3)
+    print(list(stack))  # 输出: [3, 1]
+
+    # asyncio 中的有界栈：生产者在栈满时挂起，直到消费者取走元素
+    import asyncio
+
+    async def main():
+        astack = AsyncStack(capacity=2)
+
+        async def producer():
+            for i in range(5):
+                await astack.push(i)
+
+        async def consumer():
+            return [await astack.pop() for _ in range(5)]
+
+        _, popped = await asyncio.gather(producer(), consumer())
+        print(sorted(popped))  # 输出: [0, 1, 2, 3, 4]
+
+    asyncio.run(main())
@@ -7,28 +7,80 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None  # 尾节点，使尾部插入为 O(1)
+        self.__size = 0  # 链表长度
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        """从头到尾遍历节点数据"""
+        cur = self.head
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    def _new_node(self, data):
+        """创建节点，子类可覆盖以使用其他节点类型"""
+        return Node(data)
+
+    def _unlink(self, prev, node):
+        """从链表中摘除 node，prev 为其前驱节点（node 为头节点时为 None）"""
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        # 删除的是尾节点时，尾指针前移
+        if node is self.tail:
+            self.tail = prev
+        self.__size -= 1
 
     def insert(self, data):
-        """插入新的节点"""
+        """插入新的节点（尾部）"""
+        node = self._new_node(data)
         if not self.head:
-            self.head = Node(data)
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.__size += 1
+
+    def extend(self, iterable):
+        """依次在尾部插入多个节点"""
+        for data in iterable:
+            self.insert(data)
+
+    def insert_at(self, index, data):
+        """在索引 index 处插入新的节点，index 等于长度时即为尾部插入"""
+        if index < 0 or index > self.__size:
+            raise IndexError("索引越界")
+        if index == self.__size:
+            self.insert(data)
+            return
+        node = self._new_node(data)
+        if index == 0:
+            node.next = self.head
+            self.head = node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = Node(data)
+            # 找到索引 index - 1 处的节点，将新节点接在其后
+            prev = self.head
+            for _ in range(index - 1):
+                prev = prev.next
+            node.next = prev.next
+            prev.next = node
+        self.__size += 1
 
     def delete(self, data):
         """删除一个节点"""
         if self.head is None:
             return
         if self.head.data == data:
-            self.head = self.head.next
+            self._unlink(None, self.head)
             return
         cur = self.head
         while cur.next:
             if cur.next.data == data:
-                cur.next = cur.next.next
+                self._unlink(cur, cur.next)
                 return
             cur = cur.next
 
@@ -50,18 +102,24 @@ class LinkedList:
         print()
 
 
-# 创建一个链表并插入节点
-linked_list = LinkedList()
-linked_list.insert(1)
-linked_list.insert(2)
-linked_list.insert(3)
-linked_list.insert(4)
+if __name__ == "__main__":
+    # 创建一个链表并插入节点
+    linked_list = LinkedList()
+    linked_list.insert(1)
+    linked_list.insert(2)
+    linked_list.insert(3)
+    linked_list.insert(4)
+
+    # 打印链表
+    linked_list.print_list()  # 输出: 1 2 3 4
 
-# 打印链表
-linked_list.print_list()  # 输出: 1 2 3 4
+    # 删除节点
+    linked_list.delete(3)
 
-# 删除节点
-linked_list.delete(3)
+    # 再次打印链表
+    linked_list.print_list()  # 输出: 1 2 4
 
-# 再次打印链表
-linked_list.print_list()  # 输出: 1 2 4
+    # 批量插入、按索引插入与遍历
+    linked_list.extend([5, 6])
+    linked_list.insert_at(2, 3)
+    print(len(linked_list), list(linked_list))  # 输出: 6 [1, 2, 3, 4, 5, 6]
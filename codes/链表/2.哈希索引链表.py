@@ -0,0 +1,117 @@
+from collections import deque
+
+from codes.linked_list import LinkedList, Node
+
+
+class DNode(Node):
+    """双向链表节点，在 Node 的基础上增加前驱指针"""
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.prev = None
+
+
+class IndexedLinkedList(LinkedList):
+    """带哈希索引的链表：按插入顺序保存元素，按值查找与删除均为 O(1)
+
+    索引为 值 -> 节点 的字典（值必须可哈希），配合双向节点，删除时无需从头遍历寻找前驱。
+    存在重复值时，索引为该值保存按链表顺序排列的节点队列，find / delete 与 LinkedList 一样作用于链表中的第一个节点
+    """
+
+    def __init__(self):
+        super().__init__()
+        # 值唯一时直接保存节点；出现重复值后改为按链表顺序排列的节点双向队列
+        self.__index: dict = {}
+
+    def _new_node(self, data):
+        return DNode(data)
+
+    def __index_add(self, node: DNode, rank: int | None = None):
+        """把节点登记到索引，rank 为它在同值节点中的次序，None 表示排在最后"""
+        entry = self.__index.get(node.data)
+        if entry is None:
+            self.__index[node.data] = node
+            return
+        if not isinstance(entry, deque):
+            entry = self.__index[node.data] = deque((entry,))
+        if rank is None:
+            entry.append(node)
+        else:
+            entry.insert(rank, node)
+
+    def __index_first(self, data) -> DNode | None:
+        """取出索引中该值在链表中的第一个节点"""
+        entry = self.__index.get(data)
+        if isinstance(entry, deque):
+            return entry[0]
+        return entry
+
+    def __index_remove_first(self, data):
+        """把该值的第一个节点从索引中移除，O(1)"""
+        entry = self.__index[data]
+        if isinstance(entry, deque):
+            entry.popleft()
+            if len(entry) == 1:
+                self.__index[data] = entry[0]
+        else:
+            del self.__index[data]
+
+    def __contains__(self, data):
+        return data in self.__index
+
+    def insert(self, data):
+        """插入新的节点（尾部）"""
+        prev = self.tail
+        super().insert(data)
+        self.tail.prev = prev
+        self.__index_add(self.tail)
+
+    def insert_at(self, index, data):
+        """在索引 index 处插入新的节点"""
+        if index == len(self):
+            self.insert(data)
+            return
+        super().insert_at(index, data)
+        # 定位新插入的节点；它插在原节点之前，原节点的前驱即为它的前驱
+        # 值已存在时顺带数出排在它前面的同值节点个数，使索引中的节点保持链表顺序
+        duplicated = data in self.__index
+        rank = 0
+        node = self.head
+        for _ in range(index):
+            if duplicated and node.data == data:
+                rank += 1
+            node = node.next
+        node.prev = node.next.prev
+        node.next.prev = node
+        self.__index_add(node, rank if duplicated else None)
+
+    def delete(self, data):
+        """删除一个节点，O(1)"""
+        node = self.__index_first(data)
+        if node is None:
+            return
+        self._unlink(node.prev, node)
+        if node.next is not None:
+            node.next.prev = node.prev
+        self.__index_remove_first(data)
+        node.prev = node.next = None
+
+    def find(self, data):
+        """查找数据的第一个节点，O(1)"""
+        return self.__index_first(data)
+
+
+if __name__ == "__main__":
+    # 创建一个带哈希索引的链表，作为按插入顺序保存的注册表
+    registry = IndexedLinkedList()
+    registry.extend(["a", "b", "c", "d"])
+    registry.insert_at(1, "x")
+    registry.print_list()  # 输出: a x b c d
+
+    # 按值查找与删除，无需遍历
+    print(registry.find("c").data)  # 输出: c
+    print("b" in registry)  # 输出: True
+    registry.delete("b")
+    registry.delete("d")
+    registry.print_list()  # 输出: a x c
+    print(len(registry), registry.tail.data)  # 输出: 3 c
@@ -0,0 +1,170 @@
+from itertools import islice
+
+
+class UnrolledNode:
+    """展开链表节点：一个节点保存至多 capacity 个元素"""
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None):
+        self.items = [] if items is None else items
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """展开链表（unrolled linked list）
+
+    与 LinkedList 的接口一致，但每个节点保存一小段连续的元素：节点数约为 n / capacity，
+    节省了每个元素一个 Node 对象的开销，遍历时也只需每 capacity 个元素跳转一次指针。
+    节点满时一分为二；删除后若节点不足半满，与后继节点合并或从后继借入元素
+    """
+
+    def __init__(self, capacity: int = 64):
+        """构造方法，capacity 为每个节点最多保存的元素个数"""
+        if capacity < 2:
+            raise ValueError("节点容量至少为 2")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.__size = 0
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        """从头到尾遍历数据"""
+        cur = self.head
+        while cur:
+            yield from cur.items
+            cur = cur.next
+
+    def insert(self, data):
+        """在尾部插入数据"""
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode()
+        elif len(self.tail.items) >= self.capacity:
+            # 尾节点已满时直接新开一个节点，顺序追加的节点保持满载
+            self.tail.next = UnrolledNode()
+            self.tail = self.tail.next
+        self.tail.items.append(data)
+        self.__size += 1
+
+    def extend(self, iterable):
+        """在尾部批量插入数据，每次填满一个节点"""
+        it = iter(iterable)
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode()
+        before = len(self.tail.items)
+        self.tail.items.extend(islice(it, self.capacity - before))
+        self.__size += len(self.tail.items) - before
+        while True:
+            items = list(islice(it, self.capacity))
+            if not items:
+                break
+            self.tail.next = UnrolledNode(items)
+            self.tail = self.tail.next
+            self.__size += len(items)
+        # 输入为空且链表原本为空时，不保留空节点
+        if self.__size == 0:
+            self.head = self.tail = None
+
+    def insert_at(self, index, data):
+        """在索引 index 处插入数据，index 等于长度时即为尾部插入"""
+        if index < 0 or index > self.__size:
+            raise IndexError("索引越界")
+        if index == self.__size:
+            self.insert(data)
+            return
+        # 跳过整个节点定位到目标节点
+        node = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            node = node.next
+        if len(node.items) >= self.capacity:
+            self.__split(node)
+            if index >= len(node.items):
+                index -= len(node.items)
+                node = node.next
+        node.items.insert(index, data)
+        self.__size += 1
+
+    def __split(self, node: UnrolledNode):
+        """把满节点的后一半移到新节点中"""
+        half = len(node.items) // 2
+        new = UnrolledNode(node.items[half:])
+        del node.items[half:]
+        new.next = node.next
+        node.next = new
+        if node is self.tail:
+            self.tail = new
+
+    def delete(self, data):
+        """删除第一个等于 data 的元素"""
+        prev, node = None, self.head
+        while node:
+            if data in node.items:
+                node.items.remove(data)
+                self.__size -= 1
+                self.__rebalance(prev, node)
+                return
+            prev, node = node, node.next
+
+    def __rebalance(self, prev, node: UnrolledNode):
+        """删除后维持节点至少半满：与后继合并，或从后继借入元素"""
+        half = self.capacity // 2
+        if len(node.items) >= half:
+            return
+        nxt = node.next
+        if nxt is None:
+            # 尾节点允许不足半满，空了则摘除
+            if not node.items:
+                if prev is None:
+                    self.head = self.tail = None
+                else:
+                    prev.next = None
+                    self.tail = prev
+            return
+        if len(node.items) + len(nxt.items) <= self.capacity:
+            node.items.extend(nxt.items)
+            node.next = nxt.next
+            if nxt is self.tail:
+                self.tail = node
+        else:
+            borrow = half - len(node.items)
+            node.items.extend(nxt.items[:borrow])
+            del nxt.items[:borrow]
+
+    def find(self, data):
+        """查找数据所在的节点"""
+        cur = self.head
+        while cur:
+            if data in cur.items:
+                return cur  # 返回包含该数据的节点
+            cur = cur.next
+        return None  # 如果没有找到，返回 None
+
+    def print_list(self):
+        """打印链表"""
+        for data in self:
+            print(data, end=" ")
+        print()
+
+
+if __name__ == "__main__":
+    # 创建一个展开链表，每个节点最多保存 4 个元素
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(1, 11))
+    unrolled.print_list()  # 输出: 1 2 3 4 5 6 7 8 9 10
+
+    # 在满节点中插入，节点一分为二
+    unrolled.insert_at(2, 99)
+    print(unrolled.head.items, unrolled.head.next.items)  # 输出: [1, 2] [99, 3, 4]
+
+    # 删除后节点不足半满时与后继合并
+    unrolled.delete(99)
+    unrolled.delete(1)
+    unrolled.print_list()  # 输出: 2 3 4 5 6 7 8 9 10
+    print(unrolled.head.items)  # 输出: [2, 3, 4]
+
+    # 查找返回包含该数据的节点
+    print(unrolled.find(6).items, len(unrolled))  # 输出: [5, 6, 7, 8] 9
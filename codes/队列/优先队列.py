@@ -0,0 +1,171 @@
+class PriorityQueue:
+    """基于数组的 d 叉小顶堆实现的优先队列
+
+    堆用两个并行数组保存元素与优先级，另有 元素 -> 堆中位置 的索引（元素须可哈希且互不相同），
+    因此除了 push / pop / peek 外，还能在 O(log n) 内修改任意元素的优先级（decrease_key / update）
+    或删除任意元素（remove）。d 越大树越矮，上浮更快，下沉时每层需比较的子节点更多
+    """
+
+    def __init__(self, d: int = 4) -> None:
+        """构造方法，d 为每个节点的子节点个数"""
+        if d < 2:
+            raise ValueError("d 至少为 2")
+        self.__d: int = d
+        self.__items: list = []  # 堆中的元素
+        self.__priorities: list = []  # 与 __items 一一对应的优先级
+        self.__index: dict = {}  # 元素 -> 在堆数组中的位置
+
+    def size(self) -> int:
+        """获取队列的长度"""
+        return len(self.__items)
+
+    def is_empty(self) -> bool:
+        """判断队列是否为空"""
+        return not self.__items
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, item):
+        return item in self.__index
+
+    def push(self, item, priority) -> None:
+        """入队，优先级越小越先出队"""
+        if item in self.__index:
+            raise ValueError("元素已在队列中")
+        self.__items.append(item)
+        self.__priorities.append(priority)
+        self.__sift_up(len(self.__items) - 1)
+
+    def peek(self):
+        """访问优先级最小的元素"""
+        if not self.__items:
+            raise IndexError("队列为空")
+        return self.__items[0]
+
+    def peek_priority(self):
+        """访问最小的优先级"""
+        if not self.__items:
+            raise IndexError("队列为空")
+        return self.__priorities[0]
+
+    def pop(self):
+        """出队，返回优先级最小的元素"""
+        if not self.__items:
+            raise IndexError("队列为空")
+        item = self.__items[0]
+        del self.__index[item]
+        # 用最后一个元素填补堆顶，再向下调整
+        last, priority = self.__items.pop(), self.__priorities.pop()
+        if self.__items:
+            self.__items[0] = last
+            self.__priorities[0] = priority
+            self.__sift_down(0)
+        return item
+
+    def priority(self, item):
+        """获取元素的优先级"""
+        return self.__priorities[self.__index[item]]
+
+    def update(self, item, priority) -> None:
+        """修改元素的优先级，按变化方向上浮或下沉"""
+        i = self.__index[item]
+        old = self.__priorities[i]
+        self.__priorities[i] = priority
+        if priority < old:
+            self.__sift_up(i)
+        else:
+            self.__sift_down(i)
+
+    def decrease_key(self, item, priority) -> None:
+        """降低元素的优先级（使其更早出队）"""
+        i = self.__index[item]
+        if self.__priorities[i] < priority:
+            raise ValueError("新优先级不能大于原优先级")
+        self.__priorities[i] = priority
+        self.__sift_up(i)
+
+    def remove(self, item) -> None:
+        """删除队列中的任意元素"""
+        i = self.__index.pop(item)
+        last, priority = self.__items.pop(), self.__priorities.pop()
+        # 删除的恰好是最后一个位置时无需调整
+        if i == len(self.__items):
+            return
+        old = self.__priorities[i]
+        self.__items[i] = last
+        self.__priorities[i] = priority
+        self.__index[last] = i
+        if priority < old:
+            self.__sift_up(i)
+        else:
+            self.__sift_down(i)
+
+    def __sift_up(self, i: int) -> None:
+        """从位置 i 开始上浮；先留出空位，逐层把父节点下移，最后一次写入，减少赋值次数"""
+        items, priorities, index, d = self.__items, self.__priorities, self.__index, self.__d
+        item, priority = items[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not priority < priorities[parent]:
+                break
+            items[i] = items[parent]
+            priorities[i] = priorities[parent]
+            index[items[i]] = i
+            i = parent
+        items[i] = item
+        priorities[i] = priority
+        index[item] = i
+
+    def __sift_down(self, i: int) -> None:
+        """从位置 i 开始下沉
+
+        采用自底向上的做法：沿最小的子节点一路下到叶子（每层只在子节点之间比较），再从叶子上浮回合适的位置。
+        出队时填到堆顶的元素通常本就来自底层，这样比每层都与它比较更省比较次数
+        """
+        items, priorities, index, d = self.__items, self.__priorities, self.__index, self.__d
+        n = len(items)
+        item, priority = items[i], priorities[i]
+        start = i
+        while True:
+            child = i * d + 1
+            if child >= n:
+                break
+            # 找出最小的子节点
+            smallest = priorities[child]
+            for c in range(child + 1, min(child + d, n)):
+                if priorities[c] < smallest:
+                    child, smallest = c, priorities[c]
+            items[i] = items[child]
+            priorities[i] = smallest
+            index[items[i]] = i
+            i = child
+        while i > start:
+            parent = (i - 1) // d
+            if not priority < priorities[parent]:
+                break
+            items[i] = items[parent]
+            priorities[i] = priorities[parent]
+            index[items[i]] = i
+            i = parent
+        items[i] = item
+        priorities[i] = priority
+        index[item] = i
+
+
+if __name__ == "__main__":
+    # 创建一个 4 叉堆优先队列
+    pq = PriorityQueue(d=4)
+    pq.push("write", 3)
+    pq.push("read", 1)
+    pq.push("flush", 5)
+    pq.push("sync", 4)
+
+    # 查看与取出优先级最小的元素
+    print(pq.peek(), pq.size())  # 输出: read 4
+    print(pq.pop())  # 输出: read
+
+    # 降低优先级、删除任意元素
+    pq.decrease_key("flush", 0)
+    pq.remove("sync")
+    print([pq.pop() for _ in range(pq.size())])  # 输出: ['flush', 'write']
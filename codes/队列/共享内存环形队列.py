@@ -0,0 +1,226 @@
+import os
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+
+_U64 = struct.Struct("Q")
+_U32 = struct.Struct("I")
+
+# 共享内存布局：容量与槽位大小，随后是分处不同缓存行的 head / tail 计数器，最后是槽位数组
+_CAPACITY_OFFSET = 0
+_SLOT_SIZE_OFFSET = 8
+_HEAD_OFFSET = 64  # 消费者已读出的元素个数，只由消费者写入
+_TAIL_OFFSET = 128  # 生产者已写入的元素个数，只由生产者写入
+_HEADER = 192
+# head / tail 在按 8 字节无符号整数解释的头部视图中的下标
+_HEAD = _HEAD_OFFSET // _U64.size
+_TAIL = _TAIL_OFFSET // _U64.size
+# 每个槽位开头 4 字节记录数据长度
+_LENGTH = _U32.size
+
+
+class SharedRingQueue:
+    """放在共享内存中的单生产者 / 单消费者（SPSC）环形队列，用于在两个进程之间传递字节记录
+
+    沿用 ArrayQueue 的环形数组设计，但不保存 front / size，而是使用两个只增不减的计数器：
+    head 只由消费者写入，tail 只由生产者写入，二者之差即为队列长度，因此无需加锁。
+    容量取 2 的幂，用 & (capacity - 1) 计算槽位；每个槽位大小固定，数据直接写入共享内存，不做 pickle。
+    生产者先写槽位再更新 tail，消费者先读槽位再更新 head；依赖 8 字节对齐写入的原子性与
+    写入顺序不被重排（x86 等强内存序平台成立）。
+    head / tail 通过 cast("Q") 的 memoryview 读写：struct.pack_into 会先把目标清零再写入，
+    另一个进程可能恰好读到 0，误以为对端计数器回退
+
+    其他进程通过 SharedRingQueue(name=...) 挂载，或直接把对象作为参数传给子进程。
+    共享内存只由创建者释放：挂载方会撤销 resource_tracker 对该共享内存的登记，
+    否则挂载的进程退出时，它的 resource_tracker 会提前删除仍在使用的共享内存
+    """
+
+    def __init__(self, capacity: int = 1024, slot_size: int = 256, name: str | None = None):
+        """构造方法，name 为 None 时创建新的共享内存，否则挂载已有的队列"""
+        if name is None:
+            # 向上取整到 2 的幂
+            capacity = 1 << max(capacity - 1, 0).bit_length()
+            if slot_size <= _LENGTH:
+                raise ValueError("槽位大小必须大于 4 字节")
+            self.__shm = SharedMemory(create=True, size=_HEADER + capacity * slot_size)
+            _U64.pack_into(self.__shm.buf, _CAPACITY_OFFSET, capacity)
+            _U64.pack_into(self.__shm.buf, _SLOT_SIZE_OFFSET, slot_size)
+            _U64.pack_into(self.__shm.buf, _HEAD_OFFSET, 0)
+            _U64.pack_into(self.__shm.buf, _TAIL_OFFSET, 0)
+            # 记录创建者进程，fork 出的子进程继承对象后关闭时不会误删共享内存
+            self.__owner_pid: int | None = os.getpid()
+        else:
+            self.__shm = SharedMemory(name=name)
+            if os.name == "posix":
+                resource_tracker.unregister(self.__shm._name, "shared_memory")
+            capacity = _U64.unpack_from(self.__shm.buf, _CAPACITY_OFFSET)[0]
+            slot_size = _U64.unpack_from(self.__shm.buf, _SLOT_SIZE_OFFSET)[0]
+            self.__owner_pid = None
+        self.name: str = self.__shm.name
+        self.__buf = self.__shm.buf
+        self.__counters = self.__buf[:_HEADER].cast("Q")
+        self.__capacity: int = capacity
+        self.__mask: int = capacity - 1
+        self.__slot_size: int = slot_size
+        # 对端计数器的本地缓存：只有看起来已满 / 已空时才重新读取共享内存
+        self.__head_cache: int = 0
+        self.__tail_cache: int = 0
+
+    def __reduce__(self):
+        """传给子进程时按名称重新挂载"""
+        return type(self)._attach_in_child, (self.name,)
+
+    @classmethod
+    def _attach_in_child(cls, name: str) -> "SharedRingQueue":
+        """multiprocessing 子进程中反序列化时挂载队列
+
+        spawn / forkserver 启动的子进程与父进程共用同一个 resource_tracker，挂载时撤销的正是创建者的登记，
+        这里重新登记，使创建者 close 时的撤销与之配对
+        """
+        ring = cls(name=name)
+        if os.name == "posix":
+            resource_tracker.register(ring.__shm._name, "shared_memory")
+        return ring
+
+    def capacity(self) -> int:
+        """获取队列的容量"""
+        return self.__capacity
+
+    def slot_size(self) -> int:
+        """单条数据的最大字节数"""
+        return self.__slot_size - _LENGTH
+
+    def size(self) -> int:
+        """获取队列的长度（另一端并发读写时仅为近似值）"""
+        counters = self.__counters
+        return counters[_TAIL] - counters[_HEAD]
+
+    def is_empty(self) -> bool:
+        """判断队列是否为空"""
+        return self.size() == 0
+
+    def try_push(self, data) -> bool:
+        """生产者：入队，队列已满时返回 False"""
+        n = len(data)
+        if n > self.__slot_size - _LENGTH:
+            raise ValueError("数据超过槽位大小")
+        buf, counters = self.__buf, self.__counters
+        tail = counters[_TAIL]
+        if tail - self.__head_cache >= self.__capacity:
+            self.__head_cache = counters[_HEAD]
+            if tail - self.__head_cache >= self.__capacity:
+                return False
+        offset = _HEADER + (tail & self.__mask) * self.__slot_size
+        _U32.pack_into(buf, offset, n)
+        buf[offset + _LENGTH : offset + _LENGTH + n] = data
+        # 数据写完后再发布 tail，消费者看到新的 tail 时槽位内容已就绪
+        counters[_TAIL] = tail + 1
+        return True
+
+    def __peek_slot(self) -> memoryview | None:
+        """消费者：队首槽位中数据的视图，队列为空时返回 None"""
+        buf = self.__buf
+        head = self.__counters[_HEAD]
+        if head == self.__tail_cache:
+            self.__tail_cache = self.__counters[_TAIL]
+            if head == self.__tail_cache:
+                return None
+        offset = _HEADER + (head & self.__mask) * self.__slot_size
+        n = _U32.unpack_from(buf, offset)[0]
+        return buf[offset + _LENGTH : offset + _LENGTH + n]
+
+    def __advance(self) -> None:
+        """消费者：释放队首槽位"""
+        self.__counters[_HEAD] += 1
+
+    @staticmethod
+    def __wait(ready, block: bool, timeout: float | None):
+        """轮询等待 ready() 返回非 None 的值；跨进程没有条件变量可用，逐步加长休眠间隔"""
+        result = ready()
+        if result is not None or not block:
+            return result
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while True:
+            time.sleep(delay)
+            result = ready()
+            if result is not None:
+                return result
+            if deadline is not None and time.monotonic() >= deadline:
+                return result
+            delay = min(max(delay * 2, 1e-6), 1e-3)
+
+    def push(self, data, block: bool = True, timeout: float | None = None) -> None:
+        """生产者：入队，队列已满时按 block / timeout 等待，超时抛出 queue.Full"""
+        if self.__wait(lambda: self.try_push(data) or None, block, timeout) is None:
+            raise Full("队列已满")
+
+    @contextmanager
+    def read(self, block: bool = True, timeout: float | None = None):
+        """消费者：以 memoryview 零拷贝读取队首数据，with 语句块正常结束后才释放槽位
+
+        视图直接指向共享内存，只能在 with 语句块内使用；队列为空时按 block / timeout 等待，超时抛出 queue.Empty。
+        with 语句块内抛出异常时不释放槽位，数据留在队首，下次读取仍会得到它
+        """
+        view = self.__wait(self.__peek_slot, block, timeout)
+        if view is None:
+            raise Empty("队列为空")
+        try:
+            yield view
+        finally:
+            view.release()
+        self.__advance()
+
+    def pop(self, block: bool = True, timeout: float | None = None) -> bytes:
+        """消费者：出队，返回数据的副本"""
+        with self.read(block, timeout) as view:
+            return bytes(view)
+
+    def close(self) -> None:
+        """关闭本进程中的映射；创建者同时释放共享内存"""
+        # 先释放由共享内存派生的视图，否则 close 会因仍有导出的缓冲区而失败
+        self.__counters.release()
+        self.__buf = None
+        self.__shm.close()
+        if self.__owner_pid == os.getpid():
+            try:
+                self.__shm.unlink()
+            except FileNotFoundError:
+                # 已被其他进程删除（例如挂载方的 resource_tracker），只需撤销本进程的登记
+                if os.name == "posix":
+                    resource_tracker.unregister(self.__shm._name, "shared_memory")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _produce(ring: SharedRingQueue, count: int) -> None:
+    """示例中的生产者进程"""
+    for i in range(count):
+        ring.push(struct.pack("qd", i, i * 0.5))
+    ring.close()
+
+
+if __name__ == "__main__":
+    from multiprocessing import Process
+
+    # 创建一个容量为 8、每条记录最多 60 字节的共享内存队列
+    with SharedRingQueue(capacity=8, slot_size=64) as ring:
+        ring.push(b"hello")
+        print(ring.size(), ring.pop())  # 输出: 1 b'hello'
+
+        # 子进程写入 100 条定长记录，本进程零拷贝读取
+        producer = Process(target=_produce, args=(ring, 100))
+        producer.start()
+        total = 0.0
+        for _ in range(100):
+            with ring.read() as view:
+                total += struct.unpack("qd", view)[1]
+        producer.join()
+        print(total, ring.is_empty())  # 输出: 2475.0 True
@@ -1,15 +1,47 @@
+from array import array
+
+
 class ArrayQueue:
-    """基于环形数组实现的队列"""
+    """基于环形数组实现的队列
+
+    growable=True 时队满自动扩容：容量取 2 的幂，用位运算 & (capacity - 1) 代替取余；
+    扩容时按顺序复制有效元素，队列元素减少到容量的 1/4 时缩容一半（不低于初始容量）。
+    指定 typecode（如 "d" 为 float64）时用 array.array 紧凑存储，use_numpy 为 True 时用 NumPy 数组，
+    每个位置只占 8 字节；出队、访问得到的仍是 Python 的 int / float
+    """
 
-    def __init__(self, size: int) -> None:
+    def __init__(
+        self, size: int, growable: bool = False, typecode: str | None = None, use_numpy: bool = False
+    ) -> None:
         """构造方法"""
-        self.__nums: list[int] = [0] * size  # 用于存储队列元素的数组
+        if growable:
+            # 向上取整到 2 的幂
+            size = 1 << max(size - 1, 0).bit_length()
+        self.__typecode: str | None = typecode or ("q" if use_numpy else None)
+        self.__use_numpy: bool = use_numpy
+        self.__nums = self.__new_buffer(size)  # 用于存储队列元素的数组
         self.__front: int = 0  # 队首指针，指向队首元素
         self.__size: int = 0  # 队列长度
+        self.__capacity: int = size  # 缓存容量，避免每次入队 / 出队调用 len
+        # 可扩容模式下的索引掩码，固定容量时为 None
+        self.__mask: int | None = size - 1 if growable else None
+        self.__min_capacity: int = size
+        # 缩容阈值：元素个数降到该值时容量减半，固定容量或已是初始容量时为 -1
+        self.__shrink_at: int = -1
+
+    def __new_buffer(self, size: int):
+        """创建存储数组：列表、array.array 或 NumPy 数组"""
+        if self.__use_numpy:
+            import numpy as np  # 可选依赖，仅在需要时导入
+
+            return np.zeros(size, dtype=self.__typecode)
+        if self.__typecode is not None:
+            return array(self.__typecode, [0]) * size
+        return [0] * size
 
     def capacity(self) -> int:
         """获取队列的容量"""
-        return len(self.__nums)
+        return self.__capacity
 
     def size(self) -> int:
         """获取队列的长度"""
@@ -21,11 +53,16 @@ class ArrayQueue:
 
     def push(self, num: int) -> None:
         """入队"""
-        if self.__size == self.capacity():
-            raise IndexError("队列已满")
+        if self.__size == self.__capacity:
+            if self.__mask is None:
+                raise IndexError("队列已满")
+            self.__resize(self.__capacity * 2)
         # 计算尾指针，指向队尾索引 + 1
-        # 通过取余操作，实现 rear 越过数组尾部后回到头部F
-        rear: int = (self.__front + self.__size) % self.capacity()
+        # 通过取余（或位与）操作，实现 rear 越过数组尾部后回到头部
+        if self.__mask is None:
+            rear: int = (self.__front + self.__size) % self.__capacity
+        else:
+            rear: int = (self.__front + self.__size) & self.__mask
         # 将 num 添加至队尾
         self.__nums[rear] = num
         self.__size += 1
@@ -34,58 +71,163 @@ class ArrayQueue:
         """出队"""
         num: int = self.peek()
         # 队首指针向后移动一位，若越过尾部则返回到数组头部
-        self.__front = (self.__front + 1) % self.capacity()
+        if self.__mask is None:
+            self.__front = (self.__front + 1) % self.__capacity
+        else:
+            self.__front = (self.__front + 1) & self.__mask
         self.__size -= 1
+        # 缩容策略：元素不足容量的 1/4 时容量减半，留出余量避免在边界处反复扩缩
+        if self.__size <= self.__shrink_at:
+            self.__resize(self.__capacity // 2)
         return num
 
+    def __spans(self, start: int, count: int) -> tuple[int, int, int, int]:
+        """从 start 开始的 count 个位置在数组中对应的至多两段区间 [a, b) 与 [c, d)"""
+        end = start + count
+        if end <= self.__capacity:
+            return start, end, 0, 0
+        # 越过数组尾部，第二段从数组头部开始
+        return start, self.__capacity, 0, end - self.__capacity
+
+    def __resize(self, capacity: int) -> None:
+        """把有效元素按顺序复制到新数组的开头"""
+        nums = self.__new_buffer(capacity)
+        a, b, c, d = self.__spans(self.__front, self.__size)
+        nums[: b - a] = self.__nums[a:b]
+        nums[b - a : self.__size] = self.__nums[c:d]
+        self.__nums = nums
+        self.__front = 0
+        self.__capacity = capacity
+        self.__mask = capacity - 1
+        self.__shrink_at = capacity // 4 if capacity > self.__min_capacity else -1
+
+    def push_many(self, nums) -> None:
+        """批量入队：最多两次切片赋值，空间不足时（固定容量）整批不入队并抛出 IndexError"""
+        # array.array 的切片赋值要求右侧同为 array.array
+        items = list(nums) if self.__typecode is None or self.__use_numpy else array(self.__typecode, nums)
+        n = len(items)
+        if n == 0:
+            return
+        if self.__size + n > self.__capacity:
+            if self.__mask is None:
+                raise IndexError("队列已满")
+            capacity = self.__capacity
+            while capacity < self.__size + n:
+                capacity *= 2
+            self.__resize(capacity)
+        a, b, c, d = self.__spans((self.__front + self.__size) % self.__capacity, n)
+        self.__nums[a:b] = items[: b - a]
+        # 空切片赋值在 array.array 导出 memoryview 时也会抛出 BufferError，因此跳过
+        if c < d:
+            self.__nums[c:d] = items[b - a :]
+        self.__size += n
+
+    def pop_many(self, k: int) -> list[int]:
+        """批量出队 k 个元素，按出队顺序返回"""
+        if k < 0:
+            raise ValueError("k 不能为负数")
+        if k > self.__size:
+            raise IndexError("队列元素不足")
+        if k == 0:
+            return []
+        a, b, c, d = self.__spans(self.__front, k)
+        if self.__typecode is None:
+            res = self.__nums[a:b] + self.__nums[c:d]
+        else:
+            res = self.__nums[a:b].tolist() + self.__nums[c:d].tolist()
+        self.__front = (self.__front + k) % self.__capacity
+        self.__size -= k
+        if self.__size <= self.__shrink_at:
+            capacity = self.__capacity
+            while capacity > self.__min_capacity and self.__size <= capacity // 4:
+                capacity //= 2
+            self.__resize(capacity)
+        return res
+
+    def view(self):
+        """按队首到队尾的顺序返回有效元素所在的两段切片，第二段可能为空
+
+        列表存储时返回列表切片（副本）；array.array 存储时返回 memoryview，NumPy 存储时返回数组视图，
+        二者均不复制数据，与队列共享内存，队列再次修改后其内容随之变化。
+        可扩容模式下扩容 / 缩容会换用新数组，此前取得的视图仍指向旧数组，不再反映队列内容，需重新调用 view()
+        """
+        a, b, c, d = self.__spans(self.__front, self.__size)
+        nums = memoryview(self.__nums) if self.__typecode is not None and not self.__use_numpy else self.__nums
+        return nums[a:b], nums[c:d]
+
     def peek(self) -> int:
         """访问队首元素"""
         if self.is_empty():
             raise IndexError("队列为空")
+        if self.__use_numpy:
+            # 转为 Python 标量，与列表存储的语义一致
+            return self.__nums.item(self.__front)
         return self.__nums[self.__front]
 
     def to_list(self) -> list[int]:
         """返回列表用于打印"""
-        res = [0] * self.size()
-        j: int = self.__front
-        for i in range(self.size()):
-            res[i] = self.__nums[(j % self.capacity())]
-            j += 1
-        return res
-
-
-# 创建一个容量为5的队列
-queue = ArrayQueue(5)
-
-# 添加元素到队列
-queue.push(1)
-queue.push(2)
-queue.push(3)
-print(queue.to_list())  # 输出: [1, 2, 3]
-
-# 查看队列是否为空
-print(queue.is_empty())  # 输出: False
-
-# 查看队列的容量
-print(queue.capacity())  # 输出: 5
-
-# 查看队列的长度
-print(queue.size())  # 输出: 3
-
-# 查看队首元素
-print(queue.peek())  # 输出: 1
-
-# 出队
-print(queue.pop())  # 输出: 1
-print(queue.to_list())  # 输出: [2, 3]
-
-# 再次入队
-queue.push(4)
-queue.push(5)
-print(queue.to_list())  # 输出: [2, 3, 4, 5]
-
-# 入队，由于队列已满，将抛出异常
-try:
-    queue.push(6)  # 抛出: IndexError: 队列已满
-except IndexError as e:
-    print(e)
+        first, second = self.view()
+        if self.__typecode is None:
+            return first + second
+        return first.tolist() + second.tolist()
+
+
+if __name__ == "__main__":
+    # 创建一个容量为5的队列
+    queue = ArrayQueue(5)
+
+    # 添加元素到队列
+    queue.push(1)
+    queue.push(2)
+    queue.push(3)
+    print(queue.to_list())  # 输出: [1, 2, 3]
+
+    # 查看队列是否为空
+    print(queue.is_empty())  # 输出: False
+
+    # 查看队列的容量
+    print(queue.capacity())  # 输出: 5
+
+    # 查看队列的长度
+    print(queue.size())  # 输出: 3
+
+    # 查看队首元素
+    print(queue.peek())  # 输出: 1
+
+    # 出队
+    print(queue.pop())  # 输出: 1
+    print(queue.to_list())  # 输出: [2, 3]
+
+    # 再次入队
+    queue.push(4)
+    queue.push(5)
+    print(queue.to_list())  # 输出: [2, 3, 4, 5]
+
+    # 入队，由于队列已满，将抛出异常
+    try:
+        queue.push(6)  # 抛出: IndexError: 队列已满
+    except IndexError as e:
+        print(e)
+
+    # 可扩容模式：容量取 2 的幂，队满时自动翻倍，出队后自动缩容
+    growing = ArrayQueue(3, growable=True)
+    for i in range(10):
+        growing.push(i)
+    print(growing.capacity(), growing.to_list())  # 输出: 16 [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    for _ in range(8):
+        growing.pop()
+    print(growing.capacity(), growing.to_list())  # 输出: 4 [8, 9]
+
+    # 批量入队 / 出队，有效区域跨过数组尾部时 view() 返回两段
+    growing.push_many([10, 11])
+    print(growing.view())  # 输出: ([8, 9, 10, 11], [])
+    print(growing.pop_many(3))  # 输出: [8, 9, 10]
+    growing.push_many([12, 13])
+    print(growing.view())  # 输出: ([11], [12, 13])
+
+    # 紧凑存储 float64，view() 返回零拷贝的 memoryview
+    samples = ArrayQueue(4, typecode="d")
+    samples.push_many([0.5, 1.5, 2.5])
+    print(samples.pop(), samples.to_list())  # 输出: 0.5 [1.5, 2.5]
+    first, second = samples.view()
+    print(first.format, first.tolist(), second.tolist())  # 输出: d [1.5, 2.5] []
@@ -7,6 +7,10 @@ class Node:
 class Queue:
     def __init__(self):
         self.front = self.rear = None  # 队列的前端和后端初始化为空
+        self.__size = 0  # 队列长度
+
+    def __len__(self):
+        return self.__size
 
     def is_empty(self):
         """检查队列是否为空"""
@@ -15,6 +19,7 @@ class Queue:
     def enqueue(self, item):
         """向队列添加元素"""
         temp = Node(item)  # 创建新节点
+        self.__size += 1
 
         if self.rear is None:  # 如果队列为空
             self.front = self.rear = temp  # 新节点为前端和后端
@@ -22,16 +27,23 @@ class Queue:
         self.rear.next = temp  # 将新节点链接到队列的后端
         self.rear = temp  # 更新队列的后端为新节点
 
-    def dequeue(self):
-        """从队列移除元素"""
-        if self.is_empty():  # 如果队列为空，返回 None
-            return
+    def _pop_node(self):
+        """移除并返回前端节点，队列为空时返回 None；节点数据保持原样"""
+        if self.is_empty():
+            return None
         temp = self.front  # 保存前端节点
         self.front = temp.next  # 更新前端为下一个节点
+        self.__size -= 1
 
         if self.front is None:  # 如果队列变为空
             self.rear = None  # 将后端设为空
+        return temp
 
+    def dequeue(self):
+        """从队列移除元素"""
+        temp = self._pop_node()
+        if temp is None:  # 如果队列为空，返回 None
+            return
         return str(temp.data)  # 返回移除的节点的数据
 
     def peek(self):
@@ -41,18 +53,19 @@ class Queue:
         return str(self.front.data)  # 返回前端节点的数据
 
 
-# 创建一个队列
-q = Queue()
+if __name__ == "__main__":
+    # 创建一个队列
+    q = Queue()
 
-# 向队列添加元素
-q.enqueue(1)
-q.enqueue(2)
-q.enqueue(3)
+    # 向队列添加元素
+    q.enqueue(1)
+    q.enqueue(2)
+    q.enqueue(3)
 
-# 获取队列的第一个元素
-print(q.peek())  # 输出: 1
+    # 获取队列的第一个元素
+    print(q.peek())  # 输出: 1
 
-# 从队列移除元素
-print(q.dequeue())  # 输出: 1
-print(q.dequeue())  # 输出: 2
-print(q.dequeue())  # 输出: 3
+    # 从队列移除元素
+    print(q.dequeue())  # 输出: 1
+    print(q.dequeue())  # 输出: 2
+    print(q.dequeue())  # 输出: 3
@@ -1,15 +1,48 @@
+from array import array
+
+
 class ArrayDeque:
-    """基于环形数组实现的双向队列"""
+    """基于环形数组实现的双向队列
+
+    growable=True 时队满自动扩容：容量取 2 的幂，用位运算 & (capacity - 1) 代替取余；
+    扩容时用两次切片复制把有效元素按顺序搬到新数组开头，元素减少到容量的 1/4 时缩容一半（不低于初始容量）。
+    固定容量模式下队满时入队抛出 IndexError。
+    指定 typecode（如 "d" 为 float64）时用 array.array 紧凑存储，use_numpy 为 True 时用 NumPy 数组，
+    每个位置只占 8 字节；出队、访问得到的仍是 Python 的 int / float
+    """
 
-    def __init__(self, capacity: int) -> None:
+    def __init__(
+        self, capacity: int, growable: bool = False, typecode: str | None = None, use_numpy: bool = False
+    ) -> None:
         """构造方法"""
-        self.__nums: list[int] = [0] * capacity
+        if growable:
+            # 向上取整到 2 的幂
+            capacity = 1 << max(capacity - 1, 0).bit_length()
+        self.__typecode: str | None = typecode or ("q" if use_numpy else None)
+        self.__use_numpy: bool = use_numpy
+        self.__nums = self.__new_buffer(capacity)
         self.__front: int = 0
         self.__size: int = 0
+        self.__capacity: int = capacity  # 缓存容量，避免每次入队 / 出队调用 len
+        # 可扩容模式下的索引掩码，固定容量时为 None
+        self.__mask: int | None = capacity - 1 if growable else None
+        self.__min_capacity: int = capacity
+        # 缩容阈值：元素个数降到该值时容量减半，固定容量或已是初始容量时为 -1
+        self.__shrink_at: int = -1
+
+    def __new_buffer(self, size: int):
+        """创建存储数组：列表、array.array 或 NumPy 数组"""
+        if self.__use_numpy:
+            import numpy as np  # 可选依赖，仅在需要时导入
+
+            return np.zeros(size, dtype=self.__typecode)
+        if self.__typecode is not None:
+            return array(self.__typecode, [0]) * size
+        return [0] * size
 
     def capacity(self) -> int:
         """获取双向队列的容量"""
-        return len(self.__nums)
+        return self.__capacity
 
     def size(self) -> int:
         """获取双向队列的长度"""
@@ -21,30 +54,35 @@ class ArrayDeque:
 
     def index(self, i: int) -> int:
         """计算环形数组索引"""
-        # 通过取余操作实现数组首尾相连
+        # 通过取余（或位与）操作实现数组首尾相连
         # 当 i 越过数组尾部后，回到头部
-        # 当 i 越过数组头部后，回到尾部
-        return (i + self.capacity()) % self.capacity()
+        # 当 i 越过数组头部后（为负数），回到尾部
+        if self.__mask is None:
+            return i % self.__capacity
+        return i & self.__mask
 
     def push_first(self, num: int) -> None:
         """队首入队"""
-        if self.__size == self.capacity():
-            print("双向队列已满")
-            return
-        # 队首指针向左移动一位
-        # 通过取余操作，实现 front 越过数组头部后回到尾部
-        self.__front = self.index(self.__front - 1)
+        if self.__size == self.__capacity:
+            self.__grow(self.__size + 1)
+        # 队首指针向左移动一位，越过数组头部后回到尾部
+        if self.__mask is None:
+            self.__front = (self.__front - 1) % self.__capacity
+        else:
+            self.__front = (self.__front - 1) & self.__mask
         # 将 num 添加至队首
         self.__nums[self.__front] = num
         self.__size += 1
 
     def push_last(self, num: int) -> None:
         """队尾入队"""
-        if self.__size == self.capacity():
-            print("双向队列已满")
-            return
+        if self.__size == self.__capacity:
+            self.__grow(self.__size + 1)
         # 计算尾指针，指向队尾索引 + 1
-        rear = self.index(self.__front + self.__size)
+        if self.__mask is None:
+            rear = (self.__front + self.__size) % self.__capacity
+        else:
+            rear = (self.__front + self.__size) & self.__mask
         # 将 num 添加至队尾
         self.__nums[rear] = num
         self.__size += 1
@@ -53,63 +91,206 @@ class ArrayDeque:
         """队首出队"""
         num = self.peek_first()
         # 队首指针向后移动一位
-        self.__front = self.index(self.__front + 1)
+        if self.__mask is None:
+            self.__front = (self.__front + 1) % self.__capacity
+        else:
+            self.__front = (self.__front + 1) & self.__mask
         self.__size -= 1
+        # 缩容策略：元素不足容量的 1/4 时容量减半，留出余量避免在边界处反复扩缩
+        if self.__size <= self.__shrink_at:
+            self.__resize(self.__capacity // 2)
         return num
 
     def pop_last(self) -> int:
         """队尾出队"""
         num = self.peek_last()
         self.__size -= 1
+        if self.__size <= self.__shrink_at:
+            self.__resize(self.__capacity // 2)
         return num
 
     def peek_first(self) -> int:
         """访问队首元素"""
-        if self.is_empty():
+        if self.__size == 0:
             raise IndexError("双向队列为空")
+        if self.__use_numpy:
+            # 转为 Python 标量，与列表存储的语义一致
+            return self.__nums.item(self.__front)
         return self.__nums[self.__front]
 
     def peek_last(self) -> int:
         """访问队尾元素"""
-        if self.is_empty():
+        if self.__size == 0:
             raise IndexError("双向队列为空")
         # 计算尾元素索引
         last = self.index(self.__front + self.__size - 1)
+        if self.__use_numpy:
+            return self.__nums.item(last)
         return self.__nums[last]
 
+    def __spans(self, start: int, count: int) -> tuple[int, int, int, int]:
+        """从 start 开始的 count 个位置在数组中对应的至多两段区间 [a, b) 与 [c, d)"""
+        end = start + count
+        if end <= self.__capacity:
+            return start, end, 0, 0
+        # 越过数组尾部，第二段从数组头部开始
+        return start, self.__capacity, 0, end - self.__capacity
+
+    def __grow(self, need: int) -> None:
+        """保证容量不小于 need：可扩容模式下按 2 倍扩容，固定容量时抛出 IndexError"""
+        if self.__mask is None:
+            raise IndexError("双向队列已满")
+        capacity = self.__capacity
+        while capacity < need:
+            capacity *= 2
+        self.__resize(capacity)
+
+    def __resize(self, capacity: int) -> None:
+        """把有效元素按顺序复制到新数组的开头（环形数组重新线性化）"""
+        nums = self.__new_buffer(capacity)
+        a, b, c, d = self.__spans(self.__front, self.__size)
+        nums[: b - a] = self.__nums[a:b]
+        nums[b - a : self.__size] = self.__nums[c:d]
+        self.__nums = nums
+        self.__front = 0
+        self.__capacity = capacity
+        self.__mask = capacity - 1
+        self.__shrink_at = capacity // 4 if capacity > self.__min_capacity else -1
+
+    def __shrink(self) -> None:
+        """批量出队后按需连续缩容"""
+        capacity = self.__capacity
+        while capacity > self.__min_capacity and self.__size <= capacity // 4:
+            capacity //= 2
+        self.__resize(capacity)
+
+    def push_many(self, nums, is_front: bool = False) -> None:
+        """批量入队，结果与逐个 push_first / push_last 相同，最多两次切片赋值
+
+        空间不足时可扩容模式一次扩到足够的容量，固定容量模式整批不入队并抛出 IndexError
+        """
+        # array.array 的切片赋值要求右侧同为 array.array
+        items = list(nums) if self.__typecode is None or self.__use_numpy else array(self.__typecode, nums)
+        n = len(items)
+        if n == 0:
+            return
+        if self.__size + n > self.__capacity:
+            self.__grow(self.__size + n)
+        if is_front:
+            # 逐个队首入队后顺序颠倒，先行反转
+            items.reverse()
+            self.__front = self.index(self.__front - n)
+            start = self.__front
+        else:
+            start = self.index(self.__front + self.__size)
+        a, b, c, d = self.__spans(start, n)
+        self.__nums[a:b] = items[: b - a]
+        # 空切片赋值在 array.array 导出 memoryview 时也会抛出 BufferError，因此跳过
+        if c < d:
+            self.__nums[c:d] = items[b - a :]
+        self.__size += n
+
+    def pop_many(self, k: int, is_front: bool = True) -> list[int]:
+        """批量出队 k 个元素，按出队顺序返回"""
+        if k < 0:
+            raise ValueError("k 不能为负数")
+        if k > self.__size:
+            raise IndexError("双向队列元素不足")
+        if k == 0:
+            return []
+        if is_front:
+            a, b, c, d = self.__spans(self.__front, k)
+            res = self.__slice_list(a, b, c, d)
+            self.__front = self.index(self.__front + k)
+            self.__size -= k
+        else:
+            self.__size -= k
+            a, b, c, d = self.__spans(self.index(self.__front + self.__size), k)
+            res = self.__slice_list(a, b, c, d)
+            # 从队尾出队，出队顺序与存储顺序相反
+            res.reverse()
+        if self.__size <= self.__shrink_at:
+            self.__shrink()
+        return res
+
+    def __slice_list(self, a: int, b: int, c: int, d: int) -> list[int]:
+        """把两段区间的元素拼接为列表"""
+        if self.__typecode is None:
+            return self.__nums[a:b] + self.__nums[c:d]
+        return self.__nums[a:b].tolist() + self.__nums[c:d].tolist()
+
+    def view(self):
+        """按队首到队尾的顺序返回有效元素所在的两段切片，第二段可能为空
+
+        列表存储时返回列表切片（副本）；array.array 存储时返回 memoryview，NumPy 存储时返回数组视图，
+        二者均不复制数据，与队列共享内存，队列再次修改后其内容随之变化。
+        可扩容模式下扩容 / 缩容会换用新数组，此前取得的视图仍指向旧数组，不再反映队列内容，需重新调用 view()
+        """
+        a, b, c, d = self.__spans(self.__front, self.__size)
+        nums = memoryview(self.__nums) if self.__typecode is not None and not self.__use_numpy else self.__nums
+        return nums[a:b], nums[c:d]
+
     def to_array(self) -> list[int]:
         """返回数组用于打印"""
         # 仅转换有效长度范围内的列表元素
-        res = []
-        for i in range(self.__size):
-            res.append(self.__nums[self.index(self.__front + i)])
-        return res
+        a, b, c, d = self.__spans(self.__front, self.__size)
+        return self.__slice_list(a, b, c, d)
+
+
+if __name__ == "__main__":
+    # 创建一个双向队列
+    deque = ArrayDeque(5)
+
+    # 向队首和队尾添加元素
+    deque.push_first(1)
+    deque.push_last(2)
+    print(deque.to_array())  # 输出: [1, 2]
+
+    # 查看双向队列是否为空
+    print(deque.is_empty())  # 输出: False
 
+    # 查看双向队列的长度
+    print(deque.size())  # 输出: 2
 
-# 创建一个双向队列
-deque = ArrayDeque(5)
+    # 查看队首和队尾元素
+    print(deque.peek_first())  # 输出: 1
+    print(deque.peek_last())  # 输出: 2
 
-# 向队首和队尾添加元素
-deque.push_first(1)
-deque.push_last(2)
-print(deque.to_array())  # 输出: [1, 2]
+    # 队首和队尾出队
+    print(deque.pop_first())  # 输出: 1
+    print(deque.pop_last())  # 输出: 2
+    print(deque.to_array())  # 输出: []
 
-# 查看双向队列是否为空
-print(deque.is_empty())  # 输出: False
+    # 再次向队首和队尾添加元素
+    deque.push_first(3)
+    deque.push_last(4)
+    print(deque.to_array())  # 输出: [3, 4]
 
-# 查看双向队列的长度
-print(deque.size())  # 输出: 2
+    # 批量入队与出队
+    deque.push_many([5])
+    deque.push_many([1, 2], is_front=True)
+    print(deque.to_array())  # 输出: [2, 1, 3, 4, 5]
+    print(deque.view())  # 输出: ([2, 1, 3], [4, 5])
+    print(deque.pop_many(2), deque.pop_many(2, is_front=False))  # 输出: [2, 1] [5, 4]
 
-# 查看队首和队尾元素
-print(deque.peek_first())  # 输出: 1
-print(deque.peek_last())  # 输出: 2
+    # 紧凑存储 float64
+    samples = ArrayDeque(4, typecode="d")
+    samples.push_many([1.5, 2.5])
+    samples.push_first(0.5)
+    print(samples.to_array(), samples.peek_last())  # 输出: [0.5, 1.5, 2.5] 2.5
 
-# 队首和队尾出队
-print(deque.pop_first())  # 输出: 1
-print(deque.pop_last())  # 输出: 2
-print(deque.to_array())  # 输出: []
+    # 固定容量模式下队满时入队抛出异常
+    try:
+        ArrayDeque(1).push_many([1, 2])
+    except IndexError as e:
+        print(e)  # 输出: 双向队列已满
 
-# 再次向队首和队尾添加元素
-deque.push_first(3)
-deque.push_last(4)
-print(deque.to_array())  # 输出: [3, 4]
+    # 可扩容模式：容量取 2 的幂，队满时自动翻倍，出队后自动缩容
+    growing = ArrayDeque(3, growable=True)
+    for i in range(5):
+        growing.push_first(-i)
+        growing.push_last(i)
+    print(growing.capacity(), growing.to_array())  # 输出: 16 [-4, -3, -2, -1, 0, 0, 1, 2, 3, 4]
+    growing.pop_many(4)
+    growing.pop_many(4, is_front=False)
+    print(growing.capacity(), growing.to_array())  # 输出: 4 [0, 0]
@@ -28,9 +28,14 @@ class LinkedListDeque:
         """判断双向队列是否为空"""
         return self.size() == 0
 
-    def push(self, num: int, is_front: bool) -> None:
-        """入队操作"""
+    def push(self, num: int, is_front: bool) -> ListNode:
+        """入队操作，返回新建的节点"""
         node = ListNode(num)
+        self.push_node(node, is_front)
+        return node
+
+    def push_node(self, node: ListNode, is_front: bool) -> None:
+        """将一个游离的节点入队"""
         # 若链表为空，则令 front, rear 都指向 node
         if self.is_empty():
             self.front = self.rear = node
@@ -48,13 +53,45 @@ class LinkedListDeque:
             self.rear = node  # 更新尾节点
         self.__size += 1  # 更新队列长度
 
-    def push_first(self, num: int) -> None:
+    def push_first(self, num: int) -> ListNode:
         """队首入队"""
-        self.push(num, True)
+        return self.push(num, True)
 
-    def push_last(self, num: int) -> None:
+    def push_last(self, num: int) -> ListNode:
         """队尾入队"""
-        self.push(num, False)
+        return self.push(num, False)
+
+    def insert_after(self, node: ListNode, num: int) -> ListNode:
+        """在队列中的 node 之后插入新节点，O(1)"""
+        if node is self.rear:
+            return self.push_last(num)
+        new = ListNode(num)
+        new.prev, new.next = node, node.next
+        node.next.prev = new
+        node.next = new
+        self.__size += 1
+        return new
+
+    def remove(self, node: ListNode) -> int:
+        """从队列中摘除任意节点，O(1)，返回节点的值"""
+        # 修正前驱、后继节点的指针，节点位于两端时同时更新头尾节点
+        if node.prev is None:
+            self.front = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.rear = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.__size -= 1
+        return node.val
+
+    def move_to_front(self, node: ListNode) -> None:
+        """将队列中的节点移到队首，不重新分配节点"""
+        if node is not self.front:
+            self.remove(node)
+            self.push_node(node, True)
 
     def pop(self, is_front: bool) -> Optional[int]:
         """出队操作"""
@@ -108,30 +145,31 @@ class LinkedListDeque:
         return res
 
 
-# 创建一个双向队列
-deque = LinkedListDeque()
+if __name__ == "__main__":
+    # 创建一个双向队列
+    deque = LinkedListDeque()
 
-# 向队首和队尾添加元素
-deque.push_first(1)
-deque.push_last(2)
-print(deque.to_array())  # 输出: [1, 2]
+    # 向队首和队尾添加元素
+    deque.push_first(1)
+    deque.push_last(2)
+    print(deque.to_array())  # 输出: [1, 2]
 
-# 查看双向队列是否为空
-print(deque.is_empty())  # 输出: False
+    # 查看双向队列是否为空
+    print(deque.is_empty())  # 输出: False
 
-# 查看双向队列的长度
-print(deque.size())  # 输出: 2
+    # 查看双向队列的长度
+    print(deque.size())  # 输出: 2
 
-# 查看队首和队尾元素
-print(deque.peek_first())  # 输出: 1
-print(deque.peek_last())  # 输出: 2
+    # 查看队首和队尾元素
+    print(deque.peek_first())  # 输出: 1
+    print(deque.peek_last())  # 输出: 2
 
-# 队首和队尾出队
-print(deque.pop_first())  # 输出: 1
-print(deque.pop_last())  # 输出: 2
-print(deque.to_array())  # 输出: []
+    # 队首和队尾出队
+    print(deque.pop_first())  # 输出: 1
+    print(deque.pop_last())  # 输出: 2
+    print(deque.to_array())  # 输出: []
 
-# 再次向队首和队尾添加元素
-deque.push_first(3)
-deque.push_last(4)
-print(deque.to_array())  # 输出: [3, 4]
+    # 再次向队首和队尾添加元素
+    deque.push_first(3)
+    deque.push_last(4)
+    print(deque.to_array())  # 输出: [3, 4]
@@ -0,0 +1,244 @@
+import os
+import random
+import threading
+
+from codes.array_deque import ArrayDeque
+
+# join 等待期间执行其他任务（自己队列中的或窃取的）的最大嵌套层数，超过后只等待，避免调用栈无限加深
+_MAX_HELP_DEPTH = 16
+
+
+class Task:
+    """fork 出的子任务，通过 WorkStealingPool.join 取得结果"""
+
+    __slots__ = ("func", "args", "result", "error", "done", "home", "claimed")
+
+    def __init__(self, func, args: tuple) -> None:
+        self.func = func
+        self.args = args
+        self.result = None
+        self.error: BaseException | None = None
+        self.done: bool = False
+        self.home: int | None = None  # 所在双向队列的编号
+        # 是否已被某个线程取走执行，只在所在双向队列的锁内设置；已取走的任务留在队列中，出队时跳过
+        self.claimed: bool = False
+
+    def run(self) -> None:
+        """执行任务，记录结果或异常"""
+        try:
+            self.result = self.func(*self.args)
+        except BaseException as e:
+            self.error = e
+        self.done = True
+
+    def cancel(self) -> None:
+        """取消尚未执行的任务，join 时抛出 RuntimeError"""
+        self.error = RuntimeError("线程池已关闭，任务被取消")
+        self.done = True
+
+
+class WorkStealingPool:
+    """基于 ArrayDeque 的工作窃取线程池，提供 fork / join 风格的任务接口
+
+    每个工作线程拥有一个双向队列：线程在队尾入队、出队自己的任务（后进先出，局部性好），
+    空闲线程从其他线程的队首窃取任务（先进先出，窃取到的往往是较大的子问题）。
+    Python 没有 CAS 原子操作，这里不实现无锁的 Chase-Lev 队列，而是每个双向队列配一把锁；
+    队列已满时 fork 直接在当前线程执行任务，不会丢弃任务。
+    工作线程在 join 等待期间会在嵌套层数限制内先执行自己队列中的任务，再窃取其他任务，
+    因此递归的 fork / join 不会让线程空等；达到层数限制后只执行正在等待的那个任务（无论它在哪个队列的什么位置）。
+    没有任务可帮忙执行时（以及线程池外部的线程调用 join 时）在条件变量上休眠，任务完成时被唤醒。
+    shutdown 会取消尚未执行的任务，对这些任务调用 join 会抛出 RuntimeError
+    """
+
+    def __init__(self, workers: int | None = None, capacity: int = 1024) -> None:
+        """构造方法，workers 默认为 CPU 核数，capacity 为每个双向队列的容量"""
+        self.__workers: int = workers or os.cpu_count() or 1
+        self.__deques = [ArrayDeque(capacity) for _ in range(self.__workers)]
+        self.__locks = [threading.Lock() for _ in range(self.__workers)]
+        self.__local = threading.local()  # 记录当前线程对应的双向队列编号与帮忙执行任务的嵌套层数
+        # 空闲线程在条件变量上短暂休眠，有新任务时唤醒
+        self.__idle = threading.Condition()
+        self.__sleepers: int = 0
+        # join 在条件变量上等待任务完成，有任务完成或新任务入队时唤醒
+        self.__finished = threading.Condition()
+        self.__joiners: int = 0
+        self.__shutdown: bool = False
+        self.steals: int = 0  # 成功窃取的次数（统计用，不加锁，仅为近似值）
+        self.__threads = [
+            threading.Thread(target=self.__worker_loop, args=(i,), daemon=True) for i in range(self.__workers)
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+    def workers(self) -> int:
+        """获取工作线程数"""
+        return self.__workers
+
+    def fork(self, func, *args) -> Task:
+        """提交子任务并立即返回；在工作线程中调用时放入该线程自己的双向队列"""
+        task = Task(func, args)
+        i = getattr(self.__local, "index", None)
+        if i is None:
+            # 外部线程提交的任务随机分给一个工作线程
+            i = random.randrange(self.__workers)
+        deque = self.__deques[i]
+        with self.__locks[i]:
+            # 在锁内检查，shutdown 清空队列后不会再有任务入队
+            if self.__shutdown:
+                raise RuntimeError("线程池已关闭")
+            pushed = deque.size() < deque.capacity()
+            if pushed:
+                task.home = i
+                deque.push_last(task)
+        if not pushed:
+            # 双向队列已满，直接在当前线程执行
+            task.claimed = True
+            self.__run(task)
+            return task
+        if self.__sleepers:
+            with self.__idle:
+                self.__idle.notify()
+        if self.__joiners:
+            with self.__finished:
+                self.__finished.notify_all()
+        return task
+
+    def join(self, task: Task):
+        """等待任务完成并返回其结果（任务抛出的异常在此重新抛出），等待期间帮忙执行其他任务"""
+        local = self.__local
+        i = getattr(local, "index", None)
+        while not task.done:
+            other = None
+            if i is not None:
+                if local.depth < _MAX_HELP_DEPTH:
+                    other = self.__pop_own(i) or self.__steal(i)
+                else:
+                    other = self.__claim(task)
+            if other is not None:
+                local.depth += 1
+                try:
+                    self.__run(other)
+                finally:
+                    local.depth -= 1
+                continue
+            with self.__finished:
+                self.__joiners += 1
+                try:
+                    # 登记后再检查一次，任务恰好在此之前完成时不会错过唤醒
+                    if not task.done:
+                        self.__finished.wait()
+                finally:
+                    self.__joiners -= 1
+        if task.error is not None:
+            raise task.error
+        return task.result
+
+    def run(self, func, *args):
+        """提交任务并等待其结果，供线程池外部调用"""
+        return self.join(self.fork(func, *args))
+
+    def __run(self, task: Task) -> None:
+        """执行任务并唤醒等待任务完成的 join"""
+        task.run()
+        if self.__joiners:
+            with self.__finished:
+                self.__finished.notify_all()
+
+    def __claim(self, task: Task) -> Task | None:
+        """取走尚未被执行的 task，不论它位于哪个双向队列的什么位置；已被其他线程取走时返回 None"""
+        if task.claimed:
+            return None
+        with self.__locks[task.home]:
+            if task.claimed:
+                return None
+            task.claimed = True
+        return task
+
+    def __pop_own(self, i: int) -> Task | None:
+        """从自己的队尾取任务"""
+        deque = self.__deques[i]
+        with self.__locks[i]:
+            while not deque.is_empty():
+                task = deque.pop_last()
+                if not task.claimed:
+                    task.claimed = True
+                    return task
+        return None
+
+    def __steal(self, i: int) -> Task | None:
+        """从其他队列的队首窃取任务"""
+        # 从随机位置开始轮询其他队列，避免所有线程都盯着同一个受害者
+        start = random.randrange(self.__workers)
+        for k in range(self.__workers):
+            victim = (start + k) % self.__workers
+            if victim == i or self.__deques[victim].is_empty():
+                continue
+            deque = self.__deques[victim]
+            with self.__locks[victim]:
+                while not deque.is_empty():
+                    task = deque.pop_first()
+                    if not task.claimed:
+                        task.claimed = True
+                        self.steals += 1
+                        return task
+        return None
+
+    def __worker_loop(self, i: int) -> None:
+        self.__local.index = i
+        self.__local.depth = 0
+        while not self.__shutdown:
+            task = self.__pop_own(i) or self.__steal(i)
+            if task is not None:
+                self.__run(task)
+                continue
+            with self.__idle:
+                self.__sleepers += 1
+                self.__idle.wait(0.01)
+                self.__sleepers -= 1
+
+    def shutdown(self) -> None:
+        """停止全部工作线程：取消尚未执行的任务，等待正在执行的任务结束"""
+        self.__shutdown = True
+        for lock, deque in zip(self.__locks, self.__deques):
+            with lock:
+                while not deque.is_empty():
+                    task = deque.pop_first()
+                    if not task.claimed:
+                        task.claimed = True
+                        task.cancel()
+        with self.__finished:
+            self.__finished.notify_all()
+        with self.__idle:
+            self.__idle.notify_all()
+        for thread in self.__threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+if __name__ == "__main__":
+
+    def fib(pool: WorkStealingPool, n: int) -> int:
+        """fork / join 递归计算斐波那契数，n 较小时直接串行计算"""
+        if n < 15:
+            a, b = 0, 1
+            for _ in range(n):
+                a, b = b, a + b
+            return a
+        left = pool.fork(fib, pool, n - 1)
+        right = fib(pool, n - 2)
+        return pool.join(left) + right
+
+    # 创建 4 个工作线程的工作窃取线程池
+    with WorkStealingPool(workers=4, capacity=64) as pool:
+        print(pool.run(fib, pool, 25))  # 输出: 75025
+
+        # 子任务抛出的异常在 join 时重新抛出
+        try:
+            pool.run(lambda: 1 / 0)
+        except ZeroDivisionError as e:
+            print(e)  # 输出: division by zero
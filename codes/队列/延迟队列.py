@@ -0,0 +1,102 @@
+import time
+
+from codes.priority_queue import PriorityQueue
+
+
+class DelayQueue:
+    """延迟队列：元素在指定延迟之后才能出队
+
+    以到期时刻为优先级放入 d 叉堆，堆顶即最早到期的元素。元素须可哈希且互不相同，
+    借助堆的索引可以 O(log n) 取消（cancel）或重新安排（reschedule）尚未到期的元素。
+    clock 默认为 time.monotonic，可替换为其他时钟（例如测试中的模拟时钟）；
+    阻塞出队时用 sleep 等待，替换 clock 时通常也要替换为按同一时钟推进的 sleep
+    """
+
+    def __init__(self, d: int = 4, clock=time.monotonic, sleep=time.sleep) -> None:
+        """构造方法"""
+        self.__heap = PriorityQueue(d)
+        self.__clock = clock
+        self.__sleep = sleep
+
+    def size(self) -> int:
+        """获取队列的长度（包括尚未到期的元素）"""
+        return self.__heap.size()
+
+    def is_empty(self) -> bool:
+        """判断队列是否为空"""
+        return self.__heap.is_empty()
+
+    def __len__(self):
+        return self.__heap.size()
+
+    def __contains__(self, item):
+        return item in self.__heap
+
+    def push(self, item, delay: float) -> None:
+        """入队，delay 秒后到期"""
+        self.__heap.push(item, self.__clock() + delay)
+
+    def peek(self):
+        """访问最早到期的元素（可能尚未到期）"""
+        return self.__heap.peek()
+
+    def next_deadline(self) -> float | None:
+        """最早的到期时刻，队列为空时返回 None"""
+        return None if self.__heap.is_empty() else self.__heap.peek_priority()
+
+    def pop(self, block: bool = False):
+        """取出最早到期的元素
+
+        元素尚未到期时：block 为 False 抛出 IndexError，为 True 则休眠到到期时刻再取出。
+        醒来后重新读取时钟与堆顶的到期时刻，时钟未走到到期时刻（如休眠提前返回、时钟不单调）时继续等待
+        """
+        while True:
+            remaining = self.__heap.peek_priority() - self.__clock()  # 队列为空时抛出 IndexError
+            if remaining <= 0:
+                return self.__heap.pop()
+            if not block:
+                raise IndexError("没有到期的元素")
+            self.__sleep(remaining)
+
+    def pop_due(self) -> list:
+        """取出当前所有已到期的元素，按到期时刻排序"""
+        now = self.__clock()
+        heap = self.__heap
+        due = []
+        while not heap.is_empty() and heap.peek_priority() <= now:
+            due.append(heap.pop())
+        return due
+
+    def cancel(self, item) -> None:
+        """取消尚未出队的元素"""
+        self.__heap.remove(item)
+
+    def reschedule(self, item, delay: float) -> None:
+        """把元素的到期时刻改为从现在起 delay 秒后"""
+        self.__heap.update(item, self.__clock() + delay)
+
+
+if __name__ == "__main__":
+    # 使用模拟时钟的延迟队列
+    now = [0.0]
+    dq = DelayQueue(clock=lambda: now[0])
+    dq.push("retry-1", 5)
+    dq.push("retry-2", 1)
+    dq.push("heartbeat", 3)
+    print(dq.peek(), dq.next_deadline())  # 输出: retry-2 1.0
+
+    # 未到期时不能出队
+    try:
+        dq.pop()
+    except IndexError as e:
+        print(e)  # 输出: 没有到期的元素
+
+    # 时钟前进 3 秒，取出所有到期的元素
+    now[0] = 3.0
+    print(dq.pop_due())  # 输出: ['retry-2', 'heartbeat']
+
+    # 取消与重新安排
+    dq.push("timeout", 10)
+    dq.cancel("timeout")
+    dq.reschedule("retry-1", 0)
+    print(dq.pop(), dq.size())  # 输出: retry-1 0
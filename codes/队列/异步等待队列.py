@@ -0,0 +1,67 @@
+from collections import deque
+
+
+class AsyncWaiters:
+    """asyncio 协程的等待队列：条件不满足时挂起，条件可能已满足时按先来先服务唤醒下一个协程
+
+    每个等待的协程挂在一个 Future 上；AsyncStack、AsyncQueue 各用两个实例分别管理等待出队和等待入队的协程。
+    只能在同一个事件循环中使用（不是线程安全的）。
+    asyncio 的导入耗时较长，在第一次需要挂起时才导入，导入本模块不会连带导入 asyncio
+    """
+
+    def __init__(self):
+        self.__waiters: deque = deque()
+
+    def __len__(self):
+        return len(self.__waiters)
+
+    def wakeup_next(self) -> None:
+        """唤醒下一个仍在等待的协程"""
+        waiters = self.__waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def wait(self, blocked) -> None:
+        """在 blocked() 成立期间挂起；被取消时把唤醒机会让给下一个等待者"""
+        import asyncio
+
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            self.__waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self.__waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self.wakeup_next()
+                raise
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    # 两个协程等待同一个条件，每次唤醒一个
+    async def main():
+        ready = []
+        waiters = AsyncWaiters()
+
+        async def worker(name):
+            await waiters.wait(lambda: not ready)
+            return name
+
+        tasks = [asyncio.ensure_future(worker(name)) for name in "ab"]
+        await asyncio.sleep(0)
+        print(len(waiters))  # 输出: 2
+        ready.append(True)
+        waiters.wakeup_next()
+        waiters.wakeup_next()
+        print(await asyncio.gather(*tasks))  # 输出: ['a', 'b']
+
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+from queue import Empty, Full
+
+from codes.async_waiters import AsyncWaiters
+from codes.linked_queue import Queue
+
+
+class AsyncQueue:
+    """用于 asyncio 的有界队列，基于链表实现的队列
+
+    put / get 可 await，队列满时 put 挂起形成背压；get_batch 把多个元素合并为一批，便于下游批量写入。
+    内部持有一个链表队列而不是继承它，所有入队 / 出队都经过容量检查并唤醒等待者；
+    get 系列方法原样返回入队的对象，不像 Queue.dequeue / peek 那样转换为 str。
+    只能在同一个事件循环中使用（不是线程安全的），超时可配合 asyncio.wait_for。
+    asyncio 的导入耗时较长，在第一次需要挂起时才导入，导入本模块不会连带导入 asyncio
+    """
+
+    def __init__(self, capacity: int | None = None):
+        """构造方法，capacity 为 None 表示不限容量"""
+        if capacity is not None and capacity <= 0:
+            raise ValueError("容量必须为正数")
+        self.capacity = capacity
+        self.__queue = Queue()
+        # 等待出队 / 入队的协程
+        self.__getters = AsyncWaiters()
+        self.__putters = AsyncWaiters()
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def is_empty(self):
+        """检查队列是否为空"""
+        return self.__queue.is_empty()
+
+    def full(self) -> bool:
+        """检查队列是否已满"""
+        return self.capacity is not None and len(self.__queue) >= self.capacity
+
+    async def put(self, item) -> None:
+        """入队，队列已满时等待"""
+        await self.__putters.wait(self.full)
+        self.put_nowait(item)
+
+    async def get(self):
+        """出队，队列为空时等待"""
+        await self.__getters.wait(self.is_empty)
+        return self.get_nowait()
+
+    def put_nowait(self, item) -> None:
+        """立即入队，队列已满时抛出 queue.Full"""
+        if self.full():
+            raise Full("Queue is full")
+        self.__queue.enqueue(item)
+        self.__getters.wakeup_next()
+
+    def get_nowait(self):
+        """立即出队，队列为空时抛出 queue.Empty"""
+        node = self.__queue._pop_node()
+        if node is None:
+            raise Empty("Queue is empty")
+        self.__putters.wakeup_next()
+        return node.data
+
+    def peek(self):
+        """获取队首元素（原样返回），队列为空时返回 None"""
+        front = self.__queue.front
+        return None if front is None else front.data
+
+    async def get_batch(self, max_items: int, timeout: float | None = None) -> list:
+        """批量出队：至少等到一个元素，之后在 timeout 秒内继续收集，凑满 max_items 或超时即返回
+
+        timeout 为 None 时只取已在队列中的元素，不再等待
+        """
+        if max_items <= 0:
+            raise ValueError("max_items 必须为正数")
+        import asyncio
+
+        batch = [await self.get()]
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while len(batch) < max_items:
+            if not self.is_empty():
+                batch.append(self.get_nowait())
+                continue
+            if deadline is None or deadline <= loop.time():
+                break
+            # wait_for 在单独的任务中等待，返回前元素可能已被其他消费者取走，因此回到循环开头重新检查
+            try:
+                await asyncio.wait_for(self.__getters.wait(self.is_empty), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    # 容量为 2 的异步队列：生产者在队列满时挂起，消费者按批取出
+    async def main():
+        queue = AsyncQueue(capacity=2)
+
+        async def producer():
+            for i in range(5):
+                await queue.put({"id": i})
+
+        async def consumer():
+            batches = []
+            while sum(map(len, batches)) < 5:
+                batches.append(await queue.get_batch(max_items=4, timeout=0.01))
+            return batches
+
+        _, batches = await asyncio.gather(producer(), consumer())
+        # 元素原样返回，不转换为 str
+        print([item["id"] for batch in batches for item in batch])  # 输出: [0, 1, 2, 3, 4]
+        print(len(queue), queue.is_empty())  # 输出: 0 True
+
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+from array import array
+from collections import deque
+
+
+class SlidingWindow:
+    """定长滑动窗口：保留最近 size 个数值，入队时自动淘汰最旧的值，O(1) 获取窗口的和、均值、最小值与最大值
+
+    窗口本身是预先分配的环形数组（指定 typecode 时为紧凑的 array，否则为 list），写满后新值直接覆盖最旧的值；
+    和随入队、淘汰增量更新；最小值 / 最大值各用一个单调双向队列（collections.deque）维护，
+    队首即窗口最值，每个值最多入队、出队一次，均摊 O(1)。
+    浮点数增量求和会累积舍入误差，每淘汰 size 个值后按窗口内容重新求一次和（均摊仍为 O(1)）。
+    每次入队是固定的几步操作，与窗口大小无关；窗口很小（约 8～16 以内）时，对 collections.deque 直接调用
+    sum / min / max 逐次重算反而更快，窗口越大本实现的优势越明显
+    """
+
+    def __init__(self, size: int, typecode: str | None = None) -> None:
+        """构造方法，typecode 同 ArrayDeque（如 "d" 为 float64）"""
+        if size < 1:
+            raise ValueError("窗口大小至少为 1")
+        self.__size: int = size
+        self.__typed: bool = typecode is not None
+        self.__values = [0] * size if typecode is None else array(typecode, bytes(size * array(typecode).itemsize))
+        self.__pos: int = 0  # 下一个值写入的位置，窗口已满时即最旧的值所在位置
+        self.__count: int = 0
+        # 单调双向队列：__mins 从队首到队尾非递减，__maxs 非递增；保留相等的值，淘汰时按值比较队首即可
+        self.__mins: deque = deque()
+        self.__maxs: deque = deque()
+        self.__sum = 0
+        self.__evicted: int = 0  # 上次重新求和后淘汰的值的个数
+
+    def capacity(self) -> int:
+        """获取窗口大小"""
+        return self.__size
+
+    def size(self) -> int:
+        """获取窗口中值的个数"""
+        return self.__count
+
+    def is_empty(self) -> bool:
+        """判断窗口是否为空"""
+        return self.__count == 0
+
+    def is_full(self) -> bool:
+        """判断窗口是否已满"""
+        return self.__count == self.__size
+
+    def __len__(self):
+        return self.__count
+
+    def push(self, num):
+        """加入一个值，窗口已满时淘汰并返回最旧的值，否则返回 None"""
+        values, pos, mins, maxs = self.__values, self.__pos, self.__mins, self.__maxs
+        old = None
+        if self.__count == self.__size:
+            old = values[pos]
+            # 被淘汰的值若是当前最值，一定位于单调队列的队首
+            if mins[0] == old:
+                mins.popleft()
+            if maxs[0] == old:
+                maxs.popleft()
+            self.__evicted += 1
+        else:
+            self.__count += 1
+        values[pos] = num
+        if self.__typed:
+            # 紧凑存储可能改变数值（如 float32 的舍入），单调队列与求和都以存入后的值为准
+            num = values[pos]
+        pos += 1
+        self.__pos = 0 if pos == self.__size else pos
+        # 队尾比新值大（小）的值不可能再成为最小值（最大值），直接出队
+        while mins and mins[-1] > num:
+            mins.pop()
+        mins.append(num)
+        while maxs and maxs[-1] < num:
+            maxs.pop()
+        maxs.append(num)
+        if old is None:
+            self.__sum += num
+        elif self.__evicted == self.__size:
+            # 窗口已满，环形数组的内容即窗口内容
+            self.__sum = sum(values)
+            self.__evicted = 0
+        else:
+            self.__sum += num - old
+        return old
+
+    def sum(self):
+        """窗口内值的和"""
+        return self.__sum
+
+    def mean(self) -> float:
+        """窗口内值的均值"""
+        if self.__count == 0:
+            raise IndexError("滑动窗口为空")
+        return self.__sum / self.__count
+
+    def min(self):
+        """窗口内的最小值"""
+        try:
+            return self.__mins[0]
+        except IndexError:
+            raise IndexError("滑动窗口为空") from None
+
+    def max(self):
+        """窗口内的最大值"""
+        try:
+            return self.__maxs[0]
+        except IndexError:
+            raise IndexError("滑动窗口为空") from None
+
+    def to_list(self) -> list:
+        """按从旧到新的顺序返回窗口内的值"""
+        values, pos = self.__values, self.__pos
+        if self.__count < self.__size:
+            return list(values[:pos])
+        return list(values[pos:]) + list(values[:pos])
+
+
+if __name__ == "__main__":
+    # 创建一个大小为 3 的滑动窗口
+    window = SlidingWindow(3)
+    for latency in [5, 1, 4]:
+        window.push(latency)
+    print(window.to_list(), window.sum(), window.min(), window.max())  # 输出: [5, 1, 4] 10 1 5
+
+    # 窗口已满，加入新值时淘汰最旧的值
+    print(window.push(2))  # 输出: 5
+    print(window.to_list(), window.sum(), window.min(), window.max())  # 输出: [1, 4, 2] 7 1 4
+    window.push(3)
+    print(window.mean(), window.min(), window.max())  # 输出: 3.0 2 4
+
+    # 紧凑存储 float64 的滑动窗口
+    samples = SlidingWindow(2, typecode="d")
+    for x in [0.5, 1.5, 2.5]:
+        samples.push(x)
+    print(samples.to_list(), samples.mean())  # 输出: [1.5, 2.5] 2.0
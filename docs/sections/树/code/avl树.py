@@ -161,17 +161,18 @@ class AVLTree:
 
 
 # 示例使用
-avl_tree = AVLTree()
-avl_tree.insert(10)
-avl_tree.insert(20)
-avl_tree.insert(30)
-avl_tree.insert(40)
-avl_tree.insert(50)
-avl_tree.insert(25)
-
-print("前序遍历:", avl_tree.pre_order())
-print("中序遍历:", avl_tree.in_order())
-print("后序遍历:", avl_tree.post_order())
-
-avl_tree.remove(40)
-print("中序遍历 (删除40后):", avl_tree.in_order())
+if __name__ == "__main__":
+    avl_tree = AVLTree()
+    avl_tree.insert(10)
+    avl_tree.insert(20)
+    avl_tree.insert(30)
+    avl_tree.insert(40)
+    avl_tree.insert(50)
+    avl_tree.insert(25)
+
+    print("前序遍历:", avl_tree.pre_order())
+    print("中序遍历:", avl_tree.in_order())
+    print("后序遍历:", avl_tree.post_order())
+
+    avl_tree.remove(40)
+    print("中序遍历 (删除40后):", avl_tree.in_order())
@@ -139,40 +139,41 @@ class BinaryTree:
 
 
 # 示例使用
-bt = BinaryTree()
-bt.insert(5)
-bt.insert(3)
-bt.insert(7)
-bt.insert(2)
-bt.insert(4)
-bt.insert(6)
-bt.insert(8)
-
-# 中序遍历
-print(bt.inorder())  # 输出 [2, 3, 4, 5, 6, 7, 8]
-
-# 搜索节点
-print(bt.search(4))  # 输出 True
-print(bt.search(9))  # 输出 False
-
-# 删除节点
-bt.delete(5)
-print(bt.inorder())  # 输出 [2, 3, 4, 6, 7, 8]
-
-# 层序遍历
-print(bt.level_order())  # 输出 [6, 3, 7, 2, 4, 8]
-
-# 前序遍历
-pre_order_result = []
-bt.pre_order(bt.root, pre_order_result)
-print(pre_order_result)  # 输出 [6, 3, 2, 4, 7, 8]
-
-# 中序遍历
-in_order_result = []
-bt.in_order(bt.root, in_order_result)
-print(in_order_result)  # 输出 [2, 3, 4, 6, 7, 8]
-
-# 后序遍历
-post_order_result = []
-bt.post_order(bt.root, post_order_result)
-print(post_order_result)  # 输出 [2, 4, 3, 8, 7, 6]
+if __name__ == "__main__":
+    bt = BinaryTree()
+    bt.insert(5)
+    bt.insert(3)
+    bt.insert(7)
+    bt.insert(2)
+    bt.insert(4)
+    bt.insert(6)
+    bt.insert(8)
+
+    # 中序遍历
+    print(bt.inorder())  # 输出 [2, 3, 4, 5, 6, 7, 8]
+
+    # 搜索节点
+    print(bt.search(4))  # 输出 True
+    print(bt.search(9))  # 输出 False
+
+    # 删除节点
+    bt.delete(5)
+    print(bt.inorder())  # 输出 [2, 3, 4, 6, 7, 8]
+
+    # 层序遍历
+    print(bt.level_order())  # 输出 [6, 3, 7, 2, 4, 8]
+
+    # 前序遍历
+    pre_order_result = []
+    bt.pre_order(bt.root, pre_order_result)
+    print(pre_order_result)  # 输出 [6, 3, 2, 4, 7, 8]
+
+    # 中序遍历
+    in_order_result = []
+    bt.in_order(bt.root, in_order_result)
+    print(in_order_result)  # 输出 [2, 3, 4, 6, 7, 8]
+
+    # 后序遍历
+    post_order_result = []
+    bt.post_order(bt.root, post_order_result)
+    print(post_order_result)  # 输出 [2, 4, 3, 8, 7, 6]
@@ -0,0 +1,24 @@
+from array import array
+
+import pytest
+
+from codes.array_ops import create_array, insert_many, remove, remove_many
+
+
+def test_batch_ops_keep_array_type():
+    nums = array("q", [1, 3, 4, 6, 7, 8])
+    assert insert_many(nums, [2, 5], [1, 3]) == array("q", [1, 2, 3, 4, 5, 6])
+    assert remove_many(nums, [0, 2, 4]) == array("q", [2, 4, 6])
+
+
+def test_batch_ops_on_ndarray():
+    np = pytest.importorskip("numpy")
+    nums = create_array(0, 6, use_numpy=True)
+    nums[:] = [1, 3, 4, 6, 7, 8]
+    # 长度不变的批量插入原地修改
+    assert insert_many(nums, [2, 5], [1, 3]) is nums
+    assert nums.tolist() == [1, 2, 3, 4, 5, 6]
+    # NumPy 数组长度固定，删除返回新数组
+    assert remove(nums, 0).tolist() == [2, 3, 4, 5, 6]
+    assert remove_many(nums, [0, 2, 4, 4]).tolist() == [2, 4, 6]
+    assert isinstance(remove_many(nums, [1]), np.ndarray)
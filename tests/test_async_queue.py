@@ -0,0 +1,109 @@
+import asyncio
+from queue import Empty, Full
+
+import pytest
+
+from codes.async_queue import AsyncQueue
+from codes.async_waiters import AsyncWaiters
+
+
+def test_nowait_respects_capacity():
+    queue = AsyncQueue(capacity=2)
+    queue.put_nowait({"id": 1})
+    queue.put_nowait(2)
+    with pytest.raises(Full):
+        queue.put_nowait(3)
+    assert len(queue) == 2 and queue.full()
+    # 元素原样返回，不转换为 str
+    assert queue.peek() == {"id": 1}
+    assert queue.get_nowait() == {"id": 1}
+    assert queue.get_nowait() == 2
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    assert queue.peek() is None and queue.is_empty()
+
+
+def test_queue_methods_not_exposed():
+    """不继承链表队列，绕过容量检查与唤醒的 enqueue / dequeue 不可用"""
+    queue = AsyncQueue(capacity=1)
+    assert not hasattr(queue, "enqueue") and not hasattr(queue, "dequeue")
+
+
+def test_put_wakes_getter_and_get_wakes_putter():
+    async def main():
+        queue = AsyncQueue(capacity=1)
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        await asyncio.wait_for(queue.put(1), 1)
+        assert await asyncio.wait_for(getter, 1) == 1
+
+        await queue.put(2)
+        putter = asyncio.ensure_future(queue.put(3))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        assert await queue.get() == 2
+        await asyncio.wait_for(putter, 1)
+        return await queue.get()
+
+    assert asyncio.run(main()) == 3
+
+
+def test_get_batch():
+    async def main():
+        queue = AsyncQueue()
+        for i in range(5):
+            queue.put_nowait(i)
+        # timeout 为 None 时只取已在队列中的元素
+        first = await queue.get_batch(3)
+        rest = await queue.get_batch(10)
+
+        # 等到第一个元素后，在 timeout 内继续收集
+        async def later():
+            await asyncio.sleep(0.01)
+            queue.put_nowait(6)
+
+        queue.put_nowait(5)
+        _, delayed = await asyncio.gather(later(), queue.get_batch(2, timeout=1))
+        return first, rest, delayed
+
+    assert asyncio.run(main()) == ([0, 1, 2], [3, 4], [5, 6])
+
+
+def test_cancelled_getter_passes_wakeup_on():
+    """被唤醒后又被取消的等待者要把唤醒机会让给下一个等待者"""
+
+    async def main():
+        queue = AsyncQueue()
+        first = asyncio.ensure_future(queue.get())
+        second = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        first.cancel()
+        return await asyncio.wait_for(second, 1)
+
+    assert asyncio.run(main()) == 1
+
+
+def test_waiters_wake_in_order():
+    async def main():
+        ready = []
+        waiters = AsyncWaiters()
+        woken = []
+
+        async def worker(name):
+            await waiters.wait(lambda: not ready)
+            woken.append(name)
+
+        tasks = [asyncio.ensure_future(worker(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        assert len(waiters) == 3
+        ready.append(True)
+        waiters.wakeup_next()
+        await asyncio.sleep(0)
+        assert woken == ["a"]
+        waiters.wakeup_next()
+        waiters.wakeup_next()
+        await asyncio.gather(*tasks)
+        return woken
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
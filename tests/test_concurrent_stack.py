@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from queue import Empty, Full
+
+import pytest
+
+from codes.concurrent_stack import AsyncStack, ConcurrentStack
+
+
+def start(target, *args) -> threading.Thread:
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_push_pop_timeout():
+    stack = ConcurrentStack(capacity=1)
+    stack.push(1)
+    with pytest.raises(Full):
+        stack.push(2, timeout=0.01)
+    with pytest.raises(Full):
+        stack.push(2, block=False)
+    assert stack.pop() == 1
+    with pytest.raises(Empty):
+        stack.pop(timeout=0.01)
+    assert stack.is_empty() and not stack
+
+
+def test_single_push_not_starved_by_batch_waiter():
+    """栈满时 push_many 先于 push 等待，一次 pop 腾出的空位应让 push 继续，而不是丢失唤醒"""
+    stack = ConcurrentStack(capacity=2)
+    stack.push_many([1, 2])
+    results = []
+    batch = start(lambda: results.append(("batch", stack.push_many([3, 4], timeout=5))))
+    time.sleep(0.05)
+    single = start(lambda: results.append(("single", stack.push(5, timeout=5))))
+    time.sleep(0.05)
+
+    # 丢失唤醒时 push 要等到超时才会重新检查条件，这里只给 1 秒
+    assert stack.pop() == 2
+    single.join(1)
+    assert not single.is_alive()
+    assert ("single", None) in results
+    assert list(stack) == [5, 1]
+
+    # 再腾出两个空位后整批入栈才能完成
+    assert stack.pop_many(2) == [5, 1]
+    batch.join(3)
+    assert list(stack) == [4, 3]
+
+
+def test_single_pop_not_starved_by_batch_waiter():
+    stack = ConcurrentStack(capacity=4)
+    popped = []
+    start(lambda: popped.append(stack.pop_many(3, timeout=5)))
+    time.sleep(0.05)
+    single = start(lambda: popped.append(stack.pop(timeout=5)))
+    time.sleep(0.05)
+
+    stack.push(1)
+    single.join(1)
+    assert popped == [1]
+
+
+def test_push_many_larger_than_capacity():
+    with pytest.raises(ValueError):
+        ConcurrentStack(capacity=2).push_many([1, 2, 3])
+
+
+def test_peek_does_not_deadlock():
+    stack = ConcurrentStack()
+    stack.push(1)
+    assert stack.peek() == 1 and len(stack) == 1 and stack
+
+
+def test_producers_and_consumers():
+    stack = ConcurrentStack(capacity=8)
+    n, workers = 2000, 4
+    popped = []
+    lock = threading.Lock()
+
+    def consumer():
+        for _ in range(n):
+            item = stack.pop(timeout=5)
+            with lock:
+                popped.append(item)
+
+    threads = [start(lambda base=base: [stack.push(base * n + i, timeout=5) for i in range(n)]) for base in range(workers)]
+    threads += [start(consumer) for _ in range(workers)]
+    for thread in threads:
+        thread.join(30)
+    assert sorted(popped) == list(range(n * workers))
+
+
+def test_async_stack_backpressure():
+    async def main():
+        stack = AsyncStack(capacity=2)
+        await stack.push(1)
+        await stack.push(2)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(stack.push(3), 0.01)
+        pusher = asyncio.ensure_future(stack.push(3))
+        await asyncio.sleep(0)
+        assert await stack.pop() == 2
+        await pusher
+        return [await stack.pop() for _ in range(2)]
+
+    assert asyncio.run(main()) == [3, 1]
@@ -0,0 +1,37 @@
+import random
+
+from codes.indexed_linked_list import IndexedLinkedList
+from codes.linked_list import LinkedList
+
+
+def test_duplicates_follow_list_order():
+    """重复值时 find / delete 作用于链表中的第一个节点，与 LinkedList 一致"""
+    lst = IndexedLinkedList()
+    lst.extend([1, 2])
+    lst.insert_at(0, 2)
+    assert lst.find(2) is lst.head
+    lst.delete(2)
+    assert list(lst) == [1, 2]
+
+
+def test_matches_linked_list():
+    rng = random.Random(0)
+    indexed, plain = IndexedLinkedList(), LinkedList()
+    for _ in range(2000):
+        op, value = rng.randrange(3), rng.randrange(5)
+        if op == 0:
+            i = rng.randrange(len(plain) + 1)
+            indexed.insert_at(i, value)
+            plain.insert_at(i, value)
+        elif op == 1:
+            indexed.delete(value)
+            plain.delete(value)
+        else:
+            assert (indexed.find(value) is None) == (plain.find(value) is None)
+        assert list(indexed) == list(plain)
+    # 前驱指针与尾指针保持一致
+    prev, node = None, indexed.head
+    while node is not None:
+        assert node.prev is prev
+        prev, node = node, node.next
+    assert indexed.tail is prev
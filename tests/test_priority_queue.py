@@ -0,0 +1,121 @@
+import heapq
+import random
+
+import pytest
+
+from codes.delay_queue import DelayQueue
+from codes.priority_queue import PriorityQueue
+
+
+@pytest.mark.parametrize("d", [2, 3, 4, 8])
+def test_push_pop_matches_heapq(d):
+    rng = random.Random(d)
+    queue, heap = PriorityQueue(d), []
+    for item in range(500):
+        priority = rng.random()
+        queue.push(item, priority)
+        heapq.heappush(heap, (priority, item))
+        if rng.random() < 0.3:
+            assert queue.pop() == heapq.heappop(heap)[1]
+    assert [queue.pop() for _ in range(len(queue))] == [item for _, item in sorted(heap)]
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+@pytest.mark.parametrize("d", [2, 4])
+def test_update_remove_decrease_key_match_model(d):
+    """随机混合各种操作，与 元素 -> 优先级 的字典模型对照"""
+    rng = random.Random(d)
+    queue, model = PriorityQueue(d), {}
+    # 优先级互不相同，出队顺序唯一
+    priorities = iter(rng.sample(range(100_000), 20_000))
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.35 or not model:
+            item = step
+            model[item] = next(priorities)
+            queue.push(item, model[item])
+        elif op < 0.5:
+            item = min(model, key=model.get)
+            assert queue.peek() == item and queue.peek_priority() == model[item]
+            assert queue.pop() == item
+            del model[item]
+        elif op < 0.65:
+            item = rng.choice(list(model))
+            model[item] = next(priorities)
+            queue.update(item, model[item])
+        elif op < 0.8:
+            item = rng.choice(list(model))
+            model[item] = model[item] - rng.randint(1, 1000) - 0.5
+            queue.decrease_key(item, model[item])
+        else:
+            item = rng.choice(list(model))
+            del model[item]
+            queue.remove(item)
+            assert item not in queue
+        assert len(queue) == len(model)
+    for item in model:
+        assert queue.priority(item) == model[item]
+    assert [queue.pop() for _ in range(len(queue))] == sorted(model, key=model.get)
+
+
+def test_invalid_operations():
+    queue = PriorityQueue()
+    queue.push("a", 1)
+    with pytest.raises(ValueError):
+        queue.push("a", 2)
+    with pytest.raises(ValueError):
+        queue.decrease_key("a", 5)
+    with pytest.raises(KeyError):
+        queue.remove("b")
+    with pytest.raises(ValueError):
+        PriorityQueue(1)
+
+
+class FakeClock:
+    """模拟时钟：sleep 只推进模拟时间，每次最多推进 max_step 秒，用于模拟休眠提前返回"""
+
+    def __init__(self, max_step: float = float("inf")) -> None:
+        self.now = 0.0
+        self.max_step = max_step
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += min(seconds, self.max_step)
+
+
+def test_delay_queue_with_fake_clock():
+    clock = FakeClock()
+    dq = DelayQueue(clock=clock, sleep=clock.sleep)
+    dq.push("b", 5)
+    dq.push("a", 2)
+    dq.push("c", 9)
+    with pytest.raises(IndexError):
+        dq.pop()
+    clock.now = 5
+    assert dq.pop_due() == ["a", "b"]
+    dq.reschedule("c", 1)
+    assert dq.next_deadline() == 6
+    assert dq.pop(block=True) == "c" and clock.now == 6
+    with pytest.raises(IndexError):
+        dq.pop(block=True)
+
+
+def test_blocking_pop_rechecks_deadline():
+    """休眠提前返回时继续等待，不会取出尚未到期的元素"""
+    clock = FakeClock(max_step=3)
+    dq = DelayQueue(clock=clock, sleep=clock.sleep)
+    dq.push("job", 8)
+    assert dq.pop(block=True) == "job"
+    assert clock.now == 8 and clock.sleeps == [8, 5, 2]
+
+    # 时钟回拨后，原本已到达的到期时刻又变成未来
+    clock = FakeClock()
+    dq = DelayQueue(clock=clock, sleep=clock.sleep)
+    dq.push("job", 3)
+    clock.now = -2
+    assert dq.pop(block=True) == "job" and clock.now == 3 and clock.sleeps == [5]
@@ -0,0 +1,75 @@
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+from queue import Empty, Full
+
+import pytest
+
+from codes.shared_ring_queue import SharedRingQueue
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def produce(ring: SharedRingQueue, n: int) -> None:
+    for i in range(n):
+        ring.push(i.to_bytes(8, "little"), timeout=10)
+
+
+def test_push_pop_timeout():
+    with SharedRingQueue(capacity=2, slot_size=16) as ring:
+        ring.push(b"a")
+        ring.push(b"b")
+        with pytest.raises(Full):
+            ring.push(b"c", timeout=0.01)
+        assert [ring.pop(), ring.pop()] == [b"a", b"b"]
+        with pytest.raises(Empty):
+            ring.pop(timeout=0.01)
+        with pytest.raises(ValueError):
+            ring.push(bytes(13))
+
+
+def test_read_keeps_record_on_error():
+    """with 语句块抛出异常时记录留在队首"""
+    with SharedRingQueue(capacity=4, slot_size=16) as ring:
+        ring.push(b"x")
+        with pytest.raises(RuntimeError):
+            with ring.read() as view:
+                assert bytes(view) == b"x"
+                raise RuntimeError
+        assert ring.size() == 1
+        assert ring.pop() == b"x"
+
+
+@pytest.mark.parametrize("method", mp.get_all_start_methods())
+def test_cross_process_order(method):
+    """容量很小时生产者频繁绕回，消费者读到的序号必须连续"""
+    n = 20000
+    with SharedRingQueue(capacity=2, slot_size=16) as ring:
+        producer = mp.get_context(method).Process(target=produce, args=(ring, n), daemon=True)
+        producer.start()
+        try:
+            assert [int.from_bytes(ring.pop(timeout=10), "little") for _ in range(n)] == list(range(n))
+        finally:
+            producer.join(10)
+            if producer.exitcode is None:
+                producer.kill()
+        assert producer.exitcode == 0
+
+
+def test_attach_from_independent_process():
+    """按名称挂载的独立进程退出后，共享内存仍然可用，创建者 close 不报错"""
+    ring = SharedRingQueue(capacity=4, slot_size=16)
+    ring.push(b"a")
+    ring.push(b"b")
+    code = (
+        "from codes.shared_ring_queue import SharedRingQueue\n"
+        f"ring = SharedRingQueue(name={ring.name!r})\n"
+        "print(ring.pop().decode())\n"
+        "ring.close()\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.stdout.strip() == "a"
+    assert "leaked" not in result.stderr and "Error" not in result.stderr
+    assert ring.pop() == b"b"
+    ring.close()
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from codes.sliding_window import SlidingWindow
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 16])
+def test_matches_recompute(size):
+    rng = random.Random(size)
+    window = SlidingWindow(size)
+    recent = []
+    for _ in range(size * 20):
+        x = rng.randrange(-50, 50)
+        old = window.push(x)
+        recent.append(x)
+        assert old == (recent.pop(0) if len(recent) > size else None)
+        assert window.to_list() == recent
+        assert (window.sum(), window.min(), window.max()) == (sum(recent), min(recent), max(recent))
+
+
+def test_typed_window_uses_stored_values():
+    window = SlidingWindow(2, typecode="f")
+    for x in [0.1, 0.2, 0.3]:
+        window.push(x)
+    assert window.to_list() == pytest.approx([0.2, 0.3])
+    assert window.min() == window.to_list()[0] and window.max() == window.to_list()[1]
+    assert window.sum() == pytest.approx(sum(window.to_list()))
+
+
+def test_empty_window():
+    window = SlidingWindow(3)
+    assert window.is_empty() and not window.is_full() and window.to_list() == []
+    for method in (window.min, window.max, window.mean):
+        with pytest.raises(IndexError):
+            method()
+    with pytest.raises(ValueError):
+        SlidingWindow(0)
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from codes.work_stealing import _MAX_HELP_DEPTH, WorkStealingPool
+
+
+def fib(pool: WorkStealingPool, n: int) -> int:
+    if n < 2:
+        return n
+    left = pool.fork(fib, pool, n - 1)
+    right = fib(pool, n - 2)
+    return pool.join(left) + right
+
+
+def test_fork_join():
+    with WorkStealingPool(workers=4, capacity=16) as pool:
+        assert pool.run(fib, pool, 18) == 2584
+        with pytest.raises(ZeroDivisionError):
+            pool.run(lambda: 1 / 0)
+
+
+def test_join_wakes_on_completion():
+    """外部线程 join 在任务完成时被唤醒，而不是轮询"""
+    with WorkStealingPool(workers=1) as pool:
+        task = pool.fork(time.sleep, 0.05)
+        start = time.monotonic()
+        pool.join(task)
+        assert time.monotonic() - start < 1
+
+
+def test_chain_on_single_worker():
+    """达到嵌套层数上限后，队尾正在等待的任务仍会被取回执行，单个工作线程也不会死锁"""
+
+    def chain(pool, n):
+        return 0 if n == 0 else pool.join(pool.fork(chain, pool, n - 1)) + 1
+
+    with WorkStealingPool(workers=1) as pool:
+        result = []
+        runner = threading.Thread(target=lambda: result.append(pool.run(chain, pool, _MAX_HELP_DEPTH * 3)), daemon=True)
+        runner.start()
+        runner.join(10)
+        assert result == [_MAX_HELP_DEPTH * 3]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fifo_join_beyond_help_depth(workers):
+    """先 join 较早 fork 的任务：达到嵌套层数上限时等待的任务不在队尾，也要能从队列中间取出执行"""
+
+    def leaf():
+        return 1
+
+    def rec(pool, depth):
+        if depth == 0:
+            return 1
+        first = pool.fork(rec, pool, depth - 1)
+        second = pool.fork(leaf)
+        return pool.join(first) + pool.join(second)
+
+    depth = _MAX_HELP_DEPTH * 3
+    with WorkStealingPool(workers=workers) as pool:
+        result = []
+        runner = threading.Thread(target=lambda: result.append(pool.run(rec, pool, depth)), daemon=True)
+        runner.start()
+        runner.join(10)
+        assert result == [depth + 1]
+
+
+def test_help_depth_limits_own_queue():
+    """join 等待期间执行自己队列中任务的嵌套层数同样受限"""
+    gate = threading.Event()
+    started = []
+
+    def blocker():
+        started.append("blocker")
+        gate.wait(10)
+
+    def waiter(task):
+        started.append("waiter")
+        return pool.join(task)
+
+    def root(blocked, n):
+        tasks = [pool.fork(waiter, blocked) for _ in range(n)]
+        return [pool.join(task) for task in tasks]
+
+    with WorkStealingPool(workers=2) as pool:
+        blocked = pool.fork(blocker)
+        while not started:
+            time.sleep(0.001)
+        runner = threading.Thread(target=lambda: pool.run(root, blocked, _MAX_HELP_DEPTH * 3), daemon=True)
+        runner.start()
+        time.sleep(0.2)
+        # 另一个工作线程阻塞在 blocker 中，全部 waiter 都在同一线程的调用栈上嵌套
+        assert len(started) - 1 <= _MAX_HELP_DEPTH
+        gate.set()
+        runner.join(10)
+        assert not runner.is_alive()
+        assert len(started) - 1 == _MAX_HELP_DEPTH * 3
+
+
+def test_shutdown_cancels_pending_tasks():
+    gate = threading.Event()
+    pool = WorkStealingPool(workers=1)
+    running = pool.fork(gate.wait, 10)
+    time.sleep(0.05)
+    pending = pool.fork(lambda: "never")
+    stopper = threading.Thread(target=pool.shutdown)
+    stopper.start()
+    time.sleep(0.05)
+    gate.set()
+    stopper.join(10)
+    assert pool.join(running) is True
+    assert pending.done
+    with pytest.raises(RuntimeError):
+        pool.join(pending)
+    with pytest.raises(RuntimeError):
+        pool.fork(lambda: None)